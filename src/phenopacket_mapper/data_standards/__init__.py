@@ -1,17 +1,21 @@
 """This submodule defines the data standards used in the project."""
 from .cardinality import Cardinality
 from .date import Date
-from .code_system import CodeSystem, SNOMED_CT, HPO, MONDO, OMIM, ORDO, LOINC
-from .code import Coding, CodeableConcept
+from .code_system import CodeSystem, SNOMED_CT, HPO, MONDO, OMIM, ORDO, LOINC, intern_code_system
+from .code import Coding, CodeableConcept, intern_coding
 from .data_model import DataModel, DataField, DataModelInstance, DataFieldValue, DataSet, DataSection, OrGroup
+from .data_model import LazyDataModelInstances, ColumnarDataModelInstances, ColumnarRow, Column
 from .value_set import ValueSet
+from .validation import validate_data_set, ValidationReport, ValidationIssue
 
 __all__ = [
     "Cardinality",
-    "Coding", "CodeableConcept",
+    "Coding", "CodeableConcept", "intern_coding",
     "DataModel", "DataField", "DataModelInstance", "DataFieldValue", "DataSet", "DataSection", "OrGroup",
-    "CodeSystem",
+    "LazyDataModelInstances", "ColumnarDataModelInstances", "ColumnarRow", "Column",
+    "CodeSystem", "intern_code_system",
     "SNOMED_CT", "HPO", "MONDO", "OMIM", "ORDO", "LOINC",
     "Date",
     "ValueSet",
+    "validate_data_set", "ValidationReport", "ValidationIssue",
 ]
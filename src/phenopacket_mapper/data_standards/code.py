@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import List, Union, Literal
+from typing import List, Union, Literal, Dict, Tuple
 
 from phenopacket_mapper.data_standards import CodeSystem, code_system
 
@@ -59,6 +59,37 @@ class Coding:
         return f"{self.system.namespace_prefix}:{self.code} ({self.display})"
 
 
+# Maximum number of codings kept by `intern_coding`, the pool is emptied when it is full
+MAX_INTERNED_CODINGS = 2 ** 16
+
+_coding_pool: Dict[Tuple[str, str], Coding] = dict()
+
+
+def intern_coding(system: Union[str, CodeSystem], code: str) -> Coding:
+    """Returns a shared `Coding` object for the system and code
+
+    Data often contains the same codes over and over again, e.g. a column of phenotypes. Instead of creating a new
+    `Coding` for every occurrence, this function returns the same instance for the same system and code. Codings are
+    immutable, so they can be shared safely.
+
+    E.g.:
+    >>> intern_coding(code_system.HPO, "0000790") is intern_coding(code_system.HPO, "0000790")
+    True
+
+    :param system: the code system, or its namespace prefix if it is unknown
+    :param code: the code
+    :return: a `Coding` without display or text for the system and code
+    """
+    prefix = system.namespace_prefix if isinstance(system, CodeSystem) else system
+    key = (prefix, code)
+    coding = _coding_pool.get(key)
+    if coding is None or not (coding.system is system or (isinstance(system, str) and coding.system == system)):
+        if len(_coding_pool) >= MAX_INTERNED_CODINGS:
+            _coding_pool.clear()
+        coding = _coding_pool[key] = Coding(system=system, code=code)
+    return coding
+
+
 @dataclass(frozen=True, slots=True, eq=True)
 class CodeableConcept:
     """Data class for CodeableConcept
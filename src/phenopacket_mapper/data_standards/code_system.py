@@ -1,5 +1,5 @@
 from dataclasses import dataclass, replace, field
-from typing import List
+from typing import Dict, Tuple, FrozenSet, Iterable, Union
 
 
 @dataclass(slots=True, frozen=True)
@@ -16,6 +16,7 @@ class CodeSystem:
     :ivar url: The URL of the CodeSystem
     :ivar iri_prefix: The IRI prefix of the CodeSystem
     :ivar version: The version of the CodeSystem
+    :ivar key: The canonical identity key of the CodeSystem, code systems are equal and hash alike if their keys are
     """
     name: str
     namespace_prefix: str
@@ -23,19 +24,31 @@ class CodeSystem:
     iri_prefix: str = None
     version: str = "0.0.0"
     """List typical alternative abbreviations or names for the resource, to better parse its usage (e.g. 'HPO' for the
-    Human Phenotype Ontology, even if its name space prefix is commonly 'HP')"""
-    synonyms: List[str] = field(default_factory=lambda: [])
+    Human Phenotype Ontology, even if its name space prefix is commonly 'HP'), stored as a frozenset"""
+    synonyms: Union[FrozenSet[str], Iterable[str]] = field(default_factory=frozenset)
+    key: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        if not isinstance(self.synonyms, frozenset):
+            object.__setattr__(self, 'synonyms', frozenset(self.synonyms))
+        object.__setattr__(self, 'key', self.namespace_prefix)
 
     def set_version(self, value) -> 'CodeSystem':
         return replace(self, version=value)
 
     def __eq__(self, other):
-        """Check if two CodeSystems are equal based on their name, namespace prefix, and version.
+        """Check if two CodeSystems are equal based on their identity key, i.e. their namespace prefix.
 
-        Right now this method ignores the version, this may be subject to change in the future."""
+        Right now this method ignores the version, this may be subject to change in the future. Synonyms are not
+        considered, to resolve a synonym to its code system use `CodingParser.get_code_system`."""
+        if self is other:
+            return True
         if not isinstance(other, CodeSystem):
             return False
-        return self.namespace_prefix == other.namespace_prefix or self.namespace_prefix in other.synonyms
+        return self.key == other.key
+
+    def __hash__(self):
+        return hash(self.key)
 
     def __str__(self):
         return f"CodeSystem(name={self.name}, name space prefix={self.namespace_prefix}, version={self.version})"
@@ -49,6 +62,36 @@ class CodeSystem:
             return self == item.system
 
 
+# Maximum number of code systems kept by `intern_code_system`, the pool is emptied when it is full
+MAX_INTERNED_CODE_SYSTEMS = 1024
+
+_code_system_pool: Dict[Tuple, CodeSystem] = dict()
+
+
+def intern_code_system(code_system: CodeSystem) -> CodeSystem:
+    """Returns the canonical instance of `code_system`
+
+    All code systems with the same name, namespace prefix, url, iri prefix, version and synonyms are mapped to the same
+    instance, so that codings referring to them can share it and be compared by identity.
+
+    E.g.:
+    >>> example = intern_code_system(CodeSystem(name="Example", namespace_prefix="EX"))
+    >>> example is intern_code_system(CodeSystem(name="Example", namespace_prefix="EX"))
+    True
+
+    :param code_system: the code system to intern
+    :return: the canonical instance equal to `code_system`
+    """
+    key = (code_system.name, code_system.namespace_prefix, code_system.url, code_system.iri_prefix,
+           code_system.version, code_system.synonyms)
+    interned = _code_system_pool.get(key)
+    if interned is None:
+        if len(_code_system_pool) >= MAX_INTERNED_CODE_SYSTEMS:
+            _code_system_pool.clear()
+        interned = _code_system_pool[key] = code_system
+    return interned
+
+
 NCBITaxon = CodeSystem(
     name='NCBI organismal classification', 
     namespace_prefix='NCBITaxon', 
@@ -8,18 +8,30 @@ The `DataFieldValue` class is used to define the value of a `DataField` in a `Da
 `DataModelInstance` class is used to define an instance of a `DataModel`, i.e. a record in a dataset.
 """
 
+import contextlib
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Union, List, Literal, Dict, Optional, Any, Callable, Tuple, Iterable
+from typing import Union, List, Literal, Dict, Optional, Any, Callable, Tuple, Iterable, Iterator, FrozenSet, \
+    ContextManager, TYPE_CHECKING
 import warnings
 
+import numpy as np
 import pandas as pd
 
 from phenopacket_mapper._api import DataNode
-from phenopacket_mapper.data_standards import CodeSystem, Cardinality
+from phenopacket_mapper.data_standards import CodeSystem, Cardinality, Coding
 from phenopacket_mapper.data_standards.date import Date
 from phenopacket_mapper.data_standards.value_set import ValueSet
-from phenopacket_mapper.preprocessing import preprocess, preprocess_method
+from phenopacket_mapper.preprocessing import preprocess_column, preprocess_columns
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+    import pyarrow
+    from phenopacket_mapper.data_standards.validation import ValidationReport
+    from phenopacket_mapper.utils.diagnostics import Diagnostics
+
+_MAX_INSTANCE_LAYOUTS = 1024
 
 
 @dataclass(slots=True, frozen=True)
@@ -102,6 +114,8 @@ class DataSection:
     fields: Tuple[Union[DataField, 'DataSection', 'OrGroup'], ...] = field(default_factory=tuple)
     required: bool = field(default=False)
     cardinality: Cardinality = field(default_factory=Cardinality)
+    _field_index: Dict[str, Union[DataField, 'DataSection', 'OrGroup']] = field(default_factory=dict, init=False,
+                                                                              repr=False, compare=False)
 
     def __post_init__(self):
         if not self.id:
@@ -111,6 +125,8 @@ class DataSection:
         if self.required:
             object.__setattr__(self, 'cardinality', Cardinality(min=1, max=self.cardinality.max))
 
+        object.__setattr__(self, '_field_index', _build_field_index(self.fields))
+
     def __str__(self):
         ret = "DataSection(\n"
         ret += f"\t\tid: {self.id},\n"
@@ -123,9 +139,8 @@ class DataSection:
         return ret
 
     def __getattr__(self, var_name: str) -> Union[DataField, 'OrGroup', 'DataSection']:
-        for f in self.fields:
-            if f.id == var_name:
-                return f
+        if var_name != '_field_index' and var_name in self._field_index:
+            return self._field_index[var_name]
         raise AttributeError(f"'DataSection' object has no attribute '{var_name}'")
 
 
@@ -148,6 +163,17 @@ class DataModel:
     fields: Tuple[Union[DataField, DataSection, 'OrGroup'], ...] = field()
     id: str = field(default=None)
     resources: Tuple[CodeSystem, ...] = field(default_factory=tuple)
+    _instance_layouts: Dict[Tuple[str, ...], Dict[str, int]] = field(default_factory=dict, init=False, repr=False,
+                                                                      compare=False)
+    _field_index: Dict[str, Union[DataField, DataSection, 'OrGroup']] = field(default_factory=dict, init=False,
+                                                                            repr=False, compare=False)
+    _path_index: Dict[str, Union[DataField, DataSection, 'OrGroup']] = field(default_factory=dict, init=False,
+                                                                           repr=False, compare=False)
+    _members_by_id: Dict[str, Tuple[Union[DataField, DataSection, 'OrGroup'], ...]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _required_field_ids: FrozenSet[str] = field(default=frozenset(), init=False, repr=False, compare=False)
+    _is_hierarchical: bool = field(default=False, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         if not self.id:
@@ -156,10 +182,18 @@ class DataModel:
         if len(self.fields) != len(set([f.id for f in self.fields])):
             raise ValueError("All fields in a DataModel must have unique identifiers")
 
+        object.__setattr__(self, '_field_index', _build_field_index(self.fields))
+        object.__setattr__(self, '_path_index', _build_path_index(self.fields))
+        members_by_id = dict()
+        for member in recursive_collect_all_members_data_model(self):
+            members_by_id[member.id] = members_by_id.get(member.id, tuple()) + (member,)
+        object.__setattr__(self, '_members_by_id', members_by_id)
+        object.__setattr__(self, '_required_field_ids', frozenset(f.id for f in self.fields if f.required))
+        object.__setattr__(self, '_is_hierarchical', self._compute_is_hierarchical())
+
     def __getattr__(self, var_name: str) -> Union[DataField, 'OrGroup', DataSection]:
-        for f in self.fields:
-            if f.id == var_name:
-                return f
+        if var_name != '_field_index' and var_name in self._field_index:
+            return self._field_index[var_name]
         raise AttributeError(f"'DataModel' object has no attribute '{var_name}'")
 
     def __str__(self):
@@ -176,8 +210,20 @@ class DataModel:
     def __iter__(self):
         return iter(recursive_collect_all_members_data_model(self))
 
+    def __contains__(self, item) -> bool:
+        """Checks if a `DataField`, `DataSection` or `OrGroup` is a member of the data model at any depth"""
+        return any(member == item for member in self._members_by_id.get(getattr(item, 'id', None), tuple()))
+
     @property
     def is_hierarchical(self) -> bool:
+        return self._is_hierarchical
+
+    @property
+    def required_field_ids(self) -> FrozenSet[str]:
+        """The ids of the top-level fields that are required, computed once per data model"""
+        return self._required_field_ids
+
+    def _compute_is_hierarchical(self) -> bool:
         def recursive_is_hierarchical(d: Union[DataField, DataSection, OrGroup]):
             if isinstance(d, DataField):
                 return False
@@ -195,21 +241,56 @@ class DataModel:
         :param default: The default value to return if the field is not found
         :return: The DataField object
         """
-        for f in self.fields:
-            if f.id == field_id:
-                return f
+        if field_id in self._field_index:
+            return self._field_index[field_id]
         if default or default is None:
             return default
         raise ValueError(f"Field with id {field_id} not found in DataModel")
 
+    def get_by_path(self, path: str, default: Optional = None) -> Optional[Union[DataField, DataSection, 'OrGroup']]:
+        """Returns a member of the data model at any depth by its dotted path
+
+        The path is made up of the ids of the members leading to it, e.g. `'section_id.field_id'`.
+
+        :param path: The dotted path of the member
+        :param default: The default value to return if no member is found
+        :return: The `DataField`, `DataSection` or `OrGroup` object
+        """
+        return self._path_index.get(path, default)
+
     def get_field_ids(self) -> List[str]:
         """Returns a list of the ids of the DataFields in the DataModel"""
         return [f.id for f in self.fields]
 
+    def get_instance_layout_index(self, ids: Tuple[str, ...]) -> Dict[str, int]:
+        """Returns an index from the id of a field to its position in the values of a `DataModelInstance`
+
+        Instances of a data model mostly share the same layout, i.e. the same fields in the same order. The index for a
+        layout is therefore only built once and shared by all instances with that layout. To bound the memory used,
+        at most `_MAX_INSTANCE_LAYOUTS` layouts are remembered.
+
+        :param ids: The ids of the values of an instance, in order
+        :return: dictionary from field id to position in the values
+        """
+        index = self._instance_layouts.get(ids)
+        if index is None:
+            index = dict()
+            for i, id_ in enumerate(ids):
+                index.setdefault(id_, i)
+            if len(self._instance_layouts) < _MAX_INSTANCE_LAYOUTS:
+                self._instance_layouts[ids] = index
+        return index
+
     def load_data(
             self,
             path: Union[str, Path],
             compliance: Literal['lenient', 'strict'] = 'lenient',
+            chunk_size: int = None,
+            lazy: bool = False,
+            schema_directed: bool = False,
+            validate: Literal['eager', 'deferred', 'off'] = 'eager',
+            diagnostics: 'Diagnostics' = None,
+            storage: Literal['rows', 'columnar'] = 'rows',
             **kwargs
     ) -> 'DataSet':
         """Loads data from a file using a DataModel definition
@@ -227,6 +308,14 @@ class DataModel:
 
         :param path: Path to the file containing the data
         :param compliance: Compliance level to use when loading the data.
+        :param chunk_size: If set, a csv file is streamed and processed `chunk_size` rows at a time.
+        :param lazy: If True, the `DataModelInstance` objects are only created while iterating over the `DataSet`.
+        :param schema_directed: If True, values are only parsed as the kinds of values allowed by the `ValueSet` of
+                                their field.
+        :param validate: When to validate the data, see `load_tabular_data_using_data_model`.
+        :param diagnostics: If given, problems found while parsing and validating the data are reported to it.
+        :param storage: Whether to store the data row by row or column by column, see
+                        `load_tabular_data_using_data_model`.
         :param kwargs: Dynamically passed parameters that match {id}_column for each item
         :return: A list of `DataModelInstance` objects
         """
@@ -247,7 +336,13 @@ class DataModel:
                 file=path,
                 data_model=self,
                 column_names=column_names,
-                compliance=compliance
+                compliance=compliance,
+                chunk_size=chunk_size,
+                lazy=lazy,
+                schema_directed=schema_directed,
+                validate=validate,
+                diagnostics=diagnostics,
+                storage=storage,
             )
 
 
@@ -265,17 +360,24 @@ class DataFieldValue:
     field: DataField
     value: Union[int, float, str, bool, Date, CodeSystem]
 
-    def validate(self) -> bool:
+    def validate(self, diagnostics: 'Diagnostics' = None) -> bool:
         """Validates the data model instance based on data model definition
 
         This method checks if the instance is valid based on the data model definition. It checks if all required fields
         are present, if the values are in the value set, etc.
 
+        :param diagnostics: If given, problems are reported to it instead of issuing warnings
         :return: True if the instance is valid, False otherwise
         """
         if self.field.required and self.value is None:  # no value
-            warnings.warn(f"Field {self.field.name} is required but has no value")
+            if diagnostics is None:
+                warnings.warn(f"Field {self.field.name} is required but has no value")
+            else:
+                diagnostics.report('missing_value', self.id, self.field.id)
             return False
+        elif self.value is not None and isinstance(self.field.specification, ValueSet):
+            if self.field.specification.allows(self.value):
+                return True
         elif self.value is not None and self.field.specification:
             if Any in self.field.specification:  # value set allows any
                 return True
@@ -293,8 +395,11 @@ class DataFieldValue:
                         if isinstance(self.value, Coding) and self.value.system == cs:
                             return True
 
-        warnings.warn(f"Value {self.value} of type {type(self.value)} is not in the value set of field "
-                      f"{self.field.name} (row {self.id})")
+        if diagnostics is None:
+            warnings.warn(f"Value {self.value} of type {type(self.value)} is not in the value set of field "
+                          f"{self.field.name} (row {self.id})")
+        else:
+            diagnostics.report('not_in_value_set', self.value, self.field.id)
         return False
 
 
@@ -309,10 +414,11 @@ class DataSectionInstance:
     section: DataSection = field()
     values: Tuple[Union[DataFieldValue, 'DataSectionInstance'], ...] = field()
 
-    def validate(self) -> bool:
+    def validate(self, diagnostics: 'Diagnostics' = None) -> bool:
         # TODO: implement this method
         tmp = self.id
-        warnings.warn("The DataSectionInstance validate method has not been implemented yet.")
+        if diagnostics is None:
+            warnings.warn("The DataSectionInstance validate method has not been implemented yet.")
         return True
 
 
@@ -328,36 +434,45 @@ class DataModelInstance:
     :ivar compliance: Compliance level to enforce when validating the instance. If 'lenient', the instance can have extra
                         fields that are not in the DataModel. If 'strict', the instance must have all fields in the
                         DataModel.
+    :ivar validate_on_init: If False, the instance is not validated when it is created, e.g. because the whole dataset
+                        is validated at once by `DataSet.validate` or the data is trusted.
     """
     id: Union[int, str]
     data_model: DataModel
     values: Tuple[Union[DataFieldValue, DataSectionInstance], ...]
     compliance: Literal['lenient', 'strict'] = 'lenient'
+    validate_on_init: bool = field(default=True, repr=False, compare=False)
+    _field_index: Dict[str, int] = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
-        self.validate()
+        if self.validate_on_init:
+            self.validate()
 
-    def validate(self) -> bool:
+    def validate(self, diagnostics: 'Diagnostics' = None) -> bool:
         """Validates the data model instance based on data model definition
 
         This method checks if the instance is valid based on the data model definition. It checks if all required fields
         are present, if the values are in the value set, etc.
 
+        :param diagnostics: If given, problems are reported to it instead of issuing warnings (in lenient compliance)
         :return: True if the instance is valid, False otherwise
         """
         error_msg = f"Instance values do not comply with their respective fields' valuesets. (row {self.id})"
         for v in self.values:
-            if not v.validate():
+            if not v.validate(diagnostics):
                 if self.compliance == 'strict':
                     raise ValueError(error_msg)
                 elif self.compliance == 'lenient':
-                    warnings.warn(error_msg)
+                    if diagnostics is None:
+                        warnings.warn(error_msg)
+                    else:
+                        diagnostics.report('invalid_instance', self.id)
                     return False
                 else:
                     raise ValueError(f"Compliance level {self.compliance} is not valid")
 
         if not self.data_model.is_hierarchical:
-            is_required = set(f.id for f in self.data_model.fields if f.required)
+            is_required = self.data_model.required_field_ids
             fields_present = set(v.field.id for v in self.values)
 
             if len(missing_fields := (is_required - fields_present)) > 0:
@@ -366,7 +481,11 @@ class DataModelInstance:
                 if self.compliance == 'strict':
                     raise ValueError(error_msg)
                 elif self.compliance == 'lenient':
-                    warnings.warn(error_msg)
+                    if diagnostics is None:
+                        warnings.warn(error_msg)
+                    else:
+                        for field_id in missing_fields:
+                            diagnostics.report('missing_required_field', self.id, field_id)
                     return False
                 else:
                     raise ValueError(f"Compliance level {self.compliance} is not valid")
@@ -377,11 +496,333 @@ class DataModelInstance:
     def __iter__(self):
         return iter(self.values)
 
+    def __getattr__(self, var_name: str) -> Union[DataFieldValue, DataSectionInstance]:
+        if var_name == '_field_index':  # not yet initialized
+            raise AttributeError(f"'DataModelInstance' object has no attribute '{var_name}'")
+
+        index = self._field_index
+        if index is None:
+            ids = tuple(v.field.id if isinstance(v, DataFieldValue) else v.section.id for v in self.values)
+            index = self.data_model.get_instance_layout_index(ids)
+            object.__setattr__(self, '_field_index', index)
+
+        try:
+            return self.values[index[var_name]]
+        except KeyError:
+            raise AttributeError(f"'DataModelInstance' object has no attribute '{var_name}'") from None
+
+
+class LazyDataModelInstances:
+    """This class defines a lazily evaluated collection of `DataModelInstance` objects
+
+    Instead of holding all instances in memory, the instances are created on demand while iterating. It can be used in
+    place of a list as `DataSet.data`, such that e.g. `PhenopacketMapper` only ever holds a batch of instances at a time.
+
+    `load` has to return a new iterator over all instances every time it is called, so the collection can be iterated
+    multiple times. The number of instances is counted by `count` (or by iterating over all instances, if `count` is
+    not given) the first time it is needed and is remembered afterward.
+
+    :param load: Callable returning a new iterator over the `DataModelInstance` objects
+    :param count: Optional callable returning the number of instances without creating them
+    """
+    __slots__ = ('_load', '_count', '_height')
+
+    def __init__(
+            self,
+            load: Callable[[], Iterator[DataModelInstance]],
+            count: Callable[[], int] = None,
+    ):
+        self._load = load
+        self._count = count
+        self._height: Optional[int] = None
+
+    def __iter__(self) -> Iterator[DataModelInstance]:
+        return iter(self._load())
+
+    def __len__(self) -> int:
+        if self._height is None:
+            if self._count is not None:
+                self._height = self._count()
+            else:
+                self._height = sum(1 for _ in self)
+        return self._height
+
+    def __bool__(self) -> bool:
+        return next(iter(self), None) is not None
+
+
+class Column:
+    """A column of values of one `DataField`, stored as an array with a validity mask
+
+    Columns of `int`, `float` or `bool` values are stored as a numpy array of that type. Columns of other hashable
+    values, e.g. `Coding` or `str`, are dictionary-encoded: every distinct value is stored once, the array holds the
+    integer code of the value in each row. Other values, e.g. `Date`, are kept in an array of objects.
+
+    E.g.:
+    >>> column = Column.from_values(["a", None, "b", "a"])
+    >>> column.dictionary, column.data.tolist(), column.mask.tolist()
+    (['a', 'b'], [0, 0, 1, 0], [True, False, True, True])
+    >>> column.to_list()
+    ['a', None, 'b', 'a']
+
+    :ivar mask: Whether a value is present in each row
+    :ivar data: The values, or their codes if `dictionary` is not None, for each row
+    :ivar dictionary: The distinct values of a dictionary-encoded column, otherwise None
+    """
+    __slots__ = ('mask', 'data', 'dictionary')
+
+    _NUMERIC_DTYPES = {int: np.int64, float: np.float64, bool: np.bool_}
+
+    def __init__(self, mask: np.ndarray, data: np.ndarray, dictionary: Optional[List[Any]] = None):
+        self.mask = mask
+        self.data = data
+        self.dictionary = dictionary
+
+    @staticmethod
+    def from_values(values: Iterable[Any]) -> 'Column':
+        """Creates a column from the values of each row, `None` for missing values
+
+        :param values: the values of the column
+        :return: the column
+        """
+        values = list(values)
+        mask = np.fromiter((v is not None for v in values), dtype=np.bool_, count=len(values))
+        types = set(type(v) for v in values if v is not None)
+
+        if len(types) == 1 and (value_type := types.pop()) in Column._NUMERIC_DTYPES:
+            fill = value_type()
+            try:
+                data = np.array([fill if v is None else v for v in values], dtype=Column._NUMERIC_DTYPES[value_type])
+            except OverflowError:
+                pass
+            else:
+                return Column(mask, data)
+
+        codes: Dict[Tuple[type, Any], int] = dict()
+        dictionary: List[Any] = list()
+        data = np.zeros(len(values), dtype=np.int32)
+        try:
+            for i, v in enumerate(values):
+                if v is None:
+                    continue
+                key = (type(v), v)  # 1, 1.0 and True are equal, but must not share a code
+                code = codes.get(key)
+                if code is None:
+                    code = codes[key] = len(dictionary)
+                    dictionary.append(v)
+                data[i] = code
+        except TypeError:  # unhashable values
+            data = np.empty(len(values), dtype=object)
+            data[:] = values
+            return Column(mask, data)
+        return Column(mask, data, dictionary)
+
+    def __len__(self) -> int:
+        return len(self.mask)
+
+    def get(self, i: int) -> Any:
+        """Returns the value in row `i`, `None` if it is missing"""
+        if not self.mask[i]:
+            return None
+        if self.dictionary is not None:
+            return self.dictionary[self.data[i]]
+        value = self.data[i]
+        return value.item() if isinstance(value, np.generic) else value
+
+    def to_array(self) -> np.ndarray:
+        """Returns the values of all rows as an array, like `pd.DataFrame` would store `to_list`
+
+        Columns without missing values that are not dictionary-encoded are returned as a read-only view of `data`,
+        without copying. Missing values are `NaN` in `int` and `float` columns and `None` in all other columns. Columns
+        mixing values of several types, e.g. `int` and `float`, are converted like `pd.Series` converts their values.
+        """
+        all_present = bool(self.mask.all())
+        if self.dictionary is not None and len(set(map(type, self.dictionary))) > 1:
+            return pd.Series(self.to_list()).to_numpy()
+        elif self.dictionary is not None:
+            dictionary = np.empty(len(self.dictionary), dtype=object)
+            for i, v in enumerate(self.dictionary):
+                dictionary[i] = v
+            values = dictionary[self.data]
+        elif all_present:
+            values = self.data.view()
+            values.flags.writeable = False
+            return values
+        elif self.data.dtype == object:
+            values = self.data.copy()
+        elif self.data.dtype == np.bool_:
+            values = self.data.astype(object)
+        else:
+            return np.where(self.mask, self.data, np.nan)
+        if not all_present:
+            values[~self.mask] = None
+        return values
+
+    def to_list(self) -> List[Any]:
+        """Returns the values of all rows, `None` for missing values"""
+        if self.dictionary is not None:
+            dictionary = self.dictionary
+            values = [dictionary[code] for code in self.data.tolist()]
+        else:
+            values = self.data.tolist()
+        return [v if present else None for v, present in zip(values, self.mask.tolist())]
+
+
+class ColumnarDataModelInstances:
+    """This class defines a collection of `DataModelInstance` objects stored column by column
+
+    Instead of one `DataModelInstance` holding a `DataFieldValue` per cell, the values of each field are stored in a
+    `Column`. Iterating yields a lightweight `ColumnarRow` view per row, which can be used like a `DataModelInstance`,
+    e.g. by `PhenopacketMapper`. It can be used in place of a list as `DataSet.data`.
+
+    Only data models that are not hierarchical can be stored column by column.
+
+    :param data_model: The `DataModel` object that defines the data model for the instances
+    :param columns: The column of each field, by field id. Fields without a column have no values.
+    :param ids: The ids of the instances, defaults to 'row:{i}' for the i-th instance
+    :param compliance: Compliance level of the instances
+    """
+    __slots__ = ('data_model', 'columns', 'ids', 'compliance', '_height', '_fields')
+
+    def __init__(
+            self,
+            data_model: 'DataModel',
+            columns: Dict[str, Column],
+            ids: List[Union[int, str]] = None,
+            compliance: Literal['lenient', 'strict'] = 'lenient',
+    ):
+        if data_model.is_hierarchical:
+            raise ValueError("Only data models that are not hierarchical can be stored column by column")
+        heights = set(len(c) for c in columns.values())
+        if ids is not None:
+            heights.add(len(ids))
+        if len(heights) > 1:
+            raise ValueError(f"All columns must have the same length, got {sorted(heights)}")
+
+        self.data_model = data_model
+        self.columns = columns
+        self.ids = ids
+        self.compliance = compliance
+        self._height = heights.pop() if heights else 0
+        self._fields = tuple((f, columns[f.id]) for f in data_model.fields if f.id in columns)
+
+    @staticmethod
+    def from_instances(
+            data_model: 'DataModel',
+            instances: Iterable[DataModelInstance],
+            compliance: Literal['lenient', 'strict'] = 'lenient',
+    ) -> 'ColumnarDataModelInstances':
+        """Stores `DataModelInstance` objects column by column
+
+        :param data_model: The `DataModel` object that defines the data model for the instances
+        :param instances: The instances to store
+        :param compliance: Compliance level of the instances
+        """
+        values: Dict[str, List[Any]] = {f.id: [] for f in data_model.fields}
+        ids = []
+        for i, instance in enumerate(instances):
+            ids.append(instance.id)
+            for v in instance.values:
+                column = values[v.field.id]
+                column.extend([None] * (i - len(column)))
+                column.append(v.value)
+        for column in values.values():
+            column.extend([None] * (len(ids) - len(column)))
+        return ColumnarDataModelInstances(
+            data_model=data_model,
+            columns={field_id: Column.from_values(column) for field_id, column in values.items()},
+            ids=ids,
+            compliance=compliance,
+        )
+
+    def get_id(self, i: int) -> Union[int, str]:
+        """Returns the id of the `i`-th instance"""
+        return self.ids[i] if self.ids is not None else "row:" + str(i)
+
+    def to_data_frame(self) -> pd.DataFrame:
+        """Returns the values as a `pd.DataFrame` with a column per field of the data model, see `Column.to_array`"""
+        column_names = [f.id for f in self.data_model.fields]
+        empty = np.full(self._height, None, dtype=object)
+        return pd.DataFrame(
+            {c: self.columns[c].to_array() if c in self.columns else empty for c in column_names},
+            columns=column_names,
+            copy=False,
+        )
+
+    def __iter__(self) -> Iterator['ColumnarRow']:
+        return (ColumnarRow(self, i) for i in range(self._height))
+
+    def __getitem__(self, i: int) -> 'ColumnarRow':
+        if not -self._height <= i < self._height:
+            raise IndexError(f"Index {i} out of range for {self._height} instances")
+        return ColumnarRow(self, i % self._height)
+
+    def __len__(self) -> int:
+        return self._height
+
+    def __bool__(self) -> bool:
+        return self._height > 0
+
+
+class ColumnarRow:
+    """View on a row of `ColumnarDataModelInstances`, can be used like a `DataModelInstance`
+
+    Values are only looked up in the columns when they are accessed. Pickling a row turns it into a
+    `DataModelInstance`, so only the row and not all columns are pickled.
+    """
+    __slots__ = ('_instances', '_index')
+
+    def __init__(self, instances: ColumnarDataModelInstances, index: int):
+        self._instances = instances
+        self._index = index
+
+    @property
+    def id(self) -> Union[int, str]:
+        return self._instances.get_id(self._index)
+
+    @property
+    def data_model(self) -> 'DataModel':
+        return self._instances.data_model
+
+    @property
+    def compliance(self) -> Literal['lenient', 'strict']:
+        return self._instances.compliance
+
+    @property
+    def values(self) -> Tuple[DataFieldValue, ...]:
+        i = self._index
+        return tuple(
+            DataFieldValue(id=i, field=f, value=column.get(i))
+            for f, column in self._instances._fields
+            if column.mask[i]
+        )
+
+    def to_instance(self) -> DataModelInstance:
+        """Returns the row as a `DataModelInstance`"""
+        return DataModelInstance(
+            id=self.id, data_model=self.data_model, values=self.values, compliance=self.compliance,
+            validate_on_init=False,
+        )
+
+    def validate(self, diagnostics: 'Diagnostics' = None) -> bool:
+        """Validates the row like `DataModelInstance.validate`"""
+        return self.to_instance().validate(diagnostics)
+
+    def __iter__(self):
+        return iter(self.values)
+
     def __getattr__(self, var_name: str) -> DataFieldValue:
-        fields = [v.field.id for v in self.values]
-        if var_name in fields:
-            return self.values[fields.index(var_name)]
-        raise AttributeError(f"'DataModelInstance' object has no attribute '{var_name}'")
+        column = self._instances.columns.get(var_name)
+        if column is None or not column.mask[self._index]:
+            raise AttributeError(f"'ColumnarRow' object has no attribute '{var_name}'")
+        return DataFieldValue(id=self._index, field=self._instances.data_model.get_field(var_name),
+                              value=column.get(self._index))
+
+    def __reduce__(self):
+        return DataModelInstance, (self.id, self.data_model, self.values, self.compliance, False)
+
+    def __repr__(self):
+        return f"ColumnarRow(id={self.id!r}, values={self.values!r})"
 
 
 @dataclass(slots=True, frozen=True)
@@ -391,11 +832,34 @@ class DataSet:
     This class is used to define a dataset as defined by a `DataModel`. It is a collection of `DataModelInstance`
     objects.
 
+    The instances can either be held in memory as a list, be created on demand by passing a
+    `LazyDataModelInstances` object as `data` or be stored column by column in a `ColumnarDataModelInstances` object.
+
     :ivar data_model: The `DataModel` object that defines the data model for this dataset
     :ivar data: A list of `DataModelInstance` objects, each adhering to the `DataField` definition in the `DataModel`
     """
     data_model: 'DataModel' = field()
-    data: List[DataModelInstance] = field()
+    data: Union[List[DataModelInstance], LazyDataModelInstances, ColumnarDataModelInstances] = field()
+    _data_frame_cache: Dict[str, Any] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    @property
+    def is_lazy(self) -> bool:
+        """Whether the instances of this dataset are created on demand"""
+        return isinstance(self.data, LazyDataModelInstances)
+
+    @property
+    def is_columnar(self) -> bool:
+        """Whether the instances of this dataset are stored column by column"""
+        return isinstance(self.data, ColumnarDataModelInstances)
+
+    def to_columnar(self) -> 'DataSet':
+        """Returns a dataset with the same instances stored column by column, see `ColumnarDataModelInstances`"""
+        if self.is_columnar:
+            return self
+        return DataSet(
+            data_model=self.data_model,
+            data=ColumnarDataModelInstances.from_instances(self.data_model, self.data),
+        )
 
     @property
     def height(self):
@@ -407,87 +871,443 @@ class DataSet:
 
     @property
     def data_frame(self) -> pd.DataFrame:
-        column_names = [f.id for f in self.data_model.fields]
-        data_dict = {c: list() for c in column_names}
-        for instance in self.data:
-            for f in self.data_model.fields:
-                field_id = f.id
-                value: Any = None
-                try:
-                    dfv: DataFieldValue = getattr(instance, field_id)
-                    value = dfv.value
-                except AttributeError:
-                    pass
-                finally:
-                    data_dict[field_id].append(value)
-        return pd.DataFrame(data_dict, columns=column_names)
+        """The values of the dataset as a `pd.DataFrame` with a column per field of the data model
+
+        The data frame is built column by column once and cached. Changes to `data` are not detected: after modifying
+        the instances in place, e.g. appending an instance or replacing a column of a columnar dataset, call
+        `invalidate_data_frame`. Every access returns a copy, so modifying the returned data frame neither affects the
+        cached one nor the values of the dataset. With copy-on-write, which is always enabled from pandas 3 on, this is
+        a shallow copy whose columns are only copied when they are modified. Otherwise, it is a deep copy; use `head`
+        to look at the first rows without copying the whole data frame.
+        """
+        return self._cached_data_frame().copy(deep=not _copy_on_write())
+
+    def _cached_data_frame(self) -> pd.DataFrame:
+        """Returns the cached data frame, building it first if necessary, must not be modified"""
+        cache = self._data_frame_cache
+        if 'frame' not in cache:
+            cache['frame'] = self._build_data_frame()
+        return cache['frame']
+
+    def invalidate_data_frame(self) -> None:
+        """Discards the cached `data_frame`, it is rebuilt the next time it is accessed"""
+        self._data_frame_cache.clear()
+
+    def _build_data_frame(self) -> pd.DataFrame:
+        if self.is_columnar:
+            return self.data.to_data_frame()
+        return pd.DataFrame(self._collect_values(), columns=[f.id for f in self.data_model.fields])
+
+    def _collect_values(self) -> Dict[str, List[Any]]:
+        """Gathers the values of the instances column by column, `None` where an instance has no value for a field"""
+        values = {f.id: list() for f in self.data_model.fields}
+        for i, instance in enumerate(self.data):
+            for column in values.values():
+                column.append(None)
+            for v in reversed(instance.values):  # the first value of a field wins, like in `getattr(instance, id)`
+                column = values.get(v.field.id if isinstance(v, DataFieldValue) else v.section.id)
+                if column is not None:
+                    column[i] = v.value if isinstance(v, DataFieldValue) else None
+        return values
+
+    def to_arrow(self) -> 'pyarrow.Table':
+        """Exports the values of the dataset as a `pyarrow.Table` with a column per field of the data model
+
+        Requires the optional dependency `pyarrow`. Codings are exported as their CURIE, e.g. 'HP:0000790', other values
+        that Arrow cannot represent, e.g. `Date`, as their string representation. The columns of a columnar dataset are
+        exported without decoding: dictionary-encoded columns become Arrow dictionary arrays, numeric columns are
+        passed on with their validity mask.
+
+        :return: the values of the dataset as an Arrow table
+        """
+        try:
+            import pyarrow as pa
+        except ImportError as e:
+            raise ImportError("Exporting a DataSet to Arrow requires pyarrow, install it with `pip install pyarrow`") \
+                from e
+
+        if self.is_columnar:
+            columns = self.data.columns
+        else:
+            columns = {field_id: Column.from_values(values) for field_id, values in self._collect_values().items()}
+
+        arrays = dict()
+        for f in self.data_model.fields:
+            column = columns.get(f.id)
+            if column is None:
+                arrays[f.id] = pa.nulls(len(self.data))
+            elif column.dictionary is not None:
+                arrays[f.id] = pa.DictionaryArray.from_arrays(
+                    pa.array(column.data, mask=~column.mask),
+                    _to_arrow_array(pa, column.dictionary),
+                )
+            elif column.data.dtype == object:
+                arrays[f.id] = _to_arrow_array(pa, column.to_list())
+            else:
+                arrays[f.id] = pa.array(column.data, mask=~column.mask)
+        return pa.table(arrays)
 
     def __iter__(self):
         return iter(self.data)
 
+    def validate(self) -> 'ValidationReport':
+        """Validates all instances of the dataset column-wise and returns a report of the problems found
+
+        See `validate_data_set`, no warnings are issued.
+
+        :return: the report of all problems found
+        """
+        from phenopacket_mapper.data_standards.validation import validate_data_set
+        return validate_data_set(self)
+
     def preprocess(
             self,
             fields: Union[str, DataField, List[Union[str, DataField]]],
             mapping: Union[Dict, Callable],
+            vectorized: bool = False,
+            workers: int = None,
+            target: Union[str, DataField] = None,
+            batch_size: int = None,
+            layout: Literal['columns', 'rows'] = 'columns',
             **kwargs
-    ):
+    ) -> 'DataSet':
         """Preprocesses a field in the dataset
 
-        Preprocessing happens in place, i.e. the values in the dataset are modified directly.
+        Preprocessing does not modify the dataset, a new dataset with the preprocessed values is returned. The values
+        of the field are preprocessed column-wise by `preprocess_column`: a mapping dictionary is looked up once per
+        distinct value, a method can preprocess all values at once (`vectorized=True`) or be run by a pool of `workers`
+        processes. The values of a lazy dataset are preprocessed in batches of `PREPROCESS_BATCH_SIZE` instances while
+        iterating over the returned dataset, all batches of an iteration share one pool of worker processes.
+
+        E.g.:
+        ```python
+        dataset = dataset.preprocess("sex", {"m": "male", "f": "female"})
+        dataset = dataset.preprocess("weight", lambda weights: np.asarray(weights) / 1000, vectorized=True)
+        ```
 
-        If fields is a list of fields, the mapping must be a method that can handle a list of values being passed as
-        value to it. E.g.:
+        If `target` is given, the preprocessed values are written to the `target` field instead, which is added to the
+        data model of the returned dataset if it is a `DataField` not yet part of it. If fields is a list of fields, a
+        `target` is required and the mapping must be a method computing the value of the target field from the values
+        of the fields, see `preprocess_columns`. It is called per instance with the values of the fields, or, if
+        `vectorized` is True, with batches of `batch_size` instances. Instances missing a value of one of the fields
+        get no value for the target field. E.g.:
         ```python
-        def preprocess_method(values, method, **kwargs):
-        field1, field2 = values
-        # do something with values
-        return "preprocessed_values" + kwargs["arg1"] + kwargs["arg2"]
+        def age_at_onset(birth_dates, onset_dates):
+            return [(onset - birth).days // 365 for birth, onset in zip(birth_dates, onset_dates)]
 
-        dataset.preprocess(["field_1", "field_2"], preprocess_method, arg1="value1", arg2="value2")
+        age_at_onset_field = DataField(name="Age at onset", specification=int)
+        dataset = dataset.preprocess(["date_of_birth", "date_of_onset"], age_at_onset, target=age_at_onset_field,
+                                     vectorized=True)
         ```
 
         :param fields: Data fields to be preprocessed, will be passed onto `mapping`
         :param mapping: A dictionary or method to use for preprocessing
+        :param vectorized: Whether the method preprocesses a list of values at once, see `preprocess_column`
+        :param workers: Number of worker processes to apply a method that is not vectorized with, only used if a single
+                        field is preprocessed
+        :param target: The field to write the preprocessed values to, defaults to the preprocessed field
+        :param batch_size: The number of instances passed to a vectorized method preprocessing multiple fields at once
+        :param layout: Whether a vectorized method preprocessing multiple fields receives one list of values per field
+                        ('columns') or a list of tuples, one per instance ('rows')
+        :param kwargs: Additional arguments for the method
+        :return: A new dataset with the preprocessed values
         """
         if not isinstance(fields, list):
             fields = [fields]
 
         field_ids = list()
         for f in fields:
-            if isinstance(field, str):
+            if isinstance(f, str):
                 field_ids.append(f)
             elif isinstance(f, DataField):
                 field_ids.append(f.id)
             else:
-                raise ValueError(f"Field {field} is not of type str or DataField")
+                raise ValueError(f"Field {f} is not of type str or DataField")
 
         if len(field_ids) == 0:
             raise ValueError("No fields to preprocess")
-        elif len(field_ids) == 1:
-            field_id = field_ids[0]
-            for instance in self.data:
-                for v in instance.values:
-                    if v.field.id == field_id:
-                        v.value = preprocess(v.value, mapping, **kwargs)
+        elif len(field_ids) == 1 and target is None:
+            return self._preprocess_field(field_ids[0], mapping, vectorized, workers, kwargs)
+        elif target is None:
+            raise ValueError("A target field is required to preprocess multiple fields")
+        elif len(field_ids) > 1 and isinstance(mapping, dict):
+            raise ValueError("Mapping dictionary cannot be used to preprocess multiple fields")
+
+        if len(field_ids) == 1:
+            def preprocess_values(columns, executor=None):
+                return preprocess_column(columns[0], mapping, vectorized, workers, executor, **kwargs)
+            pool_workers = _pool_workers(mapping, vectorized, workers)
         else:
-            if isinstance(mapping, dict):
-                raise ValueError("Mapping dictionary cannot be used to preprocess multiple fields")
-            elif isinstance(mapping, Callable):
-                values = dict()
-                for instance in self.data:
-                    for field_id in field_ids:
-                        for v in instance.values:
-                            if v.field.id == field_id:
-                                values[field_id] = v.value
-
-                preprocess_method(values, mapping, **kwargs)
+            def preprocess_values(columns, executor=None):
+                return preprocess_columns(columns, mapping, vectorized, batch_size, layout, **kwargs)
+            pool_workers = None
+        return self._derive_field(field_ids, target, preprocess_values, pool_workers)
+
+    def preprocess_fields(self, methods: Dict[Union[str, DataField], Callable[[List[Any]], List[Any]]]) -> 'DataSet':
+        """Preprocesses several fields in the dataset in a single pass
+
+        Every method preprocesses all values of its field at once, like a vectorized method passed to `preprocess`: it
+        is called with the list of values of the field, `None` for instances of a columnar dataset without a value, and
+        has to return a sequence of as many preprocessed values. In contrast to calling `preprocess` once per field, the
+        instances are only gathered and rebuilt once. The values of a lazy dataset are preprocessed in batches of
+        `PREPROCESS_BATCH_SIZE` instances while iterating over the returned dataset.
+
+        E.g.:
+        ```python
+        dataset = dataset.preprocess_fields({
+            "sex": lambda values: [v.strip().lower() if v is not None else None for v in values],
+            "weight": lambda weights: [w / 1000 if w is not None else None for w in weights],
+        })
+        ```
+
+        :param methods: The method to preprocess the values of a field with, per field
+        :return: A new dataset with the preprocessed values
+        """
+        field_methods = dict()
+        for f, method in methods.items():
+            if isinstance(f, DataField):
+                field_methods[f.id] = method
+            elif isinstance(f, str):
+                field_methods[f] = method
+            else:
+                raise ValueError(f"Field {f} is not of type str or DataField")
+        return self._preprocess_fields(field_methods)
+
+    def _preprocess_field(
+            self,
+            field_id: str,
+            mapping: Union[Dict, Callable],
+            vectorized: bool,
+            workers: Optional[int],
+            kwargs: Dict[str, Any],
+    ) -> 'DataSet':
+        """Helper method for `preprocess`, preprocesses the values of a single field"""
+        def preprocess_values(values, executor=None):
+            return preprocess_column(values, mapping, vectorized, workers, executor, **kwargs)
+
+        return self._preprocess_fields({field_id: preprocess_values}, _pool_workers(mapping, vectorized, workers))
+
+    def _preprocess_fields(
+            self,
+            methods: Dict[str, Callable[..., List[Any]]],
+            workers: Optional[int] = None,
+    ) -> 'DataSet':
+        """Helper method for `preprocess` and `preprocess_fields`, preprocesses the values of the fields in one pass
+
+        If `workers` is given, a process pool of that many workers is started once per pass over the dataset and passed
+        to every call of the methods as `executor`, instead of every call starting its own pool.
+        """
+        if self.is_columnar:
+            columns = self.data.columns
+            with _process_pool(workers) as executor:
+                preprocessed = {
+                    field_id: Column.from_values(_call_column_method(method, columns[field_id].to_list(), executor))
+                    for field_id, method in methods.items()
+                    if field_id in columns
+                }
+            if not preprocessed:
+                return self
+            data = ColumnarDataModelInstances(
+                data_model=self.data_model,
+                columns={**columns, **preprocessed},
+                ids=self.data.ids,
+                compliance=self.data.compliance,
+            )
+        elif self.is_lazy:
+            from phenopacket_mapper.utils.parallel import batched
+
+            instances = self.data
+
+            def load():
+                with _process_pool(workers) as executor:
+                    for batch in batched(instances, PREPROCESS_BATCH_SIZE):
+                        yield from _preprocess_instances(batch, methods, executor)
+
+            data = LazyDataModelInstances(load=load, count=lambda: len(instances))
+        else:
+            with _process_pool(workers) as executor:
+                data = _preprocess_instances(self.data, methods, executor)
+        return DataSet(data_model=self.data_model, data=data)
 
     def head(self, n: int = 5):
-        if self.data_frame is not None:
-            return self.data_frame.head(n)
+        data_frame = self._cached_data_frame()
+        if data_frame is not None:
+            return data_frame.head(n).copy()
         else:
             warnings.warn("No data frame object available for this dataset")
 
+    def _derive_field(
+            self,
+            field_ids: List[str],
+            target: Union[str, DataField],
+            preprocess_values: Callable[..., List[Any]],
+            workers: Optional[int] = None,
+    ) -> 'DataSet':
+        """Helper method for `preprocess`, writes the values computed from the values of the fields to `target`
+
+        If `workers` is given, a process pool is shared by all batches of a pass, see `_preprocess_fields`.
+        """
+        if isinstance(target, str):
+            target_field = self.data_model.get_field(target)
+            if not isinstance(target_field, DataField):
+                raise ValueError(f"Target field {target} is not part of the data model, pass a DataField to add it")
+            target = target_field
+        data_model = self.data_model
+        if target.id not in data_model.get_field_ids():
+            data_model = DataModel(name=data_model.name, fields=data_model.fields + (target,), id=data_model.id,
+                                   resources=data_model.resources)
+
+        if self.is_columnar:
+            columns = self.data.columns
+            with _process_pool(workers) as executor:
+                preprocessed = preprocess_values([
+                    columns[field_id].to_list() if field_id in columns else [None] * len(self.data)
+                    for field_id in field_ids
+                ], executor=executor)
+            data = ColumnarDataModelInstances(
+                data_model=data_model,
+                columns={**columns, target.id: Column.from_values(preprocessed)},
+                ids=self.data.ids,
+                compliance=self.data.compliance,
+            )
+        elif self.is_lazy:
+            from phenopacket_mapper.utils.parallel import batched
+
+            instances = self.data
+
+            def load():
+                with _process_pool(workers) as executor:
+                    for batch in batched(instances, PREPROCESS_BATCH_SIZE):
+                        yield from _derive_instances(batch, data_model, field_ids, target, preprocess_values, executor)
+
+            data = LazyDataModelInstances(load=load, count=lambda: len(instances))
+        else:
+            with _process_pool(workers) as executor:
+                data = _derive_instances(self.data, data_model, field_ids, target, preprocess_values, executor)
+        return DataSet(data_model=data_model, data=data)
+
+
+def _copy_on_write() -> bool:
+    """Whether pandas copies data frames lazily, i.e. a shallow copy is not affected by changes to the original"""
+    if int(pd.__version__.split('.')[0]) >= 3:
+        return True
+    return bool(pd.get_option('mode.copy_on_write'))
+
+
+# Number of instances of a lazy dataset preprocessed at once by `DataSet.preprocess`
+PREPROCESS_BATCH_SIZE = 10_000
+
+
+def _preprocess_instances(
+        instances: Iterable[DataModelInstance],
+        methods: Dict[str, Callable[..., List[Any]]],
+        executor: 'Executor' = None,
+) -> List[DataModelInstance]:
+    """Preprocesses the values of each field of the instances as one column, returning new instances where they changed"""
+    instances = list(instances)
+    positions: Dict[str, List[Tuple[int, int]]] = {field_id: list() for field_id in methods}
+    for i, instance in enumerate(instances):
+        for j, v in enumerate(instance.values):
+            if isinstance(v, DataFieldValue) and v.field.id in positions:
+                positions[v.field.id].append((i, j))
+
+    new_values: Dict[int, List[Union[DataFieldValue, DataSectionInstance]]] = dict()
+    for field_id, method in methods.items():
+        field_positions = positions[field_id]
+        if not field_positions:
+            continue
+        preprocessed = _call_column_method(
+            method, [instances[i].values[j].value for i, j in field_positions], executor
+        )
+        for (i, j), value in zip(field_positions, preprocessed):
+            values = new_values.setdefault(i, list(instances[i].values))
+            values[j] = DataFieldValue(id=values[j].id, field=values[j].field, value=value)
+    for i, values in new_values.items():
+        instance = instances[i]
+        instances[i] = DataModelInstance(
+            id=instance.id, data_model=instance.data_model, values=tuple(values), compliance=instance.compliance,
+            validate_on_init=False,
+        )
+    return instances
+
+
+def _pool_workers(mapping: Union[Dict, Callable], vectorized: bool, workers: Optional[int]) -> Optional[int]:
+    """Returns the number of workers of the process pool `preprocess_column` needs for a mapping, `None` if none"""
+    if isinstance(mapping, Callable) and not vectorized and workers is not None and workers > 1:
+        return workers
+    return None
+
+
+def _process_pool(workers: Optional[int]) -> ContextManager[Optional['Executor']]:
+    """Starts a process pool of `workers` workers, if `workers` is given"""
+    if workers is None:
+        return contextlib.nullcontext()
+    from concurrent.futures import ProcessPoolExecutor
+    return ProcessPoolExecutor(max_workers=workers)
+
+
+def _call_column_method(
+        method: Callable[..., List[Any]],
+        values: List[Any],
+        executor: 'Executor' = None,
+) -> List[Any]:
+    """Calls a method preprocessing a column of values, checking that it returns one value per value"""
+    preprocessed = method(values) if executor is None else method(values, executor=executor)
+    preprocessed = preprocessed.tolist() if hasattr(preprocessed, 'tolist') else list(preprocessed)
+    if len(preprocessed) != len(values):
+        raise ValueError(f"Method returned {len(preprocessed)} values for {len(values)} values")
+    return preprocessed
+
+
+def _derive_instances(
+        instances: Iterable[DataModelInstance],
+        data_model: DataModel,
+        field_ids: List[str],
+        target: DataField,
+        preprocess_values: Callable[..., List[Any]],
+        executor: 'Executor' = None,
+) -> List[DataModelInstance]:
+    """Computes the values of `target` from the values of the fields of the instances, returning new instances"""
+    instances = list(instances)
+    columns = [[None] * len(instances) for _ in field_ids]
+    positions = {field_id: k for k, field_id in enumerate(field_ids)}
+    for i, instance in enumerate(instances):
+        for v in reversed(instance.values):  # the first value of a field wins, like in `getattr(instance, id)`
+            k = positions.get(v.field.id) if isinstance(v, DataFieldValue) else None
+            if k is not None:
+                columns[k][i] = v.value
+    preprocessed = preprocess_values(columns, executor=executor)
+
+    derived_instances = []
+    for instance, value in zip(instances, preprocessed):
+        values = tuple(v for v in instance.values if not (isinstance(v, DataFieldValue) and v.field.id == target.id))
+        if value is not None:
+            row_id = next((v.id for v in instance.values if isinstance(v, DataFieldValue)), instance.id)
+            values += (DataFieldValue(id=row_id, field=target, value=value),)
+        derived_instances.append(DataModelInstance(
+            id=instance.id, data_model=data_model, values=values, compliance=instance.compliance,
+            validate_on_init=False,
+        ))
+    return derived_instances
+
+
+def _to_arrow_value(value: Any) -> Any:
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    elif isinstance(value, Coding):
+        prefix = value.system.namespace_prefix if isinstance(value.system, CodeSystem) else value.system
+        return f"{prefix}:{value.code}"
+    return str(value)
+
+
+def _to_arrow_array(pa, values: List[Any]) -> 'pyarrow.Array':
+    """Converts values to an Arrow array, falling back to strings if they do not share an Arrow type"""
+    values = [_to_arrow_value(v) for v in values]
+    try:
+        return pa.array(values)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return pa.array([v if v is None else str(v) for v in values])
+
 
 @dataclass(slots=True, frozen=True)
 class OrGroup(DataNode):
@@ -497,6 +1317,8 @@ class OrGroup(DataNode):
     description: str = field(default='')
     required: bool = field(default=False)
     cardinality: Cardinality = field(default=Cardinality.ZERO_TO_N)
+    _field_index: Dict[str, Union[DataField, DataSection, 'OrGroup']] = field(default_factory=dict, init=False,
+                                                                            repr=False, compare=False)
 
     def __post_init__(self):
         if not self.id:
@@ -506,6 +1328,8 @@ class OrGroup(DataNode):
         if self.required:
             object.__setattr__(self, 'cardinality', Cardinality(min=1, max=self.cardinality.max))
 
+        object.__setattr__(self, '_field_index', _build_field_index(self.fields))
+
     def __str__(self):
         ret = "OrGroup(\n"
         ret += f"\t\tid: {self.id},\n"
@@ -518,12 +1342,36 @@ class OrGroup(DataNode):
         return ret
 
     def __getattr__(self, var_name: str) -> Union[DataField, DataSection, 'OrGroup']:
-        for f in self.fields:
-            if f.id == var_name:
-                return f
+        if var_name != '_field_index' and var_name in self._field_index:
+            return self._field_index[var_name]
         raise AttributeError(f"'OrGroup' object has no attribute '{var_name}'")
 
 
+def _build_field_index(
+        fields: Iterable[Union[DataField, DataSection, OrGroup]]
+) -> Dict[str, Union[DataField, DataSection, OrGroup]]:
+    """Builds an index from id to field, if ids are duplicated the first field wins"""
+    index = dict()
+    for f in fields:
+        index.setdefault(f.id, f)
+    return index
+
+
+def _build_path_index(
+        fields: Iterable[Union[DataField, DataSection, OrGroup]],
+        prefix: str = '',
+) -> Dict[str, Union[DataField, DataSection, OrGroup]]:
+    """Builds an index from dotted path (e.g. `'section_id.field_id'`) to field, recursing into sections and or groups"""
+    index = dict()
+    for f in fields:
+        path = prefix + f.id
+        index.setdefault(path, f)
+        if isinstance(f, (DataSection, OrGroup)):
+            for sub_path, sub_field in _build_path_index(f.fields, prefix=path + '.').items():
+                index.setdefault(sub_path, sub_field)
+    return index
+
+
 def recursive_collect_all_members_data_model(
         data_model: Union[DataModel, DataSection, OrGroup, DataField]
 ) -> Iterable[Union[DataSection, OrGroup, DataField]]:
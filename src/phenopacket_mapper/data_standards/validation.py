@@ -0,0 +1,150 @@
+"""Batch validation of a `DataSet` against its `DataModel`"""
+import warnings
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import List, Literal, Dict, Tuple, Union, Any, Iterable, Callable
+
+from phenopacket_mapper.data_standards.data_model import DataSet, DataField, DataFieldValue, DataSectionInstance, \
+    DataModelInstance
+from phenopacket_mapper.data_standards.value_set import ValueSet
+
+ValidationReason = Literal['missing_value', 'not_in_value_set', 'missing_required_field']
+
+
+@dataclass(slots=True, frozen=True)
+class ValidationIssue:
+    """A single problem found when validating a `DataSet`
+
+    :ivar row_id: The id of the `DataModelInstance` the problem was found in
+    :ivar field_id: The id of the `DataField` concerned
+    :ivar reason: What is wrong, one of 'missing_value', 'not_in_value_set' or 'missing_required_field'
+    :ivar value: The offending value, `None` if the value is missing
+    """
+    row_id: Union[int, str]
+    field_id: str
+    reason: ValidationReason
+    value: Any = None
+
+
+@dataclass(slots=True)
+class ValidationReport:
+    """Result of validating a `DataSet` with `validate_data_set`
+
+    :ivar n_rows: The number of instances validated
+    :ivar n_values: The number of values validated
+    :ivar issues: All problems found, grouped by field in the order of the data model
+    """
+    n_rows: int = 0
+    n_values: int = 0
+    issues: List[ValidationIssue] = field(default_factory=list)
+
+    @property
+    def is_valid(self) -> bool:
+        """True if no problems were found"""
+        return len(self.issues) == 0
+
+    @property
+    def counts(self) -> Dict[Tuple[str, ValidationReason], int]:
+        """Number of problems per field id and reason"""
+        return dict(Counter((issue.field_id, issue.reason) for issue in self.issues))
+
+    @property
+    def invalid_row_ids(self) -> List[Union[int, str]]:
+        """Ids of all instances with at least one problem, in order of their first problem"""
+        return list(dict.fromkeys(issue.row_id for issue in self.issues))
+
+    def row_ids(self, field_id: str = None, reason: ValidationReason = None) -> List[Union[int, str]]:
+        """Returns the ids of the instances with problems, optionally restricted to a field and reason
+
+        :param field_id: only consider problems with this field
+        :param reason: only consider problems for this reason
+        :return: List of the instance ids, without duplicates
+        """
+        return list(dict.fromkeys(
+            issue.row_id for issue in self.issues
+            if (field_id is None or issue.field_id == field_id) and (reason is None or issue.reason == reason)
+        ))
+
+    def __str__(self):
+        lines = [f"ValidationReport(n_rows={self.n_rows}, n_values={self.n_values}, n_issues={len(self.issues)})"]
+        for (field_id, reason), count in self.counts.items():
+            lines.append(f"  {field_id}: {count} x {reason}")
+        return "\n".join(lines)
+
+
+def validate_data_set(data_set: DataSet) -> ValidationReport:
+    """Validates all instances of a `DataSet` against its `DataModel` and reports the problems found
+
+    Applies the same rules as `DataModelInstance.validate`, but instead of checking every value of every instance and
+    warning about each problem, the values are gathered per field and each distinct value of a field is only checked
+    once against the index of its `ValueSet`. No warnings are issued, all problems are collected in the returned
+    `ValidationReport`.
+
+    As in `DataModelInstance.validate`, required fields are only checked for data models that are not hierarchical,
+    and the values inside a `DataSectionInstance` are not checked.
+
+    :param data_set: the dataset to validate
+    :return: the report of all problems found
+    """
+    data_model = data_set.data_model
+    check_required = not data_model.is_hierarchical
+    required_ids = frozenset(f.id for f in data_model.fields if f.required) if check_required else frozenset()
+
+    report = ValidationReport()
+    columns: Dict[str, Tuple[DataField, List[Tuple[Union[int, str], Any]]]] = dict()
+    missing_required: List[Tuple[Union[int, str], str]] = list()
+
+    for instance in data_set:
+        report.n_rows += 1
+        present = set()
+        for v in _iter_field_values(instance.values):
+            report.n_values += 1
+            present.add(v.field.id)
+            columns.setdefault(v.field.id, (v.field, []))[1].append((instance.id, v.value))
+        if check_required:
+            missing_required.extend((instance.id, field_id) for field_id in required_ids - present)
+
+    for data_field, column in columns.values():
+        allows = _get_allows(data_field)
+        allowed: Dict[Tuple[type, Any], bool] = dict()
+        for row_id, value in column:
+            if value is None:
+                report.issues.append(ValidationIssue(row_id, data_field.id, 'missing_value'))
+                continue
+            try:
+                key = (type(value), value)
+                is_allowed = allowed.get(key)
+                if is_allowed is None:
+                    is_allowed = allowed[key] = allows(value)
+            except TypeError:  # unhashable value
+                is_allowed = allows(value)
+            if not is_allowed:
+                report.issues.append(ValidationIssue(row_id, data_field.id, 'not_in_value_set', value))
+
+    report.issues.extend(
+        ValidationIssue(row_id, field_id, 'missing_required_field') for row_id, field_id in missing_required
+    )
+    return report
+
+
+def _iter_field_values(
+        values: Iterable[Union[DataFieldValue, DataSectionInstance, DataModelInstance]]
+) -> Iterable[DataFieldValue]:
+    for v in values:
+        if isinstance(v, DataFieldValue):
+            yield v
+        elif isinstance(v, DataModelInstance):
+            yield from _iter_field_values(v.values)
+        # the values of a DataSectionInstance are skipped, as DataSectionInstance.validate does not check them yet
+
+
+def _get_allows(data_field: DataField) -> Callable[[Any], bool]:
+    """Returns a function checking whether a value is allowed by the specification of `data_field`"""
+    specification = data_field.specification
+    if not specification:
+        return lambda value: False
+    if not isinstance(specification, ValueSet):
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            specification = ValueSet(elements=tuple(specification))
+    return specification.allows
@@ -1,6 +1,6 @@
 import warnings
 from dataclasses import dataclass, field
-from typing import List, Union, Literal, Tuple
+from typing import List, Union, Literal, Tuple, FrozenSet, Any
 
 from phenopacket_mapper.data_standards import Coding, CodeableConcept, CodeSystem, Date
 
@@ -34,16 +34,57 @@ class ValueSet:
     name: str = field(default="")
     description: str = field(default="")
     _resources: Tuple[CodeSystem, ...] = field(default_factory=tuple, repr=False)
+    _literals: FrozenSet = field(default=frozenset(), init=False, repr=False, compare=False)
+    _bool_literals: FrozenSet[bool] = field(default=frozenset(), init=False, repr=False, compare=False)
+    _unhashable: Tuple = field(default=(), init=False, repr=False, compare=False)
+    _types: FrozenSet[type] = field(default=frozenset(), init=False, repr=False, compare=False)
+    _code_system_keys: FrozenSet[str] = field(default=frozenset(), init=False, repr=False, compare=False)
+    _allows_any: bool = field(default=False, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         if isinstance(self.elements, list):
             object.__setattr__(self, 'elements', tuple(self.elements))
+        self._build_index()
 
         if Coding in self.elements or CodeableConcept in self.elements:
             warnings.warn("The ValueSet contains Coding or CodeableConcept. It is recommended to limit the dataset to"
                           "the CodeSystems that are used in the DataField. This will improve the interoperability of"
                           "the data. E.g., try adding the SNOMED-CT CodeSystem to the ValueSet.")
 
+    def _build_index(self):
+        """Indexes the elements, so that membership tests and `allows` do not have to scan them"""
+        literals, unhashable, types, code_system_keys = set(), [], set(), set()
+        for e in self.elements:
+            if e is Any:
+                object.__setattr__(self, '_allows_any', True)
+                continue
+            if isinstance(e, type):
+                types.add(e)
+            elif isinstance(e, CodeSystem):
+                code_system_keys.add(e.key)
+            try:
+                literals.add(e)
+            except TypeError:
+                unhashable.append(e)
+        object.__setattr__(self, '_literals', frozenset(literals))
+        object.__setattr__(self, '_bool_literals', frozenset(e for e in literals if isinstance(e, bool)))
+        object.__setattr__(self, '_unhashable', tuple(unhashable))
+        object.__setattr__(self, '_types', frozenset(types))
+        object.__setattr__(self, '_code_system_keys', frozenset(code_system_keys))
+
+    def allows(self, value) -> bool:
+        """Checks if a value is allowed by the value set
+
+        A value is allowed if the value set allows `Any` value, if it is one of the elements, if its type is one of the
+        elements or if it is a `Coding` from one of the `CodeSystem` elements.
+
+        :param value: the value to check
+        :return: True if the value is allowed, False otherwise
+        """
+        if self._allows_any or value in self or type(value) in self._types:
+            return True
+        return isinstance(value, Coding) and getattr(value.system, 'key', None) in self._code_system_keys
+
     def extend(self, new_name: str, value_set: 'ValueSet', new_description: str = '') -> 'ValueSet':
         return ValueSet(name=new_name,
                         elements=tuple(set(self.elements + value_set.elements)),
@@ -95,23 +136,27 @@ class ValueSet:
     def __contains__(self, item):
         from phenopacket_mapper.data_standards import DataFieldValue
         if isinstance(item, bool):
-            for element in self.elements:
-                if isinstance(element, bool) and element == item:
-                    return True
-        elif type(item) in [Coding, CodeableConcept, CodeSystem, str, int, float, Date, type]:
-            for element in self.elements:
-                if element == item:
-                    return True
+            return item in self._bool_literals
+        elif type(item) in _MEMBER_TYPES:
+            return self._is_element(item)
         elif isinstance(item, DataFieldValue):
-            for element in self.elements:
-                if element == item.value:
-                    return True
+            return self._is_element(item.value)
         return False
 
+    def _is_element(self, item) -> bool:
+        try:
+            if item in self._literals:
+                return True
+        except TypeError:  # unhashable item, compare with all elements
+            return any(element == item for element in self.elements)
+        return any(element == item for element in self._unhashable)
+
     def __iter__(self):
         yield from self.elements
 
 
+_MEMBER_TYPES = frozenset((Coding, CodeableConcept, CodeSystem, str, int, float, Date, type))
+
 TRUE_FALSE_VALUE_SET = ValueSet(name="TrueFalseValueSet",
                                 elements=(True, False),
                                 description="A value set for True and False")
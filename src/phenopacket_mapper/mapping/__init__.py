@@ -1,10 +1,10 @@
 """This module facilitates the mapping from a local data model to the phenopacket schema"""
 
-from .phenopacket_building_block import PhenopacketBuildingBlock, map_single
+from .phenopacket_building_block import PhenopacketBuildingBlock, map_single, compile_single, compile_plan, execute_plan
 from .mapper import PhenopacketMapper
 
 __all__ = [
-    'map_single',
+    'map_single', 'compile_single', 'compile_plan', 'execute_plan',
     'PhenopacketBuildingBlock',
     'PhenopacketMapper',
 
@@ -1,9 +1,11 @@
-from typing import List, Union, Dict
+from typing import List, Union, Dict, Iterator, Optional
 
 from phenopackets import Phenopacket
 
-from phenopacket_mapper.data_standards.data_model import DataModel, DataSet, DataField
-from phenopacket_mapper.mapping import PhenopacketBuildingBlock, map_single
+from phenopacket_mapper.data_standards.data_model import DataModel, DataSet, DataField, DataModelInstance
+from phenopacket_mapper.mapping import PhenopacketBuildingBlock, compile_plan, execute_plan
+from phenopacket_mapper.mapping.phenopacket_building_block import MappingPlan
+from phenopacket_mapper.utils.parallel import batched, ordered_parallel_map
 
 
 class PhenopacketMapper:
@@ -30,6 +32,28 @@ class PhenopacketMapper:
         for e in self.elements.values():
             self.check_data_fields_in_model(e)
 
+        self.compile()
+
+    def compile(self) -> MappingPlan:
+        """Compiles the elements of the mapping to a flat plan that is then run for every instance
+
+        This is called on construction. If `elements` are changed afterward, call this method again.
+
+        :return: the compiled mapping plan
+        """
+        self._plan = compile_plan(self.elements)
+        return self._plan
+
+    def __getstate__(self):
+        # the compiled plan consists of closures, which cannot be pickled, it is recompiled after unpickling
+        state = self.__dict__.copy()
+        del state['_plan']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.compile()
+
     # TODO: implement check_fields_adheres_to_phenopacket_allowed_values
 
     def check_data_fields_in_model(self, element):
@@ -53,21 +77,64 @@ class PhenopacketMapper:
         :param data: List of DataModelInstances created from the data using the DataModel
         :return: List of Phenopackets
         """
-        phenopackets_list = []
+        return list(self.map_iter(data))
+
+    def map_iter(self, data: DataSet) -> Iterator[Phenopacket]:
+        """Map data from the DataModel to Phenopackets one instance at a time
+
+        Works like `map`, but yields every Phenopacket as soon as it is created instead of collecting all of them in a
+        list. Together with a lazy `DataSet` and `phenopacket_mapper.utils.io.write_iter`, only a single instance and
+        Phenopacket have to be held in memory at a time.
+
+        :param data: List of DataModelInstances created from the data using the DataModel
+        :return: Iterator of Phenopackets
+        """
         for instance in data:
-            kwargs = {}
-            for key, e in self.elements.items():
-                map_single(key, e, instance, kwargs)
-            # TODO: Add the resources to the phenopacket
-            try:
-                phenopackets_list.append(
-                    Phenopacket(
-                        **kwargs
-                    )
-                )
-            except TypeError as e:
-                raise TypeError(f"Error in mapping: {e}")
-            except Exception as e:
-                raise e
+            yield self._map_instance(instance)
 
+    def map_parallel(self, data: DataSet, workers: int = None, chunk_size: int = 1000) -> List[Phenopacket]:
+        """Map data from the DataModel to Phenopackets using multiple processes
+
+        The instances in `data` are split into chunks of `chunk_size` instances, which are mapped in a pool of `workers`
+        processes. The mapping definition is sent to every worker process only once. The Phenopackets are returned in
+        the same order as the instances in `data`, i.e. the result is the same as the result of `map`.
+
+        :param data: List of DataModelInstances created from the data using the DataModel
+        :param workers: Number of worker processes, defaults to the number of CPUs
+        :param chunk_size: Number of instances sent to a worker process at a time
+        :return: List of Phenopackets
+        """
+        phenopackets_list = []
+        for phenopackets_chunk in ordered_parallel_map(
+                _map_chunk,
+                batched(data, chunk_size),
+                workers=workers,
+                initializer=_init_worker,
+                initargs=(self,),
+        ):
+            phenopackets_list.extend(phenopackets_chunk)
         return phenopackets_list
+
+    def _map_instance(self, instance: DataModelInstance) -> Phenopacket:
+        kwargs = execute_plan(self._plan, instance)
+        # TODO: Add the resources to the phenopacket
+        try:
+            return Phenopacket(
+                **kwargs
+            )
+        except TypeError as e:
+            raise TypeError(f"Error in mapping: {e}")
+        except Exception as e:
+            raise e
+
+
+_worker_mapper: Optional[PhenopacketMapper] = None
+
+
+def _init_worker(mapper: PhenopacketMapper):
+    global _worker_mapper
+    _worker_mapper = mapper
+
+
+def _map_chunk(instances: List[DataModelInstance]) -> List[Phenopacket]:
+    return [_worker_mapper._map_instance(instance) for instance in instances]
@@ -1,9 +1,17 @@
-from typing import Union, Dict
+from functools import lru_cache
+from typing import Union, Dict, Callable, Any, List, Tuple, Optional
 
 from phenopackets.schema.v2.core.base_pb2 import OntologyClass
 from google.protobuf.timestamp_pb2 import Timestamp
 
-from phenopacket_mapper.data_standards import DataModelInstance, DataField, DataFieldValue, Coding
+from phenopacket_mapper.data_standards import DataModelInstance, DataField, DataFieldValue, Coding, Date
+
+# A compiled mapping plan: pairs of a keyword argument and a function computing its value from an instance
+MappingPlan = List[Tuple[str, Callable[[DataModelInstance], Any]]]
+
+_MISSING = object()
+
+ONTOLOGY_CLASS_CACHE_SIZE = 2 ** 16
 
 
 class PhenopacketBuildingBlock:
@@ -43,6 +51,22 @@ class PhenopacketBuildingBlock:
 
         return self.phenopacket_element(**kwargs)
 
+    def compile(self) -> Callable[[DataModelInstance], Any]:
+        """Compiles the mapping specified in fields to a function creating the phenopacket element from an instance
+
+        The tree of elements is only walked once, the returned function does the same as `map`, without having to
+        dispatch on the type of each element again for every instance.
+
+        :return: function creating the phenopacket element from a `DataModelInstance`
+        """
+        plan = compile_plan(self.elements)
+        phenopacket_element = self.phenopacket_element
+
+        def build(instance: DataModelInstance):
+            return phenopacket_element(**execute_plan(plan, instance))
+
+        return build
+
 
 def map_single(key, e, instance: DataModelInstance, kwargs):
     if isinstance(e, DataField):
@@ -50,14 +74,13 @@ def map_single(key, e, instance: DataModelInstance, kwargs):
         try:
             value: DataFieldValue = getattr(instance, data_field.id).value
 
-            from phenopacket_mapper.data_standards import Date
             if isinstance(value, Date):
                 date = value
                 timestamp = date.protobuf_timestamp()
                 assert isinstance(timestamp, Timestamp)
                 kwargs[key] = timestamp
             elif isinstance(value, Coding):
-                kwargs[key] = OntologyClass(id=str(value), label=value.display)
+                kwargs[key] = ontology_class(value)
             else:
                 kwargs[key] = value
         except AttributeError:
@@ -67,3 +90,81 @@ def map_single(key, e, instance: DataModelInstance, kwargs):
     elif isinstance(e, PhenopacketBuildingBlock):
         phenopacket_element = e
         kwargs[key] = phenopacket_element.map(instance)
+
+
+def compile_plan(elements: Dict[str, Union[PhenopacketBuildingBlock, DataField, List[PhenopacketBuildingBlock]]]) \
+        -> MappingPlan:
+    """Compiles the elements of a mapping to a `MappingPlan`, which can be run for an instance using `execute_plan`
+
+    :param elements: the elements of a `PhenopacketBuildingBlock` or `PhenopacketMapper`
+    :return: the compiled mapping plan
+    """
+    plan = []
+    for key, e in elements.items():
+        getter = compile_single(e)
+        if getter is not None:
+            plan.append((key, getter))
+    return plan
+
+
+def execute_plan(plan: MappingPlan, instance: DataModelInstance) -> Dict[str, Any]:
+    """Runs a compiled `MappingPlan` for an instance
+
+    :param plan: the compiled mapping plan
+    :param instance: the `DataModelInstance` to map
+    :return: the keyword arguments for the constructor of the phenopacket element
+    """
+    kwargs = {}
+    for key, getter in plan:
+        value = getter(instance)
+        if value is not _MISSING:
+            kwargs[key] = value
+    return kwargs
+
+
+def compile_single(e) -> Optional[Callable[[DataModelInstance], Any]]:
+    """Compiled equivalent of `map_single`, returns a function computing the value of an element from an instance
+
+    :param e: a `DataField`, a `PhenopacketBuildingBlock` or a list of `PhenopacketBuildingBlock`
+    :return: the function or `None` if the element is not mapped
+    """
+    if isinstance(e, DataField):
+        field_id = e.id
+
+        def get_value(instance: DataModelInstance):
+            try:
+                return _convert_value(getattr(instance, field_id).value)
+            except AttributeError:
+                return _MISSING
+
+        return get_value
+    elif isinstance(e, list):
+        builders = [v.compile() for v in e]
+        return lambda instance: [build(instance) for build in builders]
+    elif isinstance(e, PhenopacketBuildingBlock):
+        return e.compile()
+    return None
+
+
+def _convert_value(value):
+    if isinstance(value, Date):
+        return value.protobuf_timestamp()
+    elif isinstance(value, Coding):
+        return ontology_class(value)
+    return value
+
+
+def ontology_class(coding: Coding) -> OntologyClass:
+    """Returns the `OntologyClass` for a `Coding`, the same codings share the same message
+
+    The message must not be modified, phenopacket elements constructed from it hold a copy.
+
+    :param coding: the coding to convert
+    :return: the `OntologyClass` message for the coding
+    """
+    return _ontology_class(str(coding), coding.display)
+
+
+@lru_cache(maxsize=ONTOLOGY_CLASS_CACHE_SIZE)
+def _ontology_class(id_: str, label: str) -> OntologyClass:
+    return OntologyClass(id=id_, label=label)
@@ -3,5 +3,11 @@
 from .preprocess_dict import preprocess_dict
 from .preprocess_method import preprocess_method
 from .preprocess import preprocess
+from .preprocess_column import preprocess_column
+from .preprocess_columns import preprocess_columns
+from .pipeline import PreprocessingPipeline, PreprocessingStage, Recode, Apply, RegexNormalize, ConvertUnit
 
-__all__ = ["preprocess_dict", "preprocess_method", "preprocess"]
+__all__ = [
+    "preprocess_dict", "preprocess_method", "preprocess", "preprocess_column", "preprocess_columns",
+    "PreprocessingPipeline", "PreprocessingStage", "Recode", "Apply", "RegexNormalize", "ConvertUnit",
+]
@@ -0,0 +1,286 @@
+import abc
+import functools
+import re
+import warnings
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Pattern, Tuple, Union, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from phenopacket_mapper.data_standards import DataField, DataSet
+    from phenopacket_mapper.utils.diagnostics import Diagnostics
+
+
+class PreprocessingStage(abc.ABC):
+    """Base class of the stages of a `PreprocessingPipeline`
+
+    A stage transforms a single value. Calling a stage returns the transformed value and whether the stage could be
+    applied to the value. Values the stage could not be applied to are passed on unchanged and reported as `kind`.
+
+    :cvar kind: The kind of problem reported for values the stage could not be applied to
+    """
+    __slots__ = ()
+    kind: str = 'preprocessing_failed'
+
+    @property
+    def deterministic(self) -> bool:
+        """Whether the stage always transforms a value the same way, so it only has to be applied once per value"""
+        return True
+
+    @abc.abstractmethod
+    def __call__(self, value: Any) -> Tuple[Any, bool]:
+        """Transforms a value, returning the transformed value and whether the stage could be applied to it"""
+
+
+@dataclass(slots=True, frozen=True)
+class Recode(PreprocessingStage):
+    """Replaces values using a mapping dictionary, like `preprocess_dict`
+
+    :ivar mapping: A dictionary containing the mapping rules, values not in it are kept and reported
+    """
+    mapping: Dict = field()
+    kind = 'not_in_mapping'
+
+    def __call__(self, value: Any) -> Tuple[Any, bool]:
+        try:
+            return self.mapping[value], True
+        except (KeyError, TypeError):
+            return value, False
+
+
+@dataclass(slots=True, frozen=True)
+class Apply(PreprocessingStage):
+    """Applies a method to the values, like `preprocess_method`
+
+    If the method raises an exception, the original value is kept and reported.
+
+    :ivar method: The method to use for preprocessing, called as `method(value, **kwargs)`
+    :ivar kwargs: Additional arguments for the method
+    :ivar is_deterministic: Whether the method always returns the same result for the same value. If not, it is called
+                            for every value instead of once per distinct value.
+    """
+    method: Callable = field()
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+    is_deterministic: bool = field(default=True)
+    kind = 'method_failed'
+
+    @property
+    def deterministic(self) -> bool:
+        return self.is_deterministic
+
+    def __call__(self, value: Any) -> Tuple[Any, bool]:
+        try:
+            return self.method(value, **self.kwargs), True
+        except Exception:
+            return value, False
+
+
+@dataclass(slots=True, frozen=True)
+class RegexNormalize(PreprocessingStage):
+    """Replaces all matches of a regular expression in string values, e.g. to normalise spelling or whitespace
+
+    Strings that do not match the pattern are already normalised and kept as they are. Values that are not strings
+    are kept and reported.
+
+    :ivar pattern: The regular expression
+    :ivar replacement: The replacement for every match, see `re.sub`
+    """
+    pattern: Union[str, Pattern] = field()
+    replacement: str = field(default='')
+    kind = 'not_a_string'
+
+    def __post_init__(self):
+        if isinstance(self.pattern, str):
+            object.__setattr__(self, 'pattern', re.compile(self.pattern))
+
+    def __call__(self, value: Any) -> Tuple[Any, bool]:
+        if not isinstance(value, str):
+            return value, False
+        return self.pattern.sub(self.replacement, value), True
+
+
+@dataclass(slots=True, frozen=True)
+class ConvertUnit(PreprocessingStage):
+    """Converts numeric values to another unit as `value * factor + offset`
+
+    Strings are converted to numbers first, stripping `unit` from their end if given, e.g. '72.5 kg'. Values that cannot
+    be converted to a number are kept and reported.
+
+    :ivar factor: The factor to multiply the values with
+    :ivar offset: The offset to add to the values after multiplying
+    :ivar unit: The unit the values may be suffixed with, e.g. 'kg'
+    """
+    factor: float = field()
+    offset: float = field(default=0.0)
+    unit: Optional[str] = field(default=None)
+    kind = 'not_a_number'
+
+    def __call__(self, value: Any) -> Tuple[Any, bool]:
+        number = value
+        if isinstance(value, str):
+            number = value.strip()
+            if self.unit and number.endswith(self.unit):
+                number = number[:-len(self.unit)].rstrip()
+            try:
+                number = float(number)
+            except ValueError:
+                return value, False
+        if isinstance(number, bool) or not isinstance(number, (int, float)):
+            return value, False
+        return number * self.factor + self.offset, True
+
+
+@dataclass(slots=True, frozen=True)
+class PreprocessingPipeline:
+    """A declarative sequence of preprocessing stages, each applied to a field of a `DataSet`
+
+    Instead of preprocessing a dataset once per step, all stages are fused and applied in a single pass over the
+    dataset: each value runs through the stages of its field in order, and for deterministic stages every distinct value
+    of a field is only transformed once. Values a stage could not be applied to are counted per field and
+    kind of problem, instead of warning about each of them.
+
+    E.g.:
+    ```python
+    pipeline = (
+        PreprocessingPipeline()
+        .normalize("sex", r"\\s+")
+        .recode("sex", {"m": "male", "f": "female"})
+        .convert_unit("weight", factor=0.001, unit="g")
+    )
+    data_set = pipeline.run(data_set, diagnostics=diagnostics)
+    ```
+
+    :ivar stages: The stages of the pipeline with the id of the field they are applied to, in order
+    """
+    stages: Tuple[Tuple[str, PreprocessingStage], ...] = field(default_factory=tuple)
+
+    def add(self, data_field: Union[str, 'DataField'], stage: PreprocessingStage) -> 'PreprocessingPipeline':
+        """Returns a new pipeline with `stage` appended for `data_field`
+
+        :param data_field: The field or id of the field to apply the stage to
+        :param stage: The stage to append
+        """
+        field_id = data_field if isinstance(data_field, str) else data_field.id
+        return PreprocessingPipeline(stages=self.stages + ((field_id, stage),))
+
+    def recode(self, data_field: Union[str, 'DataField'], mapping: Dict) -> 'PreprocessingPipeline':
+        """Returns a new pipeline recoding the values of `data_field` using `mapping`, see `Recode`"""
+        return self.add(data_field, Recode(mapping))
+
+    def apply(
+            self,
+            data_field: Union[str, 'DataField'],
+            method: Callable,
+            deterministic: bool = True,
+            **kwargs
+    ) -> 'PreprocessingPipeline':
+        """Returns a new pipeline applying `method` to the values of `data_field`, see `Apply`"""
+        return self.add(data_field, Apply(method, kwargs, deterministic))
+
+    def normalize(
+            self,
+            data_field: Union[str, 'DataField'],
+            pattern: Union[str, Pattern],
+            replacement: str = '',
+    ) -> 'PreprocessingPipeline':
+        """Returns a new pipeline replacing matches of `pattern` in the values of `data_field`, see `RegexNormalize`"""
+        return self.add(data_field, RegexNormalize(pattern, replacement))
+
+    def convert_unit(
+            self,
+            data_field: Union[str, 'DataField'],
+            factor: float,
+            offset: float = 0.0,
+            unit: str = None,
+    ) -> 'PreprocessingPipeline':
+        """Returns a new pipeline converting the values of `data_field` to another unit, see `ConvertUnit`"""
+        return self.add(data_field, ConvertUnit(factor, offset, unit))
+
+    @property
+    def field_ids(self) -> List[str]:
+        """The ids of the fields preprocessed by the pipeline, in the order of their first stage"""
+        return list(dict.fromkeys(field_id for field_id, _ in self.stages))
+
+    def get_stages(self, field_id: str) -> Tuple[PreprocessingStage, ...]:
+        """Returns the stages applied to the field with the id `field_id`, in order"""
+        return tuple(stage for stage_field_id, stage in self.stages if stage_field_id == field_id)
+
+    def preprocess_values(
+            self,
+            values: List[Any],
+            field_id: str,
+            diagnostics: 'Diagnostics' = None,
+    ) -> List[Any]:
+        """Runs the values of a field through all its stages in a single pass
+
+        Missing values, i.e. `None`, are not preprocessed. If `diagnostics` is not given, a single warning summarising
+        the values the stages could not be applied to is issued.
+
+        :param values: The values to preprocess
+        :param field_id: The id of the field the values belong to
+        :param diagnostics: If given, values the stages could not be applied to are reported to it
+        :return: The preprocessed values, in the order of `values`
+        """
+        from phenopacket_mapper.utils.diagnostics import Diagnostics
+
+        report = Diagnostics() if diagnostics is None else diagnostics
+        stages = self.get_stages(field_id)
+        memoize = all(stage.deterministic for stage in stages)
+        memo: Dict[Tuple[type, Any], Tuple[Any, Tuple[PreprocessingStage, ...]]] = dict()
+
+        ret = []
+        for value in values:
+            if value is None:
+                ret.append(None)
+                continue
+            key = None
+            if memoize:
+                try:
+                    key = (type(value), value)
+                    hit = memo.get(key)
+                except TypeError:  # unhashable value
+                    key = hit = None
+            else:
+                hit = None
+            if hit is None:
+                hit = _run_stages(stages, value)
+                if key is not None:
+                    memo[key] = hit
+            preprocessed, failed = hit
+            for stage in failed:
+                report.report(stage.kind, value, field_id)
+            ret.append(preprocessed)
+
+        if diagnostics is None and report.total:
+            warnings.warn(f"Some values of field {field_id} could not be preprocessed.\n{report}")
+        return ret
+
+    def run(self, data_set: 'DataSet', diagnostics: 'Diagnostics' = None) -> 'DataSet':
+        """Applies the pipeline to all fields of a dataset in a single pass, see `DataSet.preprocess_fields`
+
+        Like `DataSet.preprocess`, the dataset is not modified, a new dataset is returned. The values of a lazy dataset
+        are preprocessed while iterating over the returned dataset.
+
+        :param data_set: The dataset to preprocess
+        :param diagnostics: If given, values the stages could not be applied to are reported to it, otherwise a warning
+                            summarising them is issued per field
+        :return: A new dataset with the preprocessed values
+        """
+        return data_set.preprocess_fields({
+            field_id: functools.partial(self.preprocess_values, field_id=field_id, diagnostics=diagnostics)
+            for field_id in self.field_ids
+        })
+
+
+def _run_stages(
+        stages: Tuple[PreprocessingStage, ...],
+        value: Any,
+) -> Tuple[Any, Tuple[PreprocessingStage, ...]]:
+    """Runs a value through the stages, returning the result and the stages that could not be applied"""
+    failed = ()
+    for stage in stages:
+        if value is None:
+            break
+        value, ok = stage(value)
+        if not ok:
+            failed += (stage,)
+    return value, failed
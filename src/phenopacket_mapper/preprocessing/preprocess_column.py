@@ -0,0 +1,105 @@
+import warnings
+from concurrent.futures import Executor
+from typing import Any, Dict, Callable, List, Sequence, Tuple, Union
+
+# Number of values sent to a worker process at once by `preprocess_column`
+PREPROCESS_WORKER_BATCH_SIZE = 1024
+
+
+def preprocess_column(
+        values: Sequence[Any],
+        mapping: Union[Dict, Callable],
+        vectorized: bool = False,
+        workers: int = None,
+        executor: Executor = None,
+        **kwargs
+) -> List[Any]:
+    """Preprocesses all values of a column at once
+
+    Missing values, i.e. `None`, are left as they are. For the other values:
+
+    * A mapping dictionary is looked up once per distinct value, values not in the dictionary are kept and reported in
+      a single warning, instead of one per value as in `preprocess_dict`.
+    * A method is called as in `preprocess_method`, once per value. If `vectorized` is True, it is instead called once
+      with the list of all values as its first argument and has to return a sequence of as many preprocessed values.
+      If `workers` or `executor` is given, the values are preprocessed in batches by that many worker processes or in
+      the given process pool; the method, its arguments and the values then have to be picklable.
+
+    E.g.:
+    >>> preprocess_column(["m", None, "f", "m"], {"m": "male", "f": "female"})
+    ['male', None, 'female', 'male']
+
+    :param values: The values of the column to preprocess.
+    :param mapping: A dictionary containing the mapping rules or a method to use for preprocessing.
+    :param vectorized: Whether the method preprocesses a list of values at once.
+    :param workers: Number of worker processes to apply a method that is not vectorized with.
+    :param executor: A process pool to apply a method that is not vectorized in instead of starting a new one, e.g. to
+                     share one pool across the batches of a lazy dataset.
+    :param kwargs: Additional arguments for the method.
+    :return: The preprocessed values, in the order of `values`
+    """
+    positions = [i for i, v in enumerate(values) if v is not None]
+    present = [values[i] for i in positions]
+
+    if isinstance(mapping, dict):
+        preprocessed = _map_distinct(present, mapping)
+    elif isinstance(mapping, Callable):
+        if vectorized:
+            preprocessed = mapping(present, **kwargs)
+            preprocessed = preprocessed.tolist() if hasattr(preprocessed, 'tolist') else list(preprocessed)
+            if len(preprocessed) != len(present):
+                raise ValueError(f"Vectorized method returned {len(preprocessed)} values for {len(present)} values")
+        elif executor is not None or (workers is not None and workers > 1):
+            from phenopacket_mapper.utils.parallel import batched, ordered_parallel_map
+
+            preprocessed = [
+                v
+                for batch in ordered_parallel_map(
+                    _preprocess_batch,
+                    ((mapping, batch, kwargs) for batch in batched(present, PREPROCESS_WORKER_BATCH_SIZE)),
+                    workers=workers,
+                    executor=executor,
+                )
+                for v in batch
+            ]
+        else:
+            preprocessed = [mapping(v, **kwargs) for v in present]
+    else:
+        warnings.warn(f"Mapping type {type(mapping)} in preprocessing not supported. Returning original values.")
+        return list(values)
+
+    ret = [None] * len(values)
+    for i, v in zip(positions, preprocessed):
+        ret[i] = v
+    return ret
+
+
+def _map_distinct(values: List[Any], mapping_dict: Dict) -> List[Any]:
+    """Looks up every distinct value in `mapping_dict` once, keeping values that are not in it"""
+    mapped: Dict[Tuple[type, Any], Any] = dict()
+    misses: Dict[Tuple[type, Any], int] = dict()
+    ret = []
+    for value in values:
+        try:
+            key = (type(value), value)
+            if key not in mapped:
+                mapped[key] = mapping_dict.get(value, mapped)  # `mapped` is a sentinel for misses
+        except TypeError:  # unhashable value, cannot be in the dictionary
+            ret.append(value)
+            continue
+        new_value = mapped[key]
+        if new_value is mapped:
+            misses[key] = misses.get(key, 0) + 1
+            new_value = value
+        ret.append(new_value)
+
+    if misses:
+        examples = [value for _, value in list(misses)[:5]]
+        warnings.warn(f"{sum(misses.values())} values ({len(misses)} distinct) not found in mapping dictionary, "
+                      f"e.g. {examples}.")
+    return ret
+
+
+def _preprocess_batch(args: Tuple[Callable, List[Any], Dict[str, Any]]) -> List[Any]:
+    method, values, kwargs = args
+    return [method(v, **kwargs) for v in values]
@@ -0,0 +1,69 @@
+from typing import Any, Callable, List, Literal, Sequence
+
+# Number of rows passed to a vectorized method at once by `preprocess_columns`, if no batch size is given
+DEFAULT_BATCH_SIZE = 10_000
+
+
+def preprocess_columns(
+        columns: Sequence[Sequence[Any]],
+        method: Callable,
+        vectorized: bool = False,
+        batch_size: int = None,
+        layout: Literal['columns', 'rows'] = 'columns',
+        skip_missing: bool = True,
+        **kwargs
+) -> List[Any]:
+    """Preprocesses several row-aligned columns at once, computing one value per row
+
+    If `vectorized` is False, the method is called once per row with the values of the row as positional arguments,
+    i.e. `method(value_1, value_2, **kwargs)`. If `vectorized` is True, the rows are passed to the method in batches of
+    `batch_size` rows: either as one list per column, i.e. `method(values_1, values_2, **kwargs)`, if `layout` is
+    'columns', or as a list of tuples, one per row, i.e. `method(rows, **kwargs)`, if `layout` is 'rows'. A vectorized
+    method has to return a sequence with one value per row of the batch.
+
+    E.g.:
+    >>> preprocess_columns([[1990, 2001, None], [2020, 2021, 2022]], lambda birth, onset: onset - birth)
+    [30, 20, None]
+
+    :param columns: The columns to preprocess, all of the same length.
+    :param method: The method computing the value of a row.
+    :param vectorized: Whether the method preprocesses a batch of rows at once.
+    :param batch_size: The number of rows passed to a vectorized method at once, defaults to `DEFAULT_BATCH_SIZE`.
+    :param layout: Whether a vectorized method receives the batch as one list per column or as a list of rows.
+    :param skip_missing: If True, rows with a missing value, i.e. `None`, are not passed to the method and result in
+                        `None`.
+    :param kwargs: Additional arguments for the method.
+    :return: The computed values, one per row
+    """
+    if layout not in ('columns', 'rows'):
+        raise ValueError(f"layout must be 'columns' or 'rows', not {layout!r}")
+    if batch_size is None:
+        batch_size = DEFAULT_BATCH_SIZE
+    elif batch_size < 1:
+        raise ValueError(f"Parameter batch_size must be a positive integer. (Not: {batch_size})")
+    lengths = set(len(column) for column in columns)
+    if len(lengths) > 1:
+        raise ValueError(f"All columns must have the same length, got {sorted(lengths)}")
+
+    rows = list(zip(*columns))
+    positions = [i for i, row in enumerate(rows) if not (skip_missing and any(v is None for v in row))]
+
+    ret: List[Any] = [None] * len(rows)
+    if not vectorized:
+        for i in positions:
+            ret[i] = method(*rows[i], **kwargs)
+        return ret
+
+    for start in range(0, len(positions), batch_size):
+        batch = positions[start:start + batch_size]
+        batch_rows = [rows[i] for i in batch]
+        if layout == 'columns':
+            preprocessed = method(*(list(column) for column in zip(*batch_rows)), **kwargs)
+        else:
+            preprocessed = method(batch_rows, **kwargs)
+        preprocessed = preprocessed.tolist() if hasattr(preprocessed, 'tolist') else list(preprocessed)
+        if len(preprocessed) != len(batch):
+            raise ValueError(f"Vectorized method returned {len(preprocessed)} values for {len(batch)} rows")
+        for i, value in zip(batch, preprocessed):
+            ret[i] = value
+    return ret
@@ -3,10 +3,14 @@ from .create_ipynb_in_code import NotebookBuilder
 from .pandas_utils import loc_default
 from .str_to_valid_id import str_to_valid_id
 from .recursive_dict_call import recursive_dict_call
+from .parallel import batched, ordered_parallel_map
+from .diagnostics import Diagnostics
 
 __all__ = [
     "NotebookBuilder",
     "loc_default",
     "str_to_valid_id",
     "recursive_dict_call",
+    "batched", "ordered_parallel_map",
+    "Diagnostics",
 ]
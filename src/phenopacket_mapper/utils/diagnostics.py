@@ -0,0 +1,111 @@
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class Diagnostics:
+    """Collects problems found while parsing and validating data, aggregated by kind and field
+
+    By default, the parsers and loaders of this package print or warn about every problematic value. On messy data this
+    floods the output and costs a noticeable amount of time. Passing a `Diagnostics` object instead makes them report
+    the problems to it, where they are only counted, keeping a few examples per kind and field.
+
+    E.g.:
+    >>> from phenopacket_mapper.utils.parsing import parse_coding
+    >>> diagnostics = Diagnostics()
+    >>> parse_coding("HP:0000790", resources=[], diagnostics=diagnostics.scoped("phenotype"))
+    Coding(system='HP', code='0000790', display='', text='')
+    >>> diagnostics.counts
+    {('unknown_code_system', 'phenotype'): 1}
+
+    A disabled `Diagnostics` object drops all problems reported to it, silencing the output at nearly no cost.
+
+    :ivar enabled: If False, reported problems are dropped
+    :ivar max_examples: The maximum number of examples kept per kind and field
+    """
+    __slots__ = ('enabled', 'max_examples', '_counts', '_examples')
+
+    def __init__(self, enabled: bool = True, max_examples: int = 5):
+        self.enabled = enabled
+        self.max_examples = max_examples
+        self._counts: Counter = Counter()
+        self._examples: Dict[Tuple[str, Optional[str]], List[Any]] = dict()
+
+    def report(self, kind: str, example: Any = None, field_id: str = None) -> None:
+        """Reports a problem
+
+        :param kind: the kind of problem, e.g. 'unparsable_value'
+        :param example: the value causing the problem, kept as an example
+        :param field_id: the id of the `DataField` the problem was found in, if known
+        """
+        if not self.enabled:
+            return
+        key = (kind, field_id)
+        self._counts[key] += 1
+        examples = self._examples.setdefault(key, [])
+        if len(examples) < self.max_examples:
+            examples.append(example)
+
+    def scoped(self, field_id: str) -> '_ScopedDiagnostics':
+        """Returns a view on this object that reports all problems for the field `field_id`
+
+        :param field_id: the id of the `DataField`
+        """
+        return _ScopedDiagnostics(self, field_id)
+
+    @property
+    def counts(self) -> Dict[Tuple[str, Optional[str]], int]:
+        """Number of problems reported per kind and field id"""
+        return dict(self._counts)
+
+    @property
+    def examples(self) -> Dict[Tuple[str, Optional[str]], List[Any]]:
+        """Examples of the problems reported per kind and field id"""
+        return {key: list(examples) for key, examples in self._examples.items()}
+
+    @property
+    def total(self) -> int:
+        """Number of problems reported"""
+        return sum(self._counts.values())
+
+    def merge(self, other: 'Diagnostics') -> None:
+        """Adds the problems reported to `other`, e.g. in a worker process, to this object
+
+        :param other: the `Diagnostics` object to take the problems from
+        """
+        if not self.enabled:
+            return
+        self._counts.update(other._counts)
+        for key, examples in other._examples.items():
+            own_examples = self._examples.setdefault(key, [])
+            own_examples.extend(examples[:max(self.max_examples - len(own_examples), 0)])
+
+    def clear(self) -> None:
+        """Forgets all problems reported so far"""
+        self._counts.clear()
+        self._examples.clear()
+
+    def __str__(self):
+        lines = [f"Diagnostics(total={self.total})"]
+        for (kind, field_id), count in self._counts.most_common():
+            location = f" in {field_id}" if field_id is not None else ""
+            lines.append(f"  {count} x {kind}{location}, e.g. {self._examples[(kind, field_id)]}")
+        return "\n".join(lines)
+
+
+class _ScopedDiagnostics:
+    """View on a `Diagnostics` object, filling in the field of all problems reported to it"""
+    __slots__ = ('parent', 'field_id')
+
+    def __init__(self, parent: Diagnostics, field_id: str):
+        self.parent = parent
+        self.field_id = field_id
+
+    @property
+    def enabled(self) -> bool:
+        return self.parent.enabled
+
+    def report(self, kind: str, example: Any = None, field_id: str = None) -> None:
+        self.parent.report(kind, example, field_id if field_id is not None else self.field_id)
+
+    def scoped(self, field_id: str) -> '_ScopedDiagnostics':
+        return self.parent.scoped(field_id)
@@ -5,7 +5,7 @@ from .read_xml import read_xml, parse_xml
 from .data_reader import DataReader
 from .input import read_data_model, read_phenopackets, read_phenopacket_from_json, load_tabular_data_using_data_model
 from .input import load_hierarchical_data, load_hierarchical_dataset
-from .output import write
+from .output import write, write_iter
 
 __all__ = [
     'read_json',
@@ -16,5 +16,5 @@ __all__ = [
     'read_phenopacket_from_json',
     'load_tabular_data_using_data_model',
     'load_hierarchical_data', 'load_hierarchical_dataset',
-    'write',
+    'write', 'write_iter',
 ]
@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Union, Tuple, List, Iterable, Literal, Dict
+from typing import Union, Tuple, List, Iterable, Literal, Dict, Iterator
 from io import IOBase, TextIOWrapper, BytesIO, BufferedIOBase, TextIOBase, StringIO
 
 import pandas as pd
@@ -12,17 +12,40 @@ class DataReader:
             self,
             file: Union[str, Path, IOBase, List[str], List[Path], List[IOBase]],
             encoding: str = 'utf-8',
-            file_extension: Literal['csv', 'xlsx', 'json', 'xml'] = None
+            file_extension: Literal['csv', 'xlsx', 'json', 'xml'] = None,
+            chunk_size: int = None,
+            dtype: Union[type, str, Dict[str, Union[type, str]]] = None,
     ):
         """Initializes the data reader.
 
+        If `chunk_size` is set, the file is streamed instead of being read into memory at once. In that case `data` is
+        `None` and `iterable` is a lazy generator of rows, which can only be consumed once. Use `iter_chunks` to read
+        the file as a sequence of :class:`pd.DataFrame` objects with at most `chunk_size` rows each. Streaming is only
+        supported for csv files.
+
+        Unless `dtype` is given, pandas infers the types of the columns of csv and xlsx files. For a file read in chunks,
+        the types are inferred for every chunk separately, so the same cell may be read differently depending on where
+        the chunks are split, e.g. an integer column with an empty cell is read as `float` only in the chunk containing
+        the empty cell. Pass a fixed `dtype`, e.g. `str`, to read the file the same way with and without chunks.
+
         :param file: a `str`, :class:`Path` or :class:`IOBase` to read from. If `str` or :class:`Path`, then the
         input is interpreted as a path to a local file.
         :param encoding: The encoding to use when reading the file. Default is 'utf-8'.
         :param file_extension: The file extension of the file to read. If `None`, the file extension is inferred from the
         file path. Default is `None`.
+        :param chunk_size: Number of rows to read at a time. If `None`, the whole file is read at once. Default is `None`.
+        :param dtype: The data type to read the columns of csv and xlsx files as, see :func:`pd.read_csv`. If `None`,
+        the data types are inferred. Default is `None`.
         """
         # TODO: fix file names so we can identify data instances correctly, can do this at the start
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError(f"Parameter chunk_size must be a positive integer. (Not: {chunk_size})")
+        self.chunk_size = chunk_size
+        self.dtype = dtype
+        self.encoding = encoding
+        self.path = None
+        self._reading_chunks = False
+        self._chunks_consumed = False
         self.is_dir = False
         self.file_extension = None
         self.file_names = None
@@ -47,6 +70,7 @@ class DataReader:
 
                 self.handle_file_extension(file_extension)
             elif file.is_dir():
+                self.path = file
                 self.is_dir = True
 
         elif isinstance(file, IOBase):
@@ -85,12 +109,17 @@ class DataReader:
         """
         # we know that file is always a buffer with the contents of the file
         # change this to work with self.file
+        if self.chunk_size and self.file_extension != 'csv':
+            raise ValueError(f"Reading in chunks is only supported for csv files, not {self.file_extension}.")
+
         if not self.is_dir:  # is a file
             if self.file_extension == 'csv':
-                df = pd.read_csv(self.file)
+                if self.chunk_size:
+                    return None, self._iter_rows()
+                df = pd.read_csv(self.file, dtype=self.dtype)
                 return df, [row for row in df.iterrows()]
             elif self.file_extension == 'xlsx':
-                df = pd.read_excel(self.file)
+                df = pd.read_excel(self.file, dtype=self.dtype)
                 return df, [row for row in df.iterrows()]
             elif self.file_extension == 'json':
                 return (file_contents := read_json(self.file)), [file_contents]
@@ -99,16 +128,11 @@ class DataReader:
             else:
                 raise ValueError(f'Unknown file type with extension {self.file_extension}')
         elif self.is_dir:
-            self.file_names = [str(file) for file in self.path.iterdir() if file.is_file()]
             # collect list of all files in the folder
-            files: List[Path] = [file for file in self.path.iterdir() if file.is_file()]
-            file_extension = list(set([file.suffix[1:] for file in files]))
-            if len(file_extension) > 1:
-                raise ValueError(f"Cannot read files of different types: {file_extension}")
-            elif len(file_extension) == 0:
-                raise ValueError(f"No files found in the directory specified: {self.file}")
+            files, file_extension = self.list_directory(self.path)
+            self.file_names = [str(file) for file in files]
 
-            self.handle_file_extension(file_extension[0])
+            self.handle_file_extension(file_extension)
 
             if self.file_extension == 'json':
                 jsons = [read_json(file) for file in files]
@@ -120,3 +144,56 @@ class DataReader:
                 raise ValueError(f"File extension {file_extension} not recognized or not supported for reading files "
                                  f"from a directory. Specified directory: {self.file}. Extensions found: "
                                  f"{file_extension}")
+
+    @staticmethod
+    def list_directory(path: Path) -> Tuple[List[Path], str]:
+        """Lists the files in a directory without reading them, in the order they are read by a `DataReader`
+
+        :param path: The directory
+        :return: The files in the directory and their common file extension
+        """
+        files: List[Path] = [file for file in path.iterdir() if file.is_file()]
+        file_extension = list(set([file.suffix[1:] for file in files]))
+        if len(file_extension) > 1:
+            raise ValueError(f"Cannot read files of different types: {file_extension}")
+        elif len(file_extension) == 0:
+            raise ValueError(f"No files found in the directory specified: {path}")
+        return files, file_extension[0]
+
+    def iter_chunks(self) -> Iterator[pd.DataFrame]:
+        """Reads the csv file chunk by chunk
+
+        Each chunk is a :class:`pd.DataFrame` with at most `chunk_size` rows, only one chunk is held in memory at a time.
+        A file given by its path is opened anew on every call, so several iterations can run at the same time. A buffer
+        is shared by all iterations: a seekable buffer is read from the start on every call, but only one iteration can
+        run at a time, a buffer that is not seekable can only be read once.
+
+        :return: An iterator over the chunks of the file
+        """
+        if not self.chunk_size:
+            raise ValueError("Parameter chunk_size must be set to read the file in chunks.")
+
+        if self.path is not None:
+            with open(self.path, "r", encoding=self.encoding) as file:
+                with pd.read_csv(file, chunksize=self.chunk_size, dtype=self.dtype) as reader:
+                    yield from reader
+            return
+
+        if self._reading_chunks:
+            raise RuntimeError("The buffer is already being read, it cannot be read by several iterations at once.")
+        if self._chunks_consumed and not self.file.seekable():
+            raise RuntimeError("The buffer has already been read and is not seekable, it can only be read once.")
+        self._reading_chunks = True
+        try:
+            if self.file.seekable():
+                self.file.seek(0)
+            self._chunks_consumed = True
+            with pd.read_csv(self.file, chunksize=self.chunk_size, dtype=self.dtype) as reader:
+                yield from reader
+        finally:
+            self._reading_chunks = False
+
+    def _iter_rows(self) -> Iterator[Tuple[int, pd.Series]]:
+        """Lazily yields the rows of the csv file in the same format as :meth:`pd.DataFrame.iterrows`"""
+        for chunk in self.iter_chunks():
+            yield from chunk.iterrows()
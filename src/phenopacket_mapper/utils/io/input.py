@@ -1,21 +1,26 @@
+import functools
 import math
 import os
 import warnings
 from io import IOBase
 from pathlib import Path
 from types import MappingProxyType
-from typing import Literal, List, Union, Dict, Tuple
+from typing import Literal, List, Union, Dict, Tuple, Any, Iterator, Callable, Optional, Iterable
 
 import pandas as pd
 from phenopackets.schema.v2 import Phenopacket
 from google.protobuf.json_format import Parse
 
 from phenopacket_mapper.data_standards import DataModel, DataModelInstance, DataField, CodeSystem, DataFieldValue, \
-    DataSet, OrGroup, DataSection
-from phenopacket_mapper.data_standards.data_model import DataSectionInstance
+    DataSet, OrGroup, DataSection, Date
+from phenopacket_mapper.data_standards.data_model import DataSectionInstance, LazyDataModelInstances, \
+    ColumnarDataModelInstances, Column
 from phenopacket_mapper.utils import loc_default, recursive_dict_call
 from phenopacket_mapper.utils import parsing
+from phenopacket_mapper.utils.diagnostics import Diagnostics
 from phenopacket_mapper.utils.io.data_reader import DataReader
+from phenopacket_mapper.utils.io import read_json, read_xml
+from phenopacket_mapper.utils.parallel import batched, ordered_parallel_map
 from phenopacket_mapper.utils.parsing import parse_ordinal
 
 
@@ -136,6 +141,12 @@ def load_tabular_data_using_data_model(
         data_model: DataModel,
         column_names: Dict[str, str],
         compliance: Literal['lenient', 'strict'] = 'lenient',
+        chunk_size: int = None,
+        lazy: bool = False,
+        schema_directed: bool = False,
+        validate: Literal['eager', 'deferred', 'off'] = 'eager',
+        diagnostics: Diagnostics = None,
+        storage: Literal['rows', 'columnar'] = 'rows',
 ) -> DataSet:
     """Loads data from a file using a DataModel definition
 
@@ -155,12 +166,30 @@ def load_tabular_data_using_data_model(
                         column in the file
     :param compliance: Compliance level to enforce when reading the file. If 'lenient', the file can have extra fields
                         that are not in the DataModel. If 'strict', the file must have all fields in the DataModel.
+    :param chunk_size: If set, a csv file is streamed and processed `chunk_size` rows at a time instead of being read
+                        into memory at once.
+    :param lazy: If True, the `DataModelInstance` objects are only created while iterating over the returned
+                        `DataSet`. Combined with `chunk_size`, at most one chunk of the file is held in memory at a time.
+    :param schema_directed: If True, the values of each field are only parsed as the kinds of values allowed by the
+                        `ValueSet` of the field (see `parsing.get_value_parser`) instead of trying every kind of value.
+    :param validate: When to validate the data. If 'eager', every `DataModelInstance` is validated when it is created.
+                        If 'deferred', the whole dataset is validated at once by `DataSet.validate` after loading (for
+                        a lazy dataset, only when `DataSet.validate` is called). If 'off', the data is not validated.
+    :param diagnostics: If given, problems found while parsing and validating the data are reported to it instead of
+                        printing or issuing a warning for each of them.
+    :param storage: If 'rows', a `DataModelInstance` is created for every row. If 'columnar', the parsed values are
+                        stored column by column in a `ColumnarDataModelInstances` object, see there. A columnar
+                        dataset cannot be lazy and is always validated as a whole after loading, unless `validate`
+                        is 'off'.
     :return: List of DataModelInstances
     """
-    data_reader = DataReader(file)
-    data, data_iterable = data_reader.data, data_reader.iterable
-
-    df = data
+    _check_validate(validate)
+    if storage not in ('rows', 'columnar'):
+        raise ValueError(f"storage must be 'rows' or 'columnar', not {storage!r}")
+    if storage == 'columnar' and lazy:
+        raise ValueError("A columnar dataset cannot be lazy")
+    # read all cells as text, so values are parsed the same way whether or not the file is read in chunks
+    data_reader = DataReader(file, chunk_size=chunk_size, dtype=str)
 
     # check column_names is in the correct format
     if isinstance(column_names, MappingProxyType):
@@ -172,33 +201,307 @@ def load_tabular_data_using_data_model(
         elif f.id + "_column" in column_names.keys():
             column_names[f.id] = column_names.pop(f.id + "_column")
 
-    data_model_instances = []
+    column_parsers = {
+        f.id: _get_column_parser(f, data_model.resources, compliance, schema_directed, _scoped(diagnostics, f.id))
+        for f in data_model.fields
+    }
 
-    for i in range(len(df)):
-        values = []
-        for f in data_model.fields:
-            column_name = column_names[f.id]
+    def iter_data_frames() -> Iterator[pd.DataFrame]:
+        if chunk_size:
+            yield from data_reader.iter_chunks()
+        else:
+            yield data_reader.data
+
+    def iter_instances() -> Iterator[DataModelInstance]:
+        row_offset = 0
+        for df in iter_data_frames():
+            yield from _load_tabular_data_frame(
+                df=df,
+                data_model=data_model,
+                column_names=column_names,
+                column_parsers=column_parsers,
+                compliance=compliance,
+                row_offset=row_offset,
+                validate_on_init=validate == 'eager',
+                diagnostics=diagnostics,
+            )
+            row_offset += len(df)
+
+    if storage == 'columnar':
+        data_model_instances = _load_tabular_columns(
+            data_frames=iter_data_frames(),
+            data_model=data_model,
+            column_names=column_names,
+            column_parsers=column_parsers,
+            compliance=compliance,
+        )
+        if validate == 'eager':
+            validate = 'deferred'
+    elif lazy:
+        data_model_instances = LazyDataModelInstances(
+            load=iter_instances,
+            count=lambda: sum(len(df) for df in iter_data_frames()),
+        )
+    else:
+        data_model_instances = list(iter_instances())
+
+    return _validate_deferred(
+        DataSet(data_model=data_model, data=data_model_instances), validate, compliance, diagnostics
+    )
+
+
+def _check_validate(validate: Literal['eager', 'deferred', 'off']):
+    if validate not in ('eager', 'deferred', 'off'):
+        raise ValueError(f"validate must be 'eager', 'deferred' or 'off', not {validate!r}")
+
+
+def _validate_deferred(
+        data_set: DataSet,
+        validate: Literal['eager', 'deferred', 'off'],
+        compliance: Literal['lenient', 'strict'],
+        diagnostics: Diagnostics = None,
+) -> DataSet:
+    """Validates a freshly loaded, non-lazy `DataSet` at once if `validate` is 'deferred'
+
+    Instead of one warning per invalid instance, a single warning (or `ValueError` if `compliance` is 'strict')
+    summarising the `ValidationReport` is issued. If `diagnostics` is given, the problems are reported to it instead.
+    """
+    if validate != 'deferred' or data_set.is_lazy:
+        return data_set
 
-            pandas_value = loc_default(df, row_index=i, column_name=column_name)
+    report = data_set.validate()
+    if not report.is_valid:
+        error_msg = f"Instance values do not comply with the data model.\n{report}"
+        if compliance == 'strict':
+            raise ValueError(error_msg)
+        elif diagnostics is None:
+            warnings.warn(error_msg)
+        else:
+            for issue in report.issues:
+                example = issue.value if issue.reason == 'not_in_value_set' else issue.row_id
+                diagnostics.report(issue.reason, example, issue.field_id)
+    return data_set
+
+
+def _scoped(diagnostics: Optional[Diagnostics], field_id: str) -> Optional[Diagnostics]:
+    return diagnostics.scoped(field_id) if diagnostics is not None else None
 
-            if not pandas_value or (isinstance(pandas_value, float) and math.isnan(pandas_value)):
-                continue
 
-            value_str = str(pandas_value)
-            value = parsing.parse_value(value_str=value_str, resources=data_model.resources, compliance=compliance)
-            values.append(DataFieldValue(id=i, field=f, value=value))
+def _new_instance(
+        validate_on_init: bool,
+        diagnostics: Optional[Diagnostics],
+        **kwargs,
+) -> DataModelInstance:
+    """Creates a `DataModelInstance`, reporting the problems found when validating it to `diagnostics` if given"""
+    instance = DataModelInstance(validate_on_init=validate_on_init and diagnostics is None, **kwargs)
+    if validate_on_init and diagnostics is not None:
+        instance.validate(diagnostics)
+    return instance
+
+
+def _load_tabular_data_frame(
+        df: pd.DataFrame,
+        data_model: DataModel,
+        column_names: Dict[str, str],
+        column_parsers: Dict[str, Callable[[pd.Series], List[Any]]],
+        compliance: Literal['lenient', 'strict'] = 'lenient',
+        row_offset: int = 0,
+        validate_on_init: bool = True,
+        diagnostics: Diagnostics = None,
+) -> List[DataModelInstance]:
+    """Helper method for `load_tabular_data_using_data_model`, turns a `pd.DataFrame` into `DataModelInstance` objects
+
+    The data frame is processed column by column: every column mapped to a field of the `DataModel` is pulled out once
+    and parsed as a whole by `_parse_column`. Only afterward are the rows assembled into `DataModelInstance` objects.
+
+    :param df: the data frame to load
+    :param data_model: DataModel to use for reading the data frame
+    :param column_names: A dictionary mapping from the id of each field of the `DataField` to the name of a column
+    :param column_parsers: A dictionary mapping from the id of each field of the `DataField` to the function used to
+                        parse its column
+    :param compliance: Compliance level to enforce when reading the data frame
+    :param row_offset: Number of rows preceding `df` in the file, used to number the rows
+    :param validate_on_init: Whether to validate every `DataModelInstance` when it is created
+    :param diagnostics: If given, problems found when validating the instances are reported to it
+    :return: List of DataModelInstances, one per row of `df`
+    """
+    parsed_columns = [
+        (f, _parse_column(df, column_names[f.id], column_parser=column_parsers[f.id]))
+        for f in data_model.fields
+    ]
 
-        values = tuple(values)
+    data_model_instances = []
+    for i in range(len(df)):
+        row_index = row_offset + i
+        values = tuple(
+            DataFieldValue(id=row_index, field=f, value=column[i])
+            for f, column in parsed_columns
+            if column[i] is not None
+        )
 
         data_model_instances.append(
-            DataModelInstance(
-                id="row:" + str(i),
+            _new_instance(
+                validate_on_init,
+                diagnostics,
+                id="row:" + str(row_index),
                 data_model=data_model,
                 values=values,
                 compliance=compliance)
         )
 
-    return DataSet(data_model=data_model, data=data_model_instances)
+    return data_model_instances
+
+
+def _load_tabular_columns(
+        data_frames: Iterable[pd.DataFrame],
+        data_model: DataModel,
+        column_names: Dict[str, str],
+        column_parsers: Dict[str, Callable[[pd.Series], List[Any]]],
+        compliance: Literal['lenient', 'strict'] = 'lenient',
+) -> ColumnarDataModelInstances:
+    """Helper method for `load_tabular_data_using_data_model`, stores the parsed columns of the data frames as they are
+
+    :param data_frames: the data frames to load, e.g. the chunks of a file
+    :param data_model: DataModel to use for reading the data frames
+    :param column_names: A dictionary mapping from the id of each field of the `DataField` to the name of a column
+    :param column_parsers: A dictionary mapping from the id of each field of the `DataField` to the function used to
+                        parse its column
+    :param compliance: Compliance level of the instances
+    :return: The parsed values of all data frames, stored column by column
+    """
+    values: Dict[str, List[Any]] = {f.id: [] for f in data_model.fields}
+    for df in data_frames:
+        for f in data_model.fields:
+            values[f.id].extend(_parse_column(df, column_names[f.id], column_parser=column_parsers[f.id]))
+
+    return ColumnarDataModelInstances(
+        data_model=data_model,
+        columns={field_id: Column.from_values(column) for field_id, column in values.items()},
+        compliance=compliance,
+    )
+
+
+def _parse_column(
+        df: pd.DataFrame,
+        column_name: str,
+        column_parser: Callable[[pd.Series], List[Any]],
+) -> List[Any]:
+    """Parses all values in a column of a `pd.DataFrame` at once
+
+    Empty cells, i.e. `NaN` or falsy values, and columns that are not present in the data frame result in `None`.
+
+    :param df: the data frame containing the column
+    :param column_name: name of the column
+    :param column_parser: function parsing the column, see `_get_column_parser`
+    :return: List of the parsed values, one per row of `df`
+    """
+    if column_name not in df.columns:
+        return [None] * len(df)
+    return column_parser(df[column_name])
+
+
+def _parse_values(column: pd.Series, value_parser: Callable[[str], Any]) -> List[Any]:
+    """Parses a column value by value, every distinct value in the column is only parsed once
+
+    :param column: the column to parse
+    :param value_parser: function parsing the string representation of a value
+    :return: List of the parsed values, `None` for empty cells
+    """
+    parsed_values: Dict[str, Any] = {}
+    ret: List[Any] = [None] * len(column)
+    for i, (pandas_value, is_present) in enumerate(zip(column.tolist(), column.notna().tolist())):
+        if not is_present or not pandas_value:
+            continue
+
+        value_str = str(pandas_value)
+        if value_str not in parsed_values:
+            parsed_values[value_str] = value_parser(value_str)
+        ret[i] = parsed_values[value_str]
+
+    return ret
+
+
+def _parse_date_values(
+        column: pd.Series,
+        value_parser: Callable[[str], Any],
+        compliance: Literal['lenient', 'strict'] = 'lenient',
+        default_first: Literal['day', 'month'] = 'day',
+        diagnostics: Diagnostics = None,
+) -> List[Any]:
+    """Parses a column of dates in bulk using `parsing.parse_dates`
+
+    :param column: the column to parse
+    :param value_parser: function parsing the values that do not match the date format detected for the column
+    :param compliance: Compliance level to use when parsing the values
+    :param default_first: whether the day or the month comes first in ambiguous dates the column does not settle
+    :param diagnostics: If given, values that could not be parsed are reported to it
+    :return: List of the parsed values, `None` for empty cells
+    """
+    present = [is_present and bool(v) for v, is_present in zip(column.tolist(), column.notna().tolist())]
+    dates = column.astype(object).where(present, None)
+    return parsing.parse_dates(
+        dates, default_first=default_first, compliance=compliance, fallback=value_parser, diagnostics=diagnostics
+    ).tolist()
+
+
+def _get_column_parser(
+        data_field: DataField,
+        resources: Tuple[CodeSystem, ...],
+        compliance: Literal['lenient', 'strict'],
+        schema_directed: bool,
+        diagnostics: Diagnostics = None,
+        default_first: Literal['day', 'month'] = 'day',
+) -> Callable[[pd.Series], List[Any]]:
+    """Returns the function to parse a column containing the values of `data_field` with
+
+    If `schema_directed` is True and the field only allows dates, the column is parsed in bulk by `_parse_date_values`,
+    otherwise value by value by `_parse_values`.
+
+    :param data_field: the field whose values are parsed
+    :param resources: List of `CodeSystem` objects to be used for parsing the values
+    :param compliance: Compliance level to use when parsing the values
+    :param schema_directed: If True, the parser is specialised to the `ValueSet` of the field
+    :param diagnostics: If given, values that could not be parsed are reported to it
+    :param default_first: whether the day or the month comes first in ambiguous dates of a column parsed in bulk
+    """
+    value_parser = _get_value_parser(data_field, resources, compliance, schema_directed, diagnostics)
+    if schema_directed and _only_allows_dates(data_field):
+        return functools.partial(
+            _parse_date_values, value_parser=value_parser, compliance=compliance, default_first=default_first,
+            diagnostics=diagnostics,
+        )
+    return functools.partial(_parse_values, value_parser=value_parser)
+
+
+def _only_allows_dates(data_field: DataField) -> bool:
+    try:
+        elements = tuple(data_field.specification)
+    except TypeError:
+        return False
+    return len(elements) > 0 and all(e is Date for e in elements)
+
+
+def _get_value_parser(
+        data_field: DataField,
+        resources: Tuple[CodeSystem, ...],
+        compliance: Literal['lenient', 'strict'],
+        schema_directed: bool,
+        diagnostics: Diagnostics = None,
+) -> Callable[[str], Any]:
+    """Returns the function to parse the values of `data_field` with
+
+    :param data_field: the field whose values are parsed
+    :param resources: List of `CodeSystem` objects to be used for parsing the values
+    :param compliance: Compliance level to use when parsing the values
+    :param schema_directed: If True, the parser is specialised to the `ValueSet` of the field, otherwise every kind
+                        of value is tried
+    :param diagnostics: If given, values that could not be parsed are reported to it
+    """
+    if schema_directed:
+        return parsing.get_value_parser(
+            data_field.specification, resources=resources, compliance=compliance, diagnostics=diagnostics
+        )
+    return functools.partial(parsing.parse_value, resources=resources, compliance=compliance, diagnostics=diagnostics)
 
 
 def read_phenopackets(dir_path: Path) -> List[Phenopacket]:
@@ -240,6 +543,7 @@ def load_hierarchical_data_recursive(
         resources: Tuple[CodeSystem, ...],
         compliance: Literal['lenient', 'strict'] = 'lenient',
         mapping: Dict[DataField, str] = None,
+        value_parsers: Dict[DataField, Callable[[str], Any]] = None,
 ) -> Union[Tuple, Union[DataModelInstance, DataSectionInstance, DataFieldValue, None]]:
     """Helper method for `load_hierarchical_data`, recurses through hierarchical :class:`DataModel`
 
@@ -252,6 +556,8 @@ def load_hierarchical_data_recursive(
     :param compliance: Compliance level to enforce when reading the file. If 'lenient', the file can have extra fields
                         that are not in the DataModel. If 'strict', the file must have all fields in the DataModel.
     :param mapping: specifies the mapping from data fields present in the data model to identifiers of fields in the data
+    :param value_parsers: optionally specifies the function to parse the values of a data field with, for fields not
+                        listed `parsing.parse_value` is used
     """
     if isinstance(data_model, DataModel):
         data_model_instance_values: List[Union[DataModelInstance, DataSectionInstance, DataFieldValue, None]] = [
@@ -261,7 +567,8 @@ def load_hierarchical_data_recursive(
                 data_model=f,
                 resources=resources,
                 compliance=compliance,
-                mapping=mapping
+                mapping=mapping,
+                value_parsers=value_parsers,
             )
             for f in data_model.fields
         ]
@@ -277,6 +584,7 @@ def load_hierarchical_data_recursive(
                 resources=resources,
                 compliance=compliance,
                 mapping=mapping,
+                value_parsers=value_parsers,
             )
             for f in data_section.fields
         ])
@@ -302,7 +610,10 @@ def load_hierarchical_data_recursive(
                 return None
 
             value_str = str(dict_value)
-            value = parsing.parse_value(value_str=value_str, resources=resources, compliance=compliance)
+            if value_parsers and data_field in value_parsers:
+                value = value_parsers[data_field](value_str)
+            else:
+                value = parsing.parse_value(value_str=value_str, resources=resources, compliance=compliance)
             data_field_value = DataFieldValue(
                 id=str(loaded_data_instance_identifier) + ":" + keys_str,
                 field=data_field,
@@ -326,38 +637,190 @@ def load_hierarchical_dataset(
         file_extension: Literal['csv', 'xlsx', 'json', 'xml'] = None,
         compliance: Literal['lenient', 'strict'] = 'lenient',
         mapping: Dict[DataField, str] = None,
-):
+        lazy: bool = False,
+        schema_directed: bool = False,
+        validate: Literal['eager', 'deferred', 'off'] = 'eager',
+        diagnostics: Diagnostics = None,
+        workers: int = None,
+        batch_size: int = 64,
+        max_in_flight: int = None,
+) -> DataSet:
+    """Loads a dataset from one or multiple hierarchical files using a DataModel definition
+
+    If `workers` is given, the files of a directory or list of files are parsed and turned into `DataModelInstance`
+    objects in a pool of `workers` processes, `batch_size` files at a time. At most `max_in_flight` batches are being
+    processed at once, and the instances are in the same order as when loading the files one by one. The problems found
+    in the worker processes are collected and reported to `diagnostics`, or, if it is not given, summarised in a single
+    warning once all files have been loaded.
+
+    :param file: file, list of files or directory to load data from
+    :param data_model: DataModel to use for reading the files
+    :param file_extension: file extension of the files
+    :param compliance: Compliance level to enforce when reading the files. If 'lenient', the files can have extra
+                        fields that are not in the DataModel. If 'strict', the files must have all fields in the
+                        DataModel.
+    :param mapping: specifies the mapping from data fields present in the data model to ids of fields in the data
+    :param lazy: If True, the `DataModelInstance` objects are only created while iterating over the returned `DataSet`
+    :param schema_directed: If True, the values of each field are only parsed as the kinds of values allowed by the
+                        `ValueSet` of the field (see `parsing.get_value_parser`) instead of trying every kind of value.
+    :param validate: When to validate the data. If 'eager', every `DataModelInstance` is validated when it is created.
+                        If 'deferred', the whole dataset is validated at once by `DataSet.validate` after loading (for
+                        a lazy dataset, only when `DataSet.validate` is called). If 'off', the data is not validated.
+    :param diagnostics: If given, problems found while parsing and validating the data are reported to it instead of
+                        printing or issuing a warning for each of them.
+    :param workers: If given, the files are loaded in a pool of this many worker processes
+    :param batch_size: Number of files sent to a worker process at a time
+    :param max_in_flight: Maximum number of batches submitted to the worker processes at once, defaults to twice the
+                        number of workers
+    """
+    _check_validate(validate)
     if not mapping:
         raise AttributeError(f"Parameter 'mapping' must not be empty or None. {mapping=}, {type(mapping)=}")
 
     if not data_model.is_hierarchical:
         warnings.warn("This method is only for loading hierarchical data, it may behave unexpectedly for tabular data.")
 
-    data_reader = DataReader(file, file_extension=file_extension)
-    data, data_iterable = data_reader.data, data_reader.iterable
+    if workers is not None:
+        files, file_extension = _list_hierarchical_files(file, file_extension)
+        worker_args = (data_model, file_extension, compliance, mapping, schema_directed, validate == 'eager')
+
+        def iter_instances() -> Iterator[DataModelInstance]:
+            collected = diagnostics if diagnostics is not None else Diagnostics()
+            for instances, worker_diagnostics in ordered_parallel_map(
+                    _load_hierarchical_batch,
+                    batched(enumerate(files), batch_size),
+                    workers=workers,
+                    initializer=_init_hierarchical_worker,
+                    initargs=worker_args,
+                    max_in_flight=max_in_flight,
+            ):
+                collected.merge(worker_diagnostics)
+                for instance in instances:  # share the data model of the main process instead of a copy per batch
+                    yield DataModelInstance(id=instance.id, data_model=data_model, values=instance.values,
+                                            compliance=instance.compliance, validate_on_init=False)
+            if diagnostics is None and collected.total > 0:
+                warnings.warn(f"Problems found while loading the data in worker processes.\n{collected}")
+
+        count = files.__len__
+    else:
+        data_iterable = DataReader(file, file_extension=file_extension).iterable
+        value_parsers = _get_hierarchical_value_parsers(
+            mapping, data_model.resources, compliance, schema_directed, diagnostics
+        )
+
+        def iter_instances() -> Iterator[DataModelInstance]:
+            for i, data_instance in enumerate(data_iterable):
+                yield _load_hierarchical_instance(
+                    i, data_instance, data_model, compliance, mapping, value_parsers, validate == 'eager', diagnostics
+                )
+
+        count = data_iterable.__len__
 
     # assembling data model instances
-    data_model_instances = []
+    if lazy:
+        data_model_instances = LazyDataModelInstances(load=iter_instances, count=count)
+    else:
+        data_model_instances = list(iter_instances())
 
-    for i, data_instance in enumerate(data_iterable):
-        instance_identifier = str(i)  # TODO: give instances identifiers based on file names if available
-        data_model_instances.append(
-            DataModelInstance(
-                id=instance_identifier,
-                data_model=data_model,
-                values=tuple(filter(lambda x: x is not None, list(load_hierarchical_data_recursive(
-                    loaded_data_instance_identifier=instance_identifier,
-                    loaded_data_instance=data_instance,
-                    data_model=data_model,
-                    resources=data_model.resources,
-                    compliance=compliance,
-                    mapping=mapping
-                )))),
-                compliance=compliance,
-            )
-        )
+    return _validate_deferred(
+        DataSet(data_model=data_model, data=data_model_instances), validate, compliance, diagnostics
+    )
 
-    return DataSet(data_model=data_model, data=data_model_instances)
+
+def _load_hierarchical_instance(
+        i: int,
+        data_instance: Dict,
+        data_model: DataModel,
+        compliance: Literal['lenient', 'strict'],
+        mapping: Dict[DataField, str],
+        value_parsers: Dict[DataField, Callable[[str], Any]],
+        validate_on_init: bool,
+        diagnostics: Optional[Diagnostics],
+) -> DataModelInstance:
+    """Helper method for `load_hierarchical_dataset`, turns the contents of the `i`-th file into a `DataModelInstance`"""
+    instance_identifier = str(i)  # TODO: give instances identifiers based on file names if available
+    return _new_instance(
+        validate_on_init,
+        diagnostics,
+        id=instance_identifier,
+        data_model=data_model,
+        values=tuple(filter(lambda x: x is not None, list(load_hierarchical_data_recursive(
+            loaded_data_instance_identifier=instance_identifier,
+            loaded_data_instance=data_instance,
+            data_model=data_model,
+            resources=data_model.resources,
+            compliance=compliance,
+            mapping=mapping,
+            value_parsers=value_parsers,
+        )))),
+        compliance=compliance,
+    )
+
+
+def _list_hierarchical_files(
+        file: Union[str, Path, List[str], List[Path], List[IOBase]],
+        file_extension: Optional[str],
+) -> Tuple[List[Path], str]:
+    """Lists the files to load in parallel by `load_hierarchical_dataset` without reading them"""
+    if isinstance(file, (str, Path)) and Path(file).is_dir():
+        files, found_extension = DataReader.list_directory(Path(file))
+        file_extension = file_extension or found_extension
+    elif isinstance(file, list) and all(isinstance(f, (str, Path)) for f in file):
+        files = [Path(f) for f in file]
+        if file_extension is None:
+            raise ValueError("File extension must be provided when loading a list of files.")
+    else:
+        raise ValueError("Loading in parallel is only supported for a directory or a list of file paths.")
+
+    file_extension = file_extension.lower()
+    if file_extension not in ('json', 'xml'):
+        raise ValueError(f"File extension {file_extension} not supported for reading multiple files.")
+    return files, file_extension
+
+
+_worker_state: Optional[Dict[str, Any]] = None
+
+
+def _init_hierarchical_worker(
+        data_model: DataModel,
+        file_extension: Literal['json', 'xml'],
+        compliance: Literal['lenient', 'strict'],
+        mapping: Dict[DataField, str],
+        schema_directed: bool,
+        validate_on_init: bool,
+):
+    global _worker_state
+    diagnostics = Diagnostics()  # warnings issued in a worker process would not reach the caller
+    _worker_state = dict(
+        data_model=data_model,
+        read=read_json if file_extension == 'json' else read_xml,
+        compliance=compliance,
+        mapping=mapping,
+        value_parsers=_get_hierarchical_value_parsers(
+            mapping, data_model.resources, compliance, schema_directed, diagnostics
+        ),
+        validate_on_init=validate_on_init,
+        diagnostics=diagnostics,
+    )
+
+
+def _load_hierarchical_batch(
+        batch: List[Tuple[int, Path]],
+) -> Tuple[List[DataModelInstance], Diagnostics]:
+    """Loads a batch of files in a worker process, returning the instances and the problems found while loading them"""
+    state = _worker_state
+    diagnostics = state['diagnostics']
+    instances = [
+        _load_hierarchical_instance(
+            i, state['read'](path), state['data_model'], state['compliance'], state['mapping'],
+            state['value_parsers'], state['validate_on_init'], diagnostics,
+        )
+        for i, path in batch
+    ]
+    batch_diagnostics = Diagnostics(max_examples=diagnostics.max_examples)
+    batch_diagnostics.merge(diagnostics)
+    diagnostics.clear()
+    return instances, batch_diagnostics
 
 
 def load_hierarchical_data(
@@ -367,6 +830,7 @@ def load_hierarchical_data(
         file_extension: Literal['csv', 'xlsx', 'json', 'xml'] = None,
         compliance: Literal['lenient', 'strict'] = 'lenient',
         mapping: Dict[DataField, str] = None,
+        schema_directed: bool = False,
 ):
     """
     Loads hierarchical single data from one hierarchical file using a DataModel definition
@@ -378,7 +842,8 @@ def load_hierarchical_data(
     :param compliance: Compliance level to enforce when reading the file. If 'lenient', the file can have extra fields
                         that are not in the DataModel. If 'strict', the file must have all fields in the DataModel.
     :param mapping: specifies the mapping from data fields present in the data model to ids of fields in the data
-
+    :param schema_directed: If True, the values of each field are only parsed as the kinds of values allowed by the
+                        `ValueSet` of the field (see `parsing.get_value_parser`) instead of trying every kind of value.
     """
     if not mapping:
         raise AttributeError(f"Parameter 'mapping' must not be empty or None. {mapping=}, {type(mapping)=}")
@@ -403,7 +868,27 @@ def load_hierarchical_data(
             data_model=data_model,
             resources=data_model.resources,
             compliance=compliance,
-            mapping=mapping
+            mapping=mapping,
+            value_parsers=_get_hierarchical_value_parsers(mapping, data_model.resources, compliance, schema_directed),
         )))),
         compliance=compliance,
     )
+
+
+def _get_hierarchical_value_parsers(
+        mapping: Dict[DataField, str],
+        resources: Tuple[CodeSystem, ...],
+        compliance: Literal['lenient', 'strict'],
+        schema_directed: bool,
+        diagnostics: Diagnostics = None,
+) -> Optional[Dict[DataField, Callable[[str], Any]]]:
+    """Returns the functions to parse the values of the mapped fields with, if `schema_directed` is True or problems
+    are reported to `diagnostics`"""
+    if not schema_directed and diagnostics is None:
+        return None
+    return {
+        data_field: _get_value_parser(
+            data_field, resources, compliance, schema_directed, _scoped(diagnostics, data_field.id)
+        )
+        for data_field in mapping.keys()
+    }
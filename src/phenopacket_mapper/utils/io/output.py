@@ -1,6 +1,6 @@
 import os
 from pathlib import Path
-from typing import List, Union
+from typing import List, Union, Iterable
 
 from google.protobuf.json_format import MessageToJson
 from phenopackets.schema.v2 import Phenopacket
@@ -14,11 +14,29 @@ def write(
     :param phenopackets_list: The list of phenopackets.
     :param out_dir: The output directory.
     """
+    write_iter(phenopackets_list, out_dir)
+
+
+def write_iter(
+        phenopackets: Iterable[Phenopacket], out_dir: Union[str, Path]
+) -> int:
+    """Writes phenopackets to JSON files while consuming an iterable of phenopackets.
+
+    Every phenopacket is written as soon as it is produced, so e.g. the iterator returned by
+    `PhenopacketMapper.map_iter` can be written without holding all phenopackets in memory.
+
+    :param phenopackets: The phenopackets, e.g. as a generator.
+    :param out_dir: The output directory.
+    :return: The number of phenopackets written.
+    """
     # Make sure output out_dr exists.
     os.makedirs(out_dir, exist_ok=True)
 
-    for phenopacket in phenopackets_list:
+    n = 0
+    for phenopacket in phenopackets:
         _write_single_phenopacket(phenopacket, out_dir)
+        n += 1
+    return n
 
 
 def _write_single_phenopacket(
@@ -0,0 +1,71 @@
+import os
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, Future
+from contextlib import nullcontext
+from itertools import islice
+from typing import Iterable, Iterator, List, Callable, Any, Tuple, TypeVar, Deque
+
+T = TypeVar('T')
+
+
+def batched(iterable: Iterable[T], n: int) -> Iterator[List[T]]:
+    """Splits an iterable into lists of length `n`, the last list may be shorter
+
+    >>> list(batched(range(5), 2))
+    [[0, 1], [2, 3], [4]]
+
+    :param iterable: the iterable to split
+    :param n: the size of the batches
+    :return: an iterator over the batches
+    """
+    if n < 1:
+        raise ValueError(f"Parameter n must be a positive integer. (Not: {n})")
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, n)):
+        yield batch
+
+
+def ordered_parallel_map(
+        fn: Callable[[T], Any],
+        items: Iterable[T],
+        workers: int = None,
+        initializer: Callable = None,
+        initargs: Tuple = (),
+        max_in_flight: int = None,
+        executor: Executor = None,
+) -> Iterator[Any]:
+    """Applies `fn` to every item in a process pool and yields the results in the order of `items`
+
+    In contrast to :meth:`ProcessPoolExecutor.map`, `items` is consumed lazily: at most `max_in_flight` items are
+    submitted to the pool at any time, so a lazily evaluated `items` is never held in memory completely.
+
+    `fn`, the items and the results have to be picklable. State that is the same for every item (e.g. a mapping
+    definition) should be shipped to the workers once using `initializer` and `initargs`.
+
+    :param fn: module level function to apply to every item
+    :param items: the items to process
+    :param workers: number of worker processes, defaults to the number of CPUs
+    :param initializer: called once in every worker process with `initargs`
+    :param initargs: arguments passed to `initializer`
+    :param max_in_flight: maximum number of submitted but not yet yielded items, defaults to twice the number of workers
+    :param executor: an existing pool to submit the items to instead of starting a new one, e.g. to share one pool
+                     across several calls. It is not shut down and `initializer` and `initargs` are ignored.
+    :return: an iterator over the results
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if max_in_flight is None:
+        max_in_flight = 2 * workers
+
+    if executor is None:
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=initializer, initargs=initargs)
+    else:
+        pool = nullcontext(executor)
+    with pool as executor:
+        in_flight: Deque[Future] = deque()
+        for item in items:
+            in_flight.append(executor.submit(fn, item))
+            if len(in_flight) >= max_in_flight:
+                yield in_flight.popleft().result()
+        while in_flight:
+            yield in_flight.popleft().result()
@@ -1,21 +1,25 @@
 """This module contains utility functions concerning the parsing of strings to python values"""
 
+from .coding_parser import CodingParser, get_coding_parser
 from .get_codesystem_by_namespace_prefix import get_codesystem_by_namespace_prefx
 from .parse_data_type import parse_data_type, parse_single_data_type
 from .parse_ordinal import parse_ordinal
 from .parse_primitive_data_value import parse_primitive_data_value, parse_int, parse_float, parse_bool
-from .parse_date import parse_date
+from .parse_date import parse_date, parse_dates, DateFormatCache
 from .parse_coding import parse_coding
-from .parse_value import parse_value
+from .parse_value import parse_value, parse_value_cache_info, clear_parse_value_cache
 from .parse_value_set import parse_value_set
+from .get_value_parser import get_value_parser
 
 __all__ = [
     "parse_data_type", "parse_single_data_type",
     "parse_ordinal",
     "parse_primitive_data_value", "parse_int", "parse_float", "parse_bool",
-    "parse_date",
+    "parse_date", "parse_dates", "DateFormatCache",
     "parse_coding",
-    "parse_value",
+    "parse_value", "parse_value_cache_info", "clear_parse_value_cache",
     "get_codesystem_by_namespace_prefx",
+    "CodingParser", "get_coding_parser",
     "parse_value_set",
+    "get_value_parser",
 ]
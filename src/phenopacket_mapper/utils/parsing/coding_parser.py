@@ -0,0 +1,130 @@
+import re
+from typing import Dict, Iterable, Literal, Optional, Tuple, Union
+
+from phenopacket_mapper.data_standards import Coding, CodeSystem, intern_coding, intern_code_system
+from phenopacket_mapper.utils.diagnostics import Diagnostics
+
+
+class CodingParser:
+    """Parses strings representing codings, constructed once for a collection of resources
+
+    In contrast to `parse_coding`, which searches all resources for every string it parses, the `CodingParser` holds a
+    precompiled pattern and a table from the lowercase name space prefixes, names and synonyms of the resources to the
+    respective `CodeSystem`. Parsing a coding is therefore a single dictionary lookup. The codings it returns are
+    interned, see `intern_coding`, so repeated codes share the same object.
+
+    E.g.:
+    >>> from phenopacket_mapper.data_standards import SNOMED_CT
+    >>> coding_parser = CodingParser([SNOMED_CT])
+    >>> coding_parser.parse("SNOMED:404684003")
+    Coding(system=CodeSystem(name=SNOMED CT, name space prefix=SNOMED, version=0.0.0), code='404684003', display='', text='')
+    >>> coding_parser.get_code_system("sct")
+    CodeSystem(name=SNOMED CT, name space prefix=SNOMED, version=0.0.0)
+
+    If several resources share a name space prefix, name or synonym, the first of them is used, like in
+    `get_codesystem_by_namespace_prefx`.
+
+    :ivar resources: The resources recognized by the parser
+    """
+    PATTERN = re.compile(r'^(.*?):(.*)$')
+
+    __slots__ = ('resources', '_code_systems')
+
+    def __init__(self, resources: Iterable[CodeSystem]):
+        self.resources: Tuple[CodeSystem, ...] = tuple(map(intern_code_system, resources)) if resources else ()
+        self._code_systems: Dict[str, CodeSystem] = dict()
+        for res in self.resources:
+            for name in (res.namespace_prefix, res.name, *res.synonyms):
+                self._code_systems.setdefault(name.lower(), res)
+
+    def get_code_system(self, namespace_prefix_str: str) -> Optional[CodeSystem]:
+        """Returns the `CodeSystem` whose name space prefix, name or synonym matches the string, or None if none does
+
+        :param namespace_prefix_str: The namespace prefix string to match, case-insensitive
+        :return: The CodeSystem object that matches the namespace prefix string, or None if no match is found
+        """
+        return self._code_systems.get(namespace_prefix_str.lower())
+
+    def parse(
+            self,
+            coding_str: str,
+            compliance: Literal['lenient', 'strict'] = 'lenient',
+            diagnostics: Diagnostics = None,
+    ) -> Coding:
+        """Parses a string representing a coding to a Coding object, see `parse_coding`
+
+        :param coding_str: a string representing a coding
+        :param compliance: whether to throw a ValueError or just a warning if a name space prefix is not found in the
+        resources
+        :param diagnostics: If given, unknown name space prefixes are reported to it instead of printing a warning
+        :return: a Coding object as specified in the coding string
+        """
+        coding_str = coding_str.replace(" ", "")
+
+        if ':' not in coding_str:
+            raise ValueError("Invalid coding string, does not contain separator between code and name space prefix: "
+                             f"{coding_str}")
+
+        match = self.PATTERN.match(coding_str)
+
+        if match:
+            namespace_prefix = match.group(1)  # Part before the colon
+            code = match.group(2)  # Part after the colon
+
+            code_system = self.get_code_system(namespace_prefix)
+
+            if code_system:
+                return intern_coding(system=code_system, code=code)
+            else:
+                if compliance == 'strict':
+                    raise ValueError(f"Code system with namespace prefix '{namespace_prefix}' not found in resources.")
+                else:
+                    coding = intern_coding(system=namespace_prefix, code=code)
+                    if diagnostics is None:
+                        print(f"Warning: Code system with namespace prefix '{namespace_prefix}' not found in "
+                              f"resources.")
+                        print(f"Warning: Returning Coding object with system as namespace prefix and code as '{code}'")
+                    else:
+                        diagnostics.report('unknown_code_system', namespace_prefix)
+                    return coding
+
+        else:
+            raise ValueError(f"Invalid coding string: {coding_str}")
+
+
+_coding_parsers: Dict[int, Tuple[Iterable[CodeSystem], CodingParser]] = dict()
+_MAX_CODING_PARSERS = 64
+
+
+def get_coding_parser(resources: Union[Iterable[CodeSystem], CodingParser]) -> CodingParser:
+    """Returns a `CodingParser` for the resources, reusing the parser built for the same resources before
+
+    Parsers are reused as long as `resources` is the same object and, unless it is a tuple, still contains the same
+    code systems. If `resources` already is a `CodingParser`, it is returned as is.
+
+    :param resources: the resources the parser should recognize
+    :return: a `CodingParser` for `resources`
+    """
+    if isinstance(resources, CodingParser):
+        return resources
+
+    entry = _coding_parsers.get(id(resources))
+    if entry is not None:
+        cached_resources, coding_parser = entry
+        if cached_resources is resources and (
+                isinstance(resources, tuple) or _same_code_systems(coding_parser.resources, resources)
+        ):
+            return coding_parser
+
+    coding_parser = CodingParser(resources)
+    if len(_coding_parsers) >= _MAX_CODING_PARSERS:
+        _coding_parsers.clear()
+    _coding_parsers[id(resources)] = (resources, coding_parser)
+    return coding_parser
+
+
+def _same_code_systems(code_systems: Tuple[CodeSystem, ...], resources: Iterable[CodeSystem]) -> bool:
+    resources = tuple(resources) if resources else ()
+    return len(code_systems) == len(resources) and all(
+        a is intern_code_system(b) for a, b in zip(code_systems, resources)
+    )
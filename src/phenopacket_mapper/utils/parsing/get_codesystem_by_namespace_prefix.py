@@ -1,6 +1,7 @@
 from typing import List, Optional
 
 from phenopacket_mapper.data_standards import CodeSystem
+from phenopacket_mapper.utils.parsing.coding_parser import get_coding_parser
 
 
 def get_codesystem_by_namespace_prefx(namespace_prefix_str: str, resources: List[CodeSystem]) -> Optional[CodeSystem]:
@@ -11,8 +12,4 @@ def get_codesystem_by_namespace_prefx(namespace_prefix_str: str, resources: List
     :param resources: The list of CodeSystem objects to search through
     :return: The CodeSystem object that matches the namespace prefix string, or None if no match is found
     """
-    if resources:
-        for res in resources:
-            potential_matches = [res.namespace_prefix.lower(), res.name.lower(), *(s.lower() for s in res.synonyms)]
-            if namespace_prefix_str.lower() in potential_matches:
-                return res
+    return get_coding_parser(resources).get_code_system(namespace_prefix_str)
@@ -0,0 +1,102 @@
+from typing import Literal, Tuple, Callable, Any, List
+
+from phenopacket_mapper.data_standards import CodeSystem, Coding, CodeableConcept, Date
+from phenopacket_mapper.utils.parsing import parse_int, parse_float, parse_bool, parse_date, parse_value
+from phenopacket_mapper.utils.parsing.coding_parser import CodingParser
+from phenopacket_mapper.utils.diagnostics import Diagnostics
+from phenopacket_mapper.utils.parsing.parse_date import DateFormatCache
+
+
+def get_value_parser(
+        specification,
+        resources: Tuple[CodeSystem, ...],
+        compliance: Literal['strict', 'lenient'] = 'lenient',
+        date_format_cache: DateFormatCache = None,
+        diagnostics: Diagnostics = None,
+) -> Callable[[str], Any]:
+    """Returns a function parsing strings to values, specialised to the specification of a `DataField`
+
+    `parse_value` tries to parse a string as every possible kind of value in turn. Given the `ValueSet` of a
+    `DataField`, most of these attempts are known to be doomed. The returned function only tries to parse the kinds of
+    values allowed by the value set, in the same order as `parse_value`. Only if none of them succeeds or if the value
+    set allows `Any` value, it falls back on `parse_value`.
+
+    E.g.:
+    >>> get_value_parser([int], resources=())("2024")
+    2024
+    >>> parse_value("2024", resources=())
+    2024-00-00T00:00:00Z
+
+    :param specification: the value set (or list of types) of the `DataField`
+    :param resources: List of CodeSystems to use for parsing the values
+    :param compliance: Compliance level for parsing the values
+    :param date_format_cache: remembers the format of the dates parsed by the returned function, a new cache is created
+                              if not given
+    :param diagnostics: If given, values that could not be parsed are reported to it instead of printing a warning
+    :return: function parsing a string to a value
+    """
+    def generic(value_str: str) -> Any:
+        return parse_value(value_str=value_str, resources=resources, compliance=compliance, diagnostics=diagnostics)
+
+    try:
+        elements = tuple(specification)
+    except TypeError:
+        return generic
+
+    if not elements or Any in elements:
+        return generic
+
+    allowed = set()
+    for e in elements:
+        if isinstance(e, CodeSystem) or e in (Coding, CodeableConcept) or isinstance(e, (Coding, CodeableConcept)):
+            allowed.add(Coding)
+        elif isinstance(e, type):
+            if e not in (Date, int, float, bool, str):
+                return generic
+            allowed.add(e)
+        else:  # literal value, allow values of its type
+            allowed.add(type(e) if type(e) in (Date, int, float, bool, str) else Any)
+
+    if Any in allowed:
+        return generic
+
+    parsers: List[Callable[..., Any]] = []
+    parse_date_value = None
+    if Date in allowed:
+        if date_format_cache is None:
+            date_format_cache = DateFormatCache()
+
+        def parse_date_value(s: str, date_diagnostics: Diagnostics = None) -> Date:
+            return parse_date(date_str=s, compliance='strict', format_cache=date_format_cache,
+                              diagnostics=date_diagnostics)
+        parsers.append(parse_date_value)
+    if Coding in allowed:
+        coding_parser = CodingParser(resources)
+        parsers.append(lambda s: coding_parser.parse(s, compliance='strict'))
+    if int in allowed:
+        parsers.append(parse_int)
+    if float in allowed:
+        parsers.append(parse_float)
+    if bool in allowed:
+        parsers.append(parse_bool)
+    if str in allowed:
+        parsers.append(lambda s: s)
+
+    def parse(value_str: str) -> Any:
+        value_str = value_str.strip()
+        # problems found parsing dates are only reported if another parser succeeds, `generic` reports them itself
+        pending = Diagnostics() if diagnostics is not None and parse_date_value is not None else None
+        for parser in parsers:
+            try:
+                value = parser(value_str, pending) if parser is parse_date_value else parser(value_str)
+            except ValueError:
+                continue
+            if value is not None:
+                if pending is not None:
+                    for (kind, _), examples in pending.examples.items():
+                        for example in examples:
+                            diagnostics.report(kind, example)
+                return value
+        return generic(value_str)
+
+    return parse
@@ -1,7 +1,8 @@
 from typing import List, Union, Any, Literal
 
 from phenopacket_mapper.data_standards import CodeSystem, Date
-from phenopacket_mapper.utils.parsing import get_codesystem_by_namespace_prefx
+from phenopacket_mapper.utils.diagnostics import Diagnostics
+from phenopacket_mapper.utils.parsing.coding_parser import CodingParser, get_coding_parser
 
 PRIMITIVE_DATATYPE_SYNONYMS = {
     str: ["str", "string"],
@@ -12,11 +13,16 @@ PRIMITIVE_DATATYPE_SYNONYMS = {
            "yyyy-mm", "yyyy/mm", "yyyy.mm", "mm.yyyy", "mm-yyyy", "mm/yyyy", "yyyy", "yyyy-mm-dd hh:mm:ss", "iso8601"]
 }
 
+_PRIMITIVE_DATATYPES_BY_SYNONYM = {
+    syn.lower(): type_ for type_, synonyms in reversed(PRIMITIVE_DATATYPE_SYNONYMS.items()) for syn in synonyms
+}
+
 
 def parse_data_type(
         type_str: str,
         resources: List[CodeSystem],
-        compliance: Literal['lenient', 'strict'] = 'lenient'
+        compliance: Literal['lenient', 'strict'] = 'lenient',
+        diagnostics: Diagnostics = None,
 ) -> List[Union[Any, CodeSystem, type, str]]:
     """Parses a string representing of one or multiple data types or code systems to a list of `type` in Python
 
@@ -37,6 +43,7 @@ def parse_data_type(
     :param type_str:
     :param resources:
     :param compliance:
+    :param diagnostics: If given, unrecognized data types are reported to it instead of printing a warning
     :return:
     """
     if not type_str or not type_str.strip():  # checks for all sorts of empty strings, with however many white spaces
@@ -45,7 +52,9 @@ def parse_data_type(
     single_type_strings = type_str.split(',')
     types = []
     for single in single_type_strings:
-        types.append(parse_single_data_type(type_str=single, resources=resources, compliance=compliance))
+        types.append(parse_single_data_type(
+            type_str=single, resources=resources, compliance=compliance, diagnostics=diagnostics
+        ))
 
     if not types:
         return [Any]
@@ -55,8 +64,9 @@ def parse_data_type(
 
 def parse_single_data_type(
         type_str: str,
-        resources: List[CodeSystem],
-        compliance: Literal['lenient', 'strict'] = 'lenient'
+        resources: Union[List[CodeSystem], CodingParser],
+        compliance: Literal['lenient', 'strict'] = 'lenient',
+        diagnostics: Diagnostics = None,
 ) -> Union[Any, CodeSystem, type, str]:
     """Parses a string representing a data type to the `type` in Python
 
@@ -65,26 +75,29 @@ def parse_single_data_type(
     <class 'phenopacket_mapper.data_standards.date.Date'>
 
     :param type_str:
-    :param resources:
+    :param resources: the resources to look the type up in, or a `CodingParser` already built for them
     :param compliance:
+    :param diagnostics: If given, unrecognized data types are reported to it instead of printing a warning
     :return:
     """
     type_str = type_str.strip()
 
-    code_system = get_codesystem_by_namespace_prefx(namespace_prefix_str=type_str, resources=resources)
+    code_system = get_coding_parser(resources).get_code_system(type_str)
 
     if code_system:
         return code_system
 
-    for type_ in PRIMITIVE_DATATYPE_SYNONYMS.keys():
-        for syn in PRIMITIVE_DATATYPE_SYNONYMS[type_]:
-            if syn.lower() == type_str.lower():
-                return type_
+    type_ = _PRIMITIVE_DATATYPES_BY_SYNONYM.get(type_str.lower())
+    if type_ is not None:
+        return type_
 
     # if nothing has matched
     if compliance == 'lenient':
-        print(f"Warning: The type {type_str} could not be parsed to a type or resource. If it refers to a resource,"
-              f" please add it to the list of resources. Otherwise, check your file.")
+        if diagnostics is None:
+            print(f"Warning: The type {type_str} could not be parsed to a type or resource. If it refers to a resource,"
+                  f" please add it to the list of resources. Otherwise, check your file.")
+        else:
+            diagnostics.report('unknown_data_type', type_str)
         return type_str
     else:
         raise ValueError(f"No matching data types or resources could be found for '{type_str}'")
@@ -1,15 +1,118 @@
 import warnings
 from datetime import datetime
-from typing import Literal, Dict, Tuple, Optional
+from typing import Literal, Dict, Tuple, Optional, List, Callable, Any
+
+import pandas as pd
 
 from phenopacket_mapper.data_standards import Date
+from phenopacket_mapper.utils.diagnostics import Diagnostics
 from phenopacket_mapper.utils.parsing import parse_int
 
+# Date formats recognized by `parse_dates`, with the units of time they contain
+_COLUMN_DATE_FORMATS: Tuple[Tuple[str, str], ...] = (
+    ("%Y-%m-%dT%H:%M:%SZ", "ymdHMS"),
+    ("%Y-%m-%d %H:%M:%S", "ymdHMS"),
+    ("%Y-%m-%d", "ymd"),
+    ("%Y/%m/%d", "ymd"),
+    ("%d/%m/%Y", "ymd"),
+    ("%m/%d/%Y", "ymd"),
+    ("%d.%m.%Y", "ymd"),
+    ("%d-%m-%Y", "ymd"),
+    ("%m-%d-%Y", "ymd"),
+    ("%Y-%m", "ym"),
+    ("%Y/%m", "ym"),
+    ("%Y.%m", "ym"),
+    ("%m.%Y", "ym"),
+    ("%m-%Y", "ym"),
+    ("%m/%Y", "ym"),
+    ("%Y", "y"),
+)
+
+
+class DateFormatCache:
+    """Remembers the date format that last succeeded in parsing a date string of a column or `DataField`
+
+    Passed to `parse_date`, the learned format is tried first and formats have to be discovered only when it does not
+    match. Since all values of a column usually share the same format, this amortises the cost of the format detection.
+    Note that, like `parse_dates`, ambiguous dates are interpreted consistently with the learned format, e.g. after
+    parsing 12/31/2024, 01/02/2024 is parsed as January 2nd.
+
+    The cache also keeps statistics on its hit rate and on the number of dates where it was unclear whether the day or
+    the month comes first.
+
+    E.g.:
+    >>> cache = DateFormatCache()
+    >>> parse_date("24.12.2024", format_cache=cache)
+    2024-12-24T00:00:00Z
+    >>> parse_date("31.12.2024", format_cache=cache)
+    2024-12-31T00:00:00Z
+    >>> cache.format, cache.hits, cache.misses
+    ('%d.%m.%Y', 1, 1)
+    """
+    __slots__ = ('format', 'units', 'hits', 'misses', 'ambiguous', 'ambiguous_examples')
+
+    #: the maximum number of ambiguous date strings kept as examples
+    MAX_EXAMPLES = 10
+
+    def __init__(self):
+        self.format: Optional[str] = None
+        self.units: Optional[str] = None
+        self.hits = 0
+        self.misses = 0
+        self.ambiguous = 0
+        self.ambiguous_examples: List[str] = []
+
+    @property
+    def hit_rate(self) -> float:
+        """Ratio of date strings parsed using the learned format"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def parse(self, date_str: str) -> Optional[Date]:
+        """Parses `date_str` using the learned format, returns None if no format was learned yet or it does not match"""
+        if self.format is not None:
+            try:
+                date = _datetime_to_date(datetime.strptime(date_str, self.format), self.units)
+            except ValueError:
+                pass
+            else:
+                self.hits += 1
+                return date
+        self.misses += 1
+        return None
+
+    def learn(self, date_str: str, date: Date, default_first: Literal["day", "month"] = "day") -> None:
+        """Learns the format of `date_str`, if it is in `_COLUMN_DATE_FORMATS` and parses to `date`"""
+        for fmt, units in _formats_by_preference(default_first):
+            try:
+                parsed = _datetime_to_date(datetime.strptime(date_str, fmt), units)
+            except ValueError:
+                continue
+            if parsed == date:
+                self.format, self.units = fmt, units
+                return
+
+    def record_ambiguous(self, date_str: str) -> None:
+        """Records that it was unclear whether the day or the month comes first in `date_str`"""
+        self.ambiguous += 1
+        if len(self.ambiguous_examples) < self.MAX_EXAMPLES:
+            self.ambiguous_examples.append(date_str)
+
+    def reset(self) -> None:
+        """Forgets the learned format and resets the statistics"""
+        self.__init__()
+
+    def __repr__(self) -> str:
+        return (f"DateFormatCache(format={self.format!r}, hits={self.hits}, misses={self.misses}, "
+                f"ambiguous={self.ambiguous})")
+
 
 def parse_date(
         date_str: str,
         default_first: Literal["day", "month"] = "day",
         compliance: Literal['lenient', 'strict'] = 'lenient',
+        format_cache: DateFormatCache = None,
+        diagnostics: Diagnostics = None,
 ) -> Optional[Date]:
     """Parse a date string into a Date object
 
@@ -25,8 +128,31 @@ def parse_date(
     :param date_str: the date string to parse
     :param default_first: the default unit to use if it is unclear which unit comes first between day and month
     :param compliance: the compliance level of the parser
+    :param format_cache: remembers the format of previously parsed date strings, see `DateFormatCache`
+    :param diagnostics: If given, ambiguous and unparsable dates are reported to it instead of printing a warning
     :return: the Date object created from the date string
     """
+    if format_cache is None:
+        return _parse_date(date_str, default_first, compliance, diagnostics=diagnostics)
+
+    if len(date_str) >= 4:
+        date = format_cache.parse(date_str)
+        if date is not None:
+            return date
+
+    date = _parse_date(date_str, default_first, compliance, format_cache, diagnostics)
+    if date is not None:
+        format_cache.learn(date_str, date, default_first)
+    return date
+
+
+def _parse_date(
+        date_str: str,
+        default_first: Literal["day", "month"] = "day",
+        compliance: Literal['lenient', 'strict'] = 'lenient',
+        format_cache: DateFormatCache = None,
+        diagnostics: Diagnostics = None,
+) -> Optional[Date]:
     separators = ['-', '/', '.']
     # check length
     if len(date_str) < 4:
@@ -73,19 +199,19 @@ def parse_date(
             if len(units[0]) == 4:
                 day, month = _wrapper__most_likely_date_and_month(
                     units[1], units[2],
-                    date_str, default_first, compliance
+                    date_str, default_first, compliance, format_cache, diagnostics
                 )
                 return Date(year=parse_int(units[0]), month=month, day=day)
             elif len(units[1]) == 4:
                 day, month = _wrapper__most_likely_date_and_month(
                     units[0], units[2],
-                    date_str, default_first, compliance
+                    date_str, default_first, compliance, format_cache, diagnostics
                 )
                 return Date(year=parse_int(units[1]), month=month, day=day)
             elif len(units[2]) == 4:
                 day, month = _wrapper__most_likely_date_and_month(
                     units[0], units[1],
-                    date_str, default_first, compliance
+                    date_str, default_first, compliance, format_cache, diagnostics
                 )
                 return Date(year=parse_int(units[2]), month=month, day=day)
 
@@ -93,16 +219,133 @@ def parse_date(
         if compliance == 'strict':
             raise ValueError(f"Invalid date string '{date_str}': no separators found")
         else:
-            warnings.warn(f"Invalid date string '{date_str}': could not be parsed, returning None")
+            if diagnostics is None:
+                warnings.warn(f"Invalid date string '{date_str}': could not be parsed, returning None")
+            else:
+                diagnostics.report('unparsable_date', date_str)
             return None
 
 
+def parse_dates(
+        dates: pd.Series,
+        default_first: Literal["day", "month"] = "day",
+        compliance: Literal['lenient', 'strict'] = 'lenient',
+        sample_size: int = 100,
+        fallback: Callable[[str], Any] = None,
+        diagnostics: Diagnostics = None,
+) -> pd.Series:
+    """Parse a whole column of date strings into Date objects
+
+    Instead of figuring out the format of every single date string like `parse_date`, the dominant format of the column
+    is detected once on a sample of its distinct values. All values are then parsed in bulk using
+    :func:`pd.to_datetime` with that format. Only values that do not match the format fall back on `parse_date`.
+
+    Because the format is inferred for the column as a whole, ambiguous values are interpreted consistently with the
+    rest of the column, e.g. 01/02/2024 is January 2nd if the column also contains 03/31/2024. Only if the sample does
+    not settle the question, `default_first` decides whether the day or the month comes first.
+
+    :param dates: the column of date strings to parse, missing values are returned as `None`
+    :param default_first: the default unit to use if it is unclear which unit comes first between day and month
+    :param compliance: the compliance level of the parser
+    :param sample_size: the number of distinct values used to detect the format of the column
+    :param fallback: function to parse values not matching the detected format with, defaults to `parse_date`
+    :param diagnostics: If given, the default fallback reports ambiguous and unparsable dates to it
+    :return: the Date objects created from the date strings, with the same index as `dates`
+    """
+    result = pd.Series([None] * len(dates), index=dates.index, dtype=object)
+    present = dates.notna()
+    if not present.any():
+        return result
+
+    date_strs = dates[present].astype(str).str.strip()
+    distinct = pd.Series(date_strs.unique())
+
+    parsed: Dict[str, Optional[Date]] = dict()
+    unparsed = distinct
+    fmt = _detect_date_format(distinct.head(sample_size), default_first=default_first)
+    if fmt is not None:
+        fmt, units = fmt
+        timestamps = pd.to_datetime(distinct, format=fmt, errors='coerce')
+        matched = timestamps.notna()
+        parsed.update(zip(distinct[matched], _timestamps_to_dates(timestamps[matched], units)))
+        unparsed = distinct[~matched]
+
+    if fallback is None:
+        def fallback(date_str: str) -> Optional[Date]:
+            return parse_date(date_str, default_first=default_first, compliance=compliance, diagnostics=diagnostics)
+
+    for date_str in unparsed:
+        parsed[date_str] = fallback(date_str)
+
+    result[present] = date_strs.map(parsed)
+    return result
+
+
+def _detect_date_format(
+        sample: pd.Series,
+        default_first: Literal["day", "month"] = "day",
+) -> Optional[Tuple[str, str]]:
+    """Returns the format in `_COLUMN_DATE_FORMATS` matching the most values in `sample`, or None if none matches
+
+    :param sample: sample of date strings
+    :param default_first: which unit to prefer if formats with the day and the month first match equally well
+    :return: the date format and the units of time it contains
+    """
+    best, best_matches = None, 0
+    for fmt, units in _formats_by_preference(default_first):  # on a tie, the format listed first wins
+        matches = pd.to_datetime(sample, format=fmt, errors='coerce').notna().sum()
+        if matches > best_matches:
+            best, best_matches = (fmt, units), matches
+    return best
+
+
+def _formats_by_preference(default_first: Literal["day", "month"] = "day") -> List[Tuple[str, str]]:
+    """Returns `_COLUMN_DATE_FORMATS`, putting the formats with the day first last if `default_first` is "month"
+    """
+    def is_day_first(fmt: str) -> bool:
+        return "%d" in fmt and fmt.index("%d") < fmt.index("%m")
+
+    formats = list(_COLUMN_DATE_FORMATS)
+    if default_first == "month":
+        formats.sort(key=lambda f: is_day_first(f[0]))
+    return formats
+
+
+def _datetime_to_date(dt: datetime, units: str) -> Date:
+    """Converts a parsed datetime to a Date object, leaving units of time not contained in the format at zero"""
+    return Date(
+        year=dt.year,
+        month=dt.month if "m" in units else 0,
+        day=dt.day if "d" in units else 0,
+        hour=dt.hour if "H" in units else 0,
+        minute=dt.minute if "M" in units else 0,
+        second=dt.second if "S" in units else 0,
+    )
+
+
+def _timestamps_to_dates(timestamps: pd.Series, units: str) -> List[Date]:
+    """Converts parsed timestamps to Date objects, leaving units of time not contained in the format at zero"""
+    zeros = [0] * len(timestamps)
+    years = timestamps.dt.year.tolist()
+    months = timestamps.dt.month.tolist() if "m" in units else zeros
+    days = timestamps.dt.day.tolist() if "d" in units else zeros
+    hours = timestamps.dt.hour.tolist() if "H" in units else zeros
+    minutes = timestamps.dt.minute.tolist() if "M" in units else zeros
+    seconds = timestamps.dt.second.tolist() if "S" in units else zeros
+    return [
+        Date(year=y, month=mo, day=d, hour=h, minute=mi, second=s)
+        for y, mo, d, h, mi, s in zip(years, months, days, hours, minutes, seconds)
+    ]
+
+
 def _wrapper__most_likely_date_and_month(
         str0: str,
         str1: str,
         full_date_str: str,
         default_first: Literal["day", "month"] = "day",
-        compliance: Literal['lenient', 'strict'] = 'lenient'
+        compliance: Literal['lenient', 'strict'] = 'lenient',
+        format_cache: DateFormatCache = None,
+        diagnostics: Diagnostics = None,
 ) -> Tuple[int, int]:
     """
     Wrapper for _return_most_likely_date_and_month that raises an error if the compliance is set to 'strict'
@@ -114,9 +357,18 @@ def _wrapper__most_likely_date_and_month(
     :param full_date_str: the full date string
     :param default_first: the default unit to use if it is unclear which unit comes first between day and month
     :param compliance: the compliance level of the parser
+    :param format_cache: if given, ambiguous dates are recorded in its statistics instead of being printed
+    :param diagnostics: if given, ambiguous dates are reported to it instead of being printed
     :return: the day and month from the most likely date and month from two strings
     """
-    result = _return_most_likely_date_and_month(str0, str1, full_date_str, default_first)
+    result = _return_most_likely_date_and_month(
+        str0, str1, full_date_str, default_first, warn=format_cache is None and diagnostics is None
+    )
+    if result['inference']:
+        if format_cache is not None:
+            format_cache.record_ambiguous(full_date_str)
+        if diagnostics is not None:
+            diagnostics.report('ambiguous_date', full_date_str)
     if result['inference'] and compliance == 'strict':
         raise ValueError(f"Invalid date string '{full_date_str}': unclear which unit of time is first")
     day = result['day']
@@ -128,7 +380,8 @@ def _return_most_likely_date_and_month(
         str0: str,
         str1: str,
         full_date_str: str,
-        default_first: Literal["day", "month"] = "day"
+        default_first: Literal["day", "month"] = "day",
+        warn: bool = True,
 ) -> Dict[str, int]:
     """
     Return the most likely date and month from two strings
@@ -138,6 +391,7 @@ def _return_most_likely_date_and_month(
 
     :param str0: the first string
     :param str1: the second string
+    :param warn: whether to print a warning if it is unclear which unit of time is first
     :return: the most likely day and month from the two strings
     """
     int0 = parse_int(str0)
@@ -153,8 +407,9 @@ def _return_most_likely_date_and_month(
     elif int0 <= 12 < int1:
         return {'day': int1, 'month': int0, 'inference': False}
     else:  # unclear which is which, fall back on default
-        print(f"WARNING: unclear which unit of time is first in date string: {full_date_str}, "
-              f"falling back on default: {default_first} for parsing date.")
+        if warn:
+            print(f"WARNING: unclear which unit of time is first in date string: {full_date_str}, "
+                  f"falling back on default: {default_first} for parsing date.")
         if default_first == "day":
             return {'day': int0, 'month': int1, 'inference': True}
         elif default_first == "month":
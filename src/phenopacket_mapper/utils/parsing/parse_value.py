@@ -1,13 +1,20 @@
-from typing import List, Literal, Union, Tuple
+from functools import lru_cache
+from typing import Any, List, Literal, Union, Tuple
 
 from phenopacket_mapper.data_standards import CodeSystem, Coding, CodeableConcept, Date
-from phenopacket_mapper.utils.parsing import parse_primitive_data_value, parse_date, parse_coding
+from phenopacket_mapper.utils.parsing import parse_primitive_data_value, parse_date
+from phenopacket_mapper.utils.diagnostics import Diagnostics
+from phenopacket_mapper.utils.parsing.coding_parser import get_coding_parser
+
+PARSE_VALUE_CACHE_SIZE = 2 ** 16
 
 
 def parse_value(
         value_str: str,
         resources: Tuple[CodeSystem, ...],
-        compliance: Literal['strict', 'lenient'] = 'lenient'
+        compliance: Literal['strict', 'lenient'] = 'lenient',
+        use_cache: bool = True,
+        diagnostics: Diagnostics = None,
 ) -> Union[Coding, CodeableConcept, CodeSystem, str, bool, int, float, Date, type]:
     """Parses a string representing a value to the appropriate type
     
@@ -18,28 +25,101 @@ def parse_value(
     3. Coding (`parse_coding`)
     4. String (if nothing else worked)
 
+    Data is often very repetitive, so by default the parsed values are kept in a least recently used cache of
+    `PARSE_VALUE_CACHE_SIZE` entries, keyed on the string, the identity of `resources`, the compliance and whether `diagnostics` is given. Repeated
+    strings are thus only parsed once and the same object is returned for them, which must therefore not be mutated.
+    Statistics on the cache are available via `parse_value_cache_info`.
+
     :param value_str: String representation of the value
     :param resources: List of CodeSystems to use for parsing the value
     :param compliance: Compliance level for parsing the value
+    :param use_cache: Whether to look up and store the parsed value in the cache
+    :param diagnostics: If given, values that could not be parsed and ambiguous dates are reported to it instead of
+                        printing a warning, also if the value is taken from the cache
     :return: The parsed value
     """
+    collect = diagnostics is not None
+    if use_cache:
+        value, parsed, events = _parse_value_cached(value_str, _ResourcesKey(resources), compliance, collect)
+    else:
+        value, parsed, events = _parse_value(value_str, resources, compliance, collect)
+
+    for kind, example in events:
+        diagnostics.report(kind, example)
+    if not parsed:
+        if diagnostics is None:
+            print(f"Warning: Could not parse value: {value}")
+        else:
+            diagnostics.report('unparsable_value', value)
+    return value
+
+
+def parse_value_cache_info():
+    """Returns the hits, misses, maximum size and current size of the cache used by `parse_value`"""
+    return _parse_value_cached.cache_info()
+
+
+def clear_parse_value_cache():
+    """Empties the cache used by `parse_value` and resets its statistics"""
+    _parse_value_cached.cache_clear()
+
+
+class _ResourcesKey:
+    """Hashable stand-in for the resources passed to `parse_value`, compares by identity
+
+    Holds a reference to the resources so their identity cannot be reused while they are in the cache.
+    """
+    __slots__ = ('resources',)
+
+    def __init__(self, resources):
+        self.resources = resources
+
+    def __hash__(self):
+        return id(self.resources)
+
+    def __eq__(self, other):
+        return isinstance(other, _ResourcesKey) and other.resources is self.resources
+
+
+@lru_cache(maxsize=PARSE_VALUE_CACHE_SIZE)
+def _parse_value_cached(
+        value_str: str,
+        resources_key: _ResourcesKey,
+        compliance: Literal['strict', 'lenient'],
+        collect: bool,
+) -> Tuple[Union[Coding, CodeableConcept, CodeSystem, str, bool, int, float, Date, type], bool, Tuple]:
+    return _parse_value(value_str, resources_key.resources, compliance, collect)
+
+
+def _parse_value(
+        value_str: str,
+        resources: Tuple[CodeSystem, ...],
+        compliance: Literal['strict', 'lenient'] = 'lenient',
+        collect: bool = False,
+) -> Tuple[Union[Coding, CodeableConcept, CodeSystem, str, bool, int, float, Date, type], bool, Tuple]:
+    """Parses a value like `parse_value`, also returns whether it could be parsed or is returned as is (lenient)
+
+    If `collect` is True, ambiguous dates are not printed but returned as `(kind, example)` pairs, so the caller can
+    report them to its `Diagnostics` on every call, not only when the result is not cached yet.
+    """
     value_str = value_str.strip()
+    date_diagnostics = Diagnostics() if collect else None
 
     # parsing as a date
     try:
-        value = parse_date(date_str=value_str, compliance='strict')
+        value = parse_date(date_str=value_str, compliance='strict', diagnostics=date_diagnostics)
     except ValueError:
         pass
     else:
-        return value
+        return value, True, _events(date_diagnostics)
 
     # parsing as a coding
     try:
-        value = parse_coding(coding_str=value_str, resources=resources, compliance='strict')
+        value = get_coding_parser(resources).parse(value_str, compliance='strict')
     except ValueError:
         pass
     else:
-        return value
+        return value, True, _events(date_diagnostics)
 
     # parsing as a primitive value
     # has to be tried last, otherwise it defaults to parsing as a string
@@ -48,10 +128,16 @@ def parse_value(
     except ValueError:
         pass
     else:
-        return value
+        return value, True, _events(date_diagnostics)
 
     if compliance == 'strict':
         raise ValueError(f"Could not parse value: {value_str}")
     else:
-        print(f"Warning: Could not parse value: {value_str}")
-        return value_str
+        return value_str, False, _events(date_diagnostics)
+
+
+def _events(diagnostics: Diagnostics) -> Tuple[Tuple[str, Any], ...]:
+    """Returns the problems reported to `diagnostics` as `(kind, example)` pairs, none if it is `None`"""
+    if diagnostics is None or not diagnostics.total:
+        return ()
+    return tuple((kind, example) for (kind, _), examples in diagnostics.examples.items() for example in examples)
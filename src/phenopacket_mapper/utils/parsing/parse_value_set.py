@@ -2,6 +2,8 @@ from typing import Literal, Any, Tuple
 
 from phenopacket_mapper.data_standards import CodeSystem
 from phenopacket_mapper.utils.parsing import parse_single_data_type, parse_value
+from phenopacket_mapper.utils.diagnostics import Diagnostics
+from phenopacket_mapper.utils.parsing.coding_parser import get_coding_parser
 from phenopacket_mapper.data_standards.value_set import ValueSet
 
 
@@ -11,6 +13,7 @@ def parse_value_set(
         value_set_description: str = "",
         resources: Tuple[CodeSystem, ...] = None,
         compliance: Literal['strict', 'lenient'] = 'lenient',
+        diagnostics: Diagnostics = None,
 ) -> ValueSet:
     """Parses a value set from a string representation
 
@@ -19,6 +22,7 @@ def parse_value_set(
     :param value_set_description: Description of the value set
     :param resources: List of CodeSystems to use for parsing the value set
     :param compliance: Compliance level for parsing the value set
+    :param diagnostics: If given, elements that could not be parsed are reported to it instead of printing a warning
     :return: A ValueSet object as defined by the string representation
     """
     if not isinstance(value_set_str, str) or not value_set_str:
@@ -30,7 +34,8 @@ def parse_value_set(
     value_set_str = value_set_str.strip()
 
     if resources is None:
-        resources = []
+        resources = ()
+    coding_parser = get_coding_parser(resources)
 
     elements_str = value_set_str.split(",")
 
@@ -41,9 +46,9 @@ def parse_value_set(
         # parsing as a data type
         try:
             # compliance is set to 'strict' because we want to raise an error if the element is not recognized
-            element = parse_single_data_type(type_str=element_str, resources=resources, compliance='strict')
+            element = parse_single_data_type(type_str=element_str, resources=coding_parser, compliance='strict')
         except ValueError:  # parsing as type failed, parsing as a value
-            element = parse_value(value_str=element_str, resources=resources)
+            element = parse_value(value_str=element_str, resources=resources, diagnostics=diagnostics)
 
         if element is not None:
             elements.append(element)
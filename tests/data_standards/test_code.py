@@ -0,0 +1,33 @@
+from phenopacket_mapper.data_standards import code_system, Coding, CodeSystem, intern_coding, intern_code_system
+from phenopacket_mapper.utils.parsing import parse_coding
+
+
+def test_intern_coding():
+    coding = intern_coding(code_system.HPO, "0000790")
+    assert coding == Coding(system=code_system.HPO, code="0000790")
+    assert intern_coding(code_system.HPO, "0000790") is coding
+    assert intern_coding(code_system.HPO, "0000791") is not coding
+    assert intern_coding("HP", "0000790") is not coding
+
+
+def test_intern_code_system():
+    hpo = CodeSystem(name=code_system.HPO.name, namespace_prefix=code_system.HPO.namespace_prefix,
+                     url=code_system.HPO.url, iri_prefix=code_system.HPO.iri_prefix,
+                     synonyms=list(code_system.HPO.synonyms))
+    assert intern_code_system(code_system.HPO) is code_system.HPO
+    assert intern_code_system(hpo) is code_system.HPO
+    assert intern_code_system(hpo.set_version("2024-01-01")) is not code_system.HPO
+
+
+def test_parsed_codings_are_shared():
+    resources = [code_system.HPO]
+    assert parse_coding("HP:0000790", resources) is parse_coding("HPO:0000790", resources)
+
+
+def test_code_system_hashable():
+    hpo_2024 = code_system.HPO.set_version("2024-01-01")
+    assert isinstance(code_system.HPO.synonyms, frozenset)
+    assert hpo_2024 == code_system.HPO
+    assert hash(hpo_2024) == hash(code_system.HPO)
+    assert {code_system.HPO, hpo_2024, code_system.OMIM} == {code_system.HPO, code_system.OMIM}
+    assert Coding(system=hpo_2024, code="0000790") in {Coding(system=code_system.HPO, code="0000790")}
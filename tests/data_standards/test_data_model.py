@@ -104,3 +104,379 @@ class TestDataModel:
         assert data_model.get_field('date_of_birth').name == 'Date of Birth'
         assert data_model._12pseudonym_2.name == '%^&#12pseudonym!2'
         assert data_model.get_field('_12pseudonym_2').name == '%^&#12pseudonym!2'
+
+    @staticmethod
+    @pytest.fixture
+    def hierarchical_data_model():
+        return DataModel(name='test_hierarchical', fields=(
+            DataField(name='Field 0', specification=int),
+            DataSection(name='Section', fields=(
+                DataField(name='Field 1', specification=str),
+                OrGroup(name='Or', fields=(DataField(name='Field 2', specification=str),)),
+            )),
+        ))
+
+    @staticmethod
+    def test_get_by_path(hierarchical_data_model):
+        assert hierarchical_data_model.get_by_path('field_0').name == 'Field 0'
+        assert hierarchical_data_model.get_by_path('section').name == 'Section'
+        assert hierarchical_data_model.get_by_path('section.field_1').name == 'Field 1'
+        assert hierarchical_data_model.get_by_path('section.or_.field_2').name == 'Field 2'
+        assert hierarchical_data_model.get_by_path('field_2') is None
+        assert hierarchical_data_model.section.field_1.name == 'Field 1'
+        assert hierarchical_data_model.section.or_.field_2.name == 'Field 2'
+
+    @staticmethod
+    def test_contains(hierarchical_data_model):
+        assert DataField(name='Field 0', specification=int) in hierarchical_data_model
+        assert DataField(name='Field 2', specification=str) in hierarchical_data_model
+        assert DataField(name='Field 2', specification=int) not in hierarchical_data_model
+        assert DataField(name='Field 3', specification=str) not in hierarchical_data_model
+        assert 'field_0' not in hierarchical_data_model
+
+
+class TestDataModelInstance:
+
+    @staticmethod
+    @pytest.fixture
+    def data_model():
+        return DataModel(name='test_data_model', fields=(
+            DataField(name='Field 0', specification=int),
+            DataField(name='Field 1', specification=str),
+            DataField(name='Field 2', specification=str),
+        ))
+
+    @staticmethod
+    def test_get_value_by_field_id(data_model):
+        from phenopacket_mapper.data_standards import DataModelInstance, DataFieldValue
+
+        values = (
+            DataFieldValue(id=0, field=data_model.field_2, value='c'),
+            DataFieldValue(id=0, field=data_model.field_0, value=1),
+        )
+        instance = DataModelInstance(id=0, data_model=data_model, values=values)
+
+        assert instance.field_0 is values[1]
+        assert instance.field_2 is values[0]
+        with pytest.raises(AttributeError):
+            _ = instance.field_1
+
+    @staticmethod
+    def test_instances_share_layout_index(data_model):
+        from phenopacket_mapper.data_standards import DataModelInstance, DataFieldValue
+
+        instances = [
+            DataModelInstance(id=i, data_model=data_model, values=(
+                DataFieldValue(id=i, field=data_model.field_0, value=i),
+                DataFieldValue(id=i, field=data_model.field_1, value=str(i)),
+            ))
+            for i in range(3)
+        ]
+        assert [instance.field_1.value for instance in instances] == ['0', '1', '2']
+        assert instances[0]._field_index is instances[1]._field_index is instances[2]._field_index
+
+
+class TestColumnarDataModelInstances:
+
+    @staticmethod
+    @pytest.fixture
+    def data_model():
+        return DataModel(name='test_data_model', fields=(
+            DataField(name='Field 0', specification=int),
+            DataField(name='Field 1', specification=str),
+            DataField(name='Field 2', specification=bool),
+        ))
+
+    @staticmethod
+    @pytest.fixture
+    def data_set(data_model):
+        from phenopacket_mapper.data_standards import DataModelInstance, DataFieldValue, DataSet
+
+        return DataSet(data_model=data_model, data=[
+            DataModelInstance(id=f"row:{i}", data_model=data_model, values=tuple(
+                DataFieldValue(id=i, field=f, value=v) for f, v in zip(data_model.fields, row) if v is not None
+            ))
+            for i, row in enumerate([(1, 'a', True), (None, 'b', False), (3, 'a', None)])
+        ])
+
+    @staticmethod
+    @pytest.mark.parametrize("values, dtype, dictionary", [
+        ([1, None, 3], 'int64', None),
+        ([1.5, None], 'float64', None),
+        ([True, None, False], 'bool', None),
+        (['a', 'b', None, 'a'], 'int32', ['a', 'b']),
+        ([1, 1.0, True], 'int32', [1, 1.0, True]),
+        ([2 ** 70, None], 'int32', [2 ** 70]),
+    ])
+    def test_column_from_values(values, dtype, dictionary):
+        from phenopacket_mapper.data_standards import Column
+
+        column = Column.from_values(values)
+        assert column.data.dtype == dtype
+        assert column.dictionary == dictionary
+        assert column.mask.tolist() == [v is not None for v in values]
+        assert column.to_list() == values
+        assert [type(column.get(i)) for i in range(len(values))] == [type(v) for v in values]
+
+    @staticmethod
+    def test_column_to_array_is_read_only():
+        from phenopacket_mapper.data_standards import Column
+
+        column = Column.from_values([1, 2, 3])
+        with pytest.raises(ValueError):
+            column.to_array()[0] = 100
+        assert column.to_list() == [1, 2, 3]
+
+    @staticmethod
+    def test_column_unhashable_values():
+        from phenopacket_mapper.data_standards import Column
+
+        values = [[1], None, [2]]
+        column = Column.from_values(values)
+        assert column.dictionary is None
+        assert column.to_list() == values
+
+    @staticmethod
+    def test_to_columnar(data_set):
+        columnar = data_set.to_columnar()
+
+        assert columnar.is_columnar and not data_set.is_columnar
+        assert columnar.to_columnar() is columnar
+        assert columnar.height == data_set.height == 3
+        assert columnar.width == data_set.width
+        assert columnar.data.columns['field_1'].dictionary == ['a', 'b']
+        assert [row.to_instance() for row in columnar] == list(data_set)
+        assert columnar.data_frame.equals(data_set.data_frame)
+
+    @staticmethod
+    def test_row_view(data_set):
+        columnar = data_set.to_columnar()
+        row = columnar.data[1]
+
+        assert row.id == "row:1"
+        assert row.data_model is data_set.data_model
+        assert row.field_1 == data_set.data[1].field_1
+        assert row.validate()
+        with pytest.raises(AttributeError):
+            _ = row.field_0
+        with pytest.raises(IndexError):
+            _ = columnar.data[3]
+
+    @staticmethod
+    def test_row_view_pickles_as_instance(data_set):
+        import pickle
+        from phenopacket_mapper.data_standards import DataModelInstance
+
+        row = pickle.loads(pickle.dumps(data_set.to_columnar().data[0]))
+        assert isinstance(row, DataModelInstance)
+        assert row == data_set.data[0]
+
+
+class TestDataSet:
+
+    @staticmethod
+    @pytest.fixture
+    def data_model():
+        from phenopacket_mapper.data_standards import Coding, CodeSystem
+
+        return DataModel(name='test_data_model', fields=(
+            DataField(name='Field 0', specification=int),
+            DataField(name='Field 1', specification=Coding),
+            DataField(name='Field 2', specification=str),
+        ), resources=(CodeSystem(name='Example', namespace_prefix='EX'),))
+
+    @staticmethod
+    def make_instance(data_model, i, row):
+        from phenopacket_mapper.data_standards import DataModelInstance, DataFieldValue
+
+        return DataModelInstance(id=f"row:{i}", data_model=data_model, values=tuple(
+            DataFieldValue(id=i, field=f, value=v) for f, v in zip(data_model.fields, row) if v is not None
+        ))
+
+    @staticmethod
+    @pytest.fixture
+    def data_set(data_model):
+        from phenopacket_mapper.data_standards import Coding, DataSet
+
+        system = data_model.resources[0]
+        rows = [(1, Coding(system, '1'), 'a'), (None, Coding(system, '2'), None), (3, Coding(system, '1'), 'c')]
+        return DataSet(data_model=data_model, data=[
+            TestDataSet.make_instance(data_model, i, row) for i, row in enumerate(rows)
+        ])
+
+    @staticmethod
+    @pytest.fixture(params=['rows', 'columnar', 'lazy'])
+    def stored_data_set(data_set, request):
+        from phenopacket_mapper.data_standards import DataSet, LazyDataModelInstances
+
+        if request.param == 'columnar':
+            return data_set.to_columnar()
+        elif request.param == 'lazy':
+            instances = data_set.data
+            return DataSet(data_model=data_set.data_model, data=LazyDataModelInstances(load=lambda: iter(instances)))
+        return data_set
+
+    @staticmethod
+    def test_data_frame(data_set):
+        data_frame = data_set.data_frame
+
+        assert list(data_frame.columns) == ['field_0', 'field_1', 'field_2']
+        assert data_frame['field_0'].tolist()[::2] == [1, 3]
+        assert data_frame['field_1'].tolist() == [v.field_1.value for v in data_set]
+        assert data_frame['field_2'].isna().tolist() == [False, True, False]
+        assert data_set.to_columnar().data_frame.equals(data_frame)
+
+    @staticmethod
+    def test_data_frame_is_cached(data_set, monkeypatch):
+        from phenopacket_mapper.data_standards import DataSet
+
+        calls = []
+        build = DataSet._build_data_frame
+        monkeypatch.setattr(DataSet, '_build_data_frame', lambda self: calls.append(1) or build(self))
+
+        data_set.head()
+        data_frame = data_set.data_frame
+        data_frame['field_2'] = None  # does not affect the cached data frame
+        assert data_set.data_frame['field_2'].notna().tolist() == [True, False, True]
+        assert len(calls) == 1
+
+        data_set.data.append(TestDataSet.make_instance(data_set.data_model, 3, (4, None, 'd')))
+        assert len(data_set.data_frame) == 3
+        assert len(calls) == 1
+
+        data_set.invalidate_data_frame()
+        assert data_set.height == len(data_set.data_frame) == 4
+        assert len(calls) == 2
+
+    @staticmethod
+    def test_head_copies_only_the_first_rows(data_set, monkeypatch):
+        import pandas as pd
+
+        _ = data_set.data_frame
+        copied = []
+        copy = pd.DataFrame.copy
+        monkeypatch.setattr(pd.DataFrame, 'copy', lambda self, *args, **kwargs: copied.append(len(self)) or copy(
+            self, *args, **kwargs
+        ))
+
+        head = data_set.head(1)
+        head.loc[0, 'field_2'] = 'z'
+        assert copied and max(copied) == 1  # the whole data frame is never copied
+        assert data_set.data_frame['field_2'].tolist()[0] == 'a'
+
+    @staticmethod
+    def test_data_frame_does_not_alias_columns(data_set):
+        from phenopacket_mapper.data_standards import DataSet, ColumnarDataModelInstances, Column
+
+        columnar = DataSet(data_model=data_set.data_model, data=ColumnarDataModelInstances(
+            data_model=data_set.data_model,
+            columns={'field_0': Column.from_values([1, 2, 3])},
+        ))
+        data_frame = columnar.data_frame
+        data_frame.loc[0, 'field_0'] = 100
+
+        assert columnar.data.columns['field_0'].get(0) == 1
+        assert columnar.data_frame['field_0'].tolist() == [1, 2, 3]
+
+    @staticmethod
+    @pytest.mark.parametrize("columnar", [False, True])
+    def test_to_arrow(data_set, columnar):
+        pa = pytest.importorskip('pyarrow')
+
+        if columnar:
+            data_set = data_set.to_columnar()
+        table = data_set.to_arrow()
+
+        assert table.column_names == ['field_0', 'field_1', 'field_2']
+        assert table.num_rows == 3
+        assert table['field_0'].to_pylist() == [1, None, 3]
+        assert table['field_0'].type == pa.int64()
+        assert table['field_1'].to_pylist() == ['EX:1', 'EX:2', 'EX:1']
+        assert pa.types.is_dictionary(table['field_1'].type)
+        assert table['field_2'].to_pylist() == ['a', None, 'c']
+
+    @staticmethod
+    def test_preprocess(stored_data_set):
+        data_set = stored_data_set
+
+        preprocessed = data_set.preprocess('field_2', {'a': 'A', 'c': 'C'})
+        assert preprocessed is not data_set
+        assert preprocessed.is_columnar == data_set.is_columnar and preprocessed.is_lazy == data_set.is_lazy
+        assert preprocessed.data_frame['field_2'].tolist()[::2] == ['A', 'C']
+        assert data_set.data_frame['field_2'].tolist()[::2] == ['a', 'c']
+        assert preprocessed.data_frame['field_1'].equals(data_set.data_frame['field_1'])
+
+        preprocessed = data_set.preprocess(data_set.data_model.field_0, lambda values: [v * 10 for v in values],
+                                           vectorized=True)
+        assert [getattr(instance, 'field_0', None) is None for instance in preprocessed] == [False, True, False]
+        assert [instance.field_0.value for instance in preprocessed if hasattr(instance, 'field_0')] == [10, 30]
+
+    @staticmethod
+    def test_preprocess_lazy_workers_share_pool(data_set, monkeypatch):
+        import concurrent.futures
+        import phenopacket_mapper.data_standards.data_model as data_model_module
+        import phenopacket_mapper.utils.parallel as parallel_module
+        from phenopacket_mapper.data_standards import DataSet, LazyDataModelInstances
+
+        pools = []
+
+        class CountingPool(concurrent.futures.ProcessPoolExecutor):
+            def __init__(self, *args, **kwargs):
+                pools.append(self)
+                super().__init__(*args, **kwargs)
+
+        monkeypatch.setattr(concurrent.futures, 'ProcessPoolExecutor', CountingPool)
+        monkeypatch.setattr(parallel_module, 'ProcessPoolExecutor', CountingPool)
+        monkeypatch.setattr(data_model_module, 'PREPROCESS_BATCH_SIZE', 1)
+        instances = data_set.data
+        data_set = DataSet(data_model=data_set.data_model, data=LazyDataModelInstances(load=lambda: iter(instances)))
+
+        preprocessed = data_set.preprocess('field_2', str.upper, workers=2)
+        assert [instance.field_2.value for instance in preprocessed if hasattr(instance, 'field_2')] == ['A', 'C']
+        assert len(pools) == 1  # one per pass over the dataset, not one per batch
+
+    @staticmethod
+    def test_preprocess_fields(stored_data_set):
+        data_set = stored_data_set
+
+        calls = []
+
+        def upper(values):
+            calls.append(values)
+            return [v.upper() if v is not None else None for v in values]
+
+        preprocessed = data_set.preprocess_fields({
+            data_set.data_model.field_0: lambda values: [v * 10 if v is not None else None for v in values],
+            'field_2': upper,
+        })
+        assert preprocessed.is_columnar == data_set.is_columnar and preprocessed.is_lazy == data_set.is_lazy
+        assert preprocessed.data_frame['field_0'].tolist()[::2] == [10, 30]
+        assert preprocessed.data_frame['field_2'].tolist()[::2] == ['A', 'C']
+        assert preprocessed.data_frame['field_1'].equals(data_set.data_frame['field_1'])
+        assert len(calls) == 1
+
+        with pytest.raises(ValueError):
+            list(data_set.preprocess_fields({'field_2': lambda values: values[:1]}))
+
+    @staticmethod
+    def test_preprocess_multiple_fields(stored_data_set):
+        data_set = stored_data_set
+
+        derived_field = DataField(name='Derived', specification=str)
+        derived = data_set.preprocess(
+            ['field_0', 'field_2'], lambda numbers, letters: [n * s for n, s in zip(numbers, letters)],
+            target=derived_field, vectorized=True, batch_size=1,
+        )
+        assert derived.data_model.get_field_ids() == ['field_0', 'field_1', 'field_2', 'derived']
+        assert data_set.data_model.get_field_ids() == ['field_0', 'field_1', 'field_2']
+        assert derived.data_frame['derived'].tolist()[::2] == ['a', 'ccc']
+        assert derived.data_frame['derived'].isna().tolist() == [False, True, False]
+
+        overwritten = derived.preprocess(['field_2', 'field_0'], lambda s, n: s.upper() * n, target='derived')
+        assert overwritten.data_frame['derived'].tolist()[::2] == ['A', 'CCC']
+        assert overwritten.data_model.get_field_ids() == derived.data_model.get_field_ids()
+
+        with pytest.raises(ValueError):
+            data_set.preprocess(['field_0', 'field_2'], lambda n, s: n * s)
+        with pytest.raises(ValueError):
+            data_set.preprocess(['field_0', 'field_2'], lambda n, s: n * s, target='unknown')
@@ -0,0 +1,96 @@
+import warnings
+
+import pytest
+
+from phenopacket_mapper.data_standards import DataModel, DataField, DataFieldValue, DataModelInstance, DataSet, \
+    DataSection, ValueSet, validate_data_set
+from phenopacket_mapper.data_standards.data_model import DataSectionInstance
+
+
+@pytest.fixture
+def data_model():
+    return DataModel(
+        name="Validation test data model",
+        fields=(
+            DataField(name="pseudonym", specification=str, required=True),
+            DataField(name="sex", specification=ValueSet(elements=("male", "female", "other"))),
+            DataField(name="age", specification=int),
+        ),
+    )
+
+
+@pytest.fixture
+def data_set(data_model):
+    rows = [
+        {"pseudonym": "a", "sex": "male", "age": 31},
+        {"pseudonym": "b", "sex": "unknown", "age": 47},
+        {"sex": "female", "age": "old"},
+        {"pseudonym": "d", "sex": "unknown"},
+    ]
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        instances = [
+            DataModelInstance(
+                id=i,
+                data_model=data_model,
+                values=tuple(
+                    DataFieldValue(id=i, field=data_model.get_field(field_id), value=value)
+                    for field_id, value in row.items()
+                ),
+            )
+            for i, row in enumerate(rows)
+        ]
+    return DataSet(data_model=data_model, data=instances)
+
+
+def test_validate_data_set(data_set):
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        report = validate_data_set(data_set)
+
+    assert not report.is_valid
+    assert (report.n_rows, report.n_values) == (4, 10)
+    assert report.counts == {
+        ("sex", "not_in_value_set"): 2,
+        ("age", "not_in_value_set"): 1,
+        ("pseudonym", "missing_required_field"): 1,
+    }
+    assert report.row_ids("sex") == [1, 3]
+    assert report.row_ids(reason="missing_required_field") == [2]
+    assert sorted(report.invalid_row_ids) == [1, 2, 3]
+    assert report.issues[0].value == "unknown"
+
+
+def test_validate_data_set_same_as_instance_validation(data_set):
+    report = data_set.validate()
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        invalid = [instance.id for instance in data_set if not instance.validate()]
+    assert sorted(report.invalid_row_ids) == invalid
+
+
+def test_validate_data_set_skips_section_values():
+    section = DataSection(name="example", fields=(DataField(name="a_number", specification=int),))
+    data_model = DataModel(
+        name="Hierarchical validation test data model",
+        fields=(DataField(name="pseudonym", specification=str), section),
+    )
+    instance = DataModelInstance(
+        id=0,
+        data_model=data_model,
+        values=(
+            DataFieldValue(id=0, field=data_model.pseudonym, value="a"),
+            DataSectionInstance(
+                id="0:example", section=section,
+                values=(DataFieldValue(id=0, field=section.fields[0], value="not a number"),),
+            ),
+        ),
+        validate_on_init=False,
+    )
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        assert instance.validate()
+
+    report = validate_data_set(DataSet(data_model=data_model, data=[instance]))
+    assert report.is_valid
+    assert report.n_values == 1
@@ -1,3 +1,5 @@
+from typing import Any
+
 import pytest
 
 from phenopacket_mapper.data_standards import Coding, code_system, Date
@@ -38,3 +40,22 @@ def test_in_valueset(value, is_in, value_set):
         assert value in value_set
     else:
         assert value not in value_set
+
+
+@pytest.mark.parametrize("value, allowed, value_set", [
+    (3, True, ValueSet(elements=[Any])),
+    ("a", True, ValueSet(elements=[int, Any])),
+    (3, True, ValueSet(elements=[int])),
+    (3.0, False, ValueSet(elements=[int])),
+    ("DE", True, ValueSet(elements=["DE", "FR", "IT"])),
+    ("ES", False, ValueSet(elements=["DE", "FR", "IT"])),
+    (True, True, ValueSet(elements=[bool])),
+    (True, False, ValueSet(elements=[1])),
+    (Coding(system=code_system.HPO, code="0000790"), True, ValueSet(elements=[code_system.HPO])),
+    (Coding(system=code_system.HPO.set_version("2024"), code="1"), True, ValueSet(elements=[code_system.HPO])),
+    (Coding(system=code_system.HPO, code="0000790"), False, ValueSet(elements=[code_system.OMIM, str])),
+    (Coding(system="HP", code="0000790"), False, ValueSet(elements=[code_system.HPO])),
+    (Date(year=2024, month=9, day=18), True, ValueSet(elements=[Date(year=2024, month=9, day=18)])),
+])
+def test_allows(value, allowed, value_set):
+    assert value_set.allows(value) == allowed
@@ -0,0 +1,128 @@
+import json
+from types import GeneratorType
+
+import phenopackets
+import pytest
+
+from phenopacket_mapper import DataModel, PhenopacketMapper
+from phenopacket_mapper.data_standards import DataField, DataFieldValue, DataModelInstance, DataSet
+from phenopacket_mapper.mapping import PhenopacketBuildingBlock
+from phenopacket_mapper.utils.io import write_iter
+
+
+@pytest.fixture
+def data_model():
+    return DataModel(
+        name="Mapping test data model",
+        fields=(
+            DataField(name="pseudonym", specification=str),
+            DataField(name="sex", specification=str),
+        ),
+    )
+
+
+@pytest.fixture
+def data_set(data_model):
+    return DataSet(
+        data_model=data_model,
+        data=[
+            DataModelInstance(
+                id=f"row:{i}",
+                data_model=data_model,
+                values=(DataFieldValue(id=i, field=data_model.pseudonym, value=f"pat_{i}"),),
+            )
+            for i in range(5)
+        ],
+    )
+
+
+@pytest.fixture
+def mapper(data_model):
+    return PhenopacketMapper(
+        data_model=data_model,
+        id=data_model.pseudonym,
+        subject=PhenopacketBuildingBlock(
+            phenopackets.Individual,
+            id=data_model.pseudonym,
+        ),
+    )
+
+
+def test_map(mapper, data_set):
+    mapped = mapper.map(data_set)
+    assert [p.id for p in mapped] == [f"pat_{i}" for i in range(5)]
+    assert [p.subject.id for p in mapped] == [f"pat_{i}" for i in range(5)]
+
+
+def test_map_iter(mapper, data_set):
+    mapped = mapper.map_iter(data_set)
+    assert isinstance(mapped, GeneratorType)
+    assert list(mapped) == mapper.map(data_set)
+
+
+def test_write_iter(tmp_path, mapper, data_set):
+    n = write_iter(mapper.map_iter(data_set), tmp_path)
+    assert n == 5
+    assert sorted(p.name for p in tmp_path.iterdir()) == [f"pat_{i}.json" for i in range(5)]
+    with open(tmp_path / "pat_3.json") as fh:
+        assert json.load(fh)["subject"]["id"] == "pat_3"
+
+
+@pytest.mark.parametrize("workers, chunk_size", [(1, 1), (2, 2), (3, 10)])
+def test_map_parallel(mapper, data_set, workers, chunk_size):
+    assert mapper.map_parallel(data_set, workers=workers, chunk_size=chunk_size) == mapper.map(data_set)
+
+
+def test_compiled_building_block_matches_map():
+    from phenopacket_mapper.data_standards import Coding, Date, code_system
+
+    date_field = DataField(name="date_of_birth", specification=Date)
+    sex_field = DataField(name="karyotypic_sex", specification=code_system.SNOMED_CT)
+    pseudonym_field = DataField(name="pseudonym", specification=str)
+    data_model = DataModel(name="test", fields=(pseudonym_field, date_field, sex_field))
+    instance = DataModelInstance(
+        id=0,
+        data_model=data_model,
+        values=(
+            DataFieldValue(id=0, field=pseudonym_field, value="pat_0"),
+            DataFieldValue(id=0, field=date_field, value=Date(year=2000, month=2, day=28)),
+            DataFieldValue(id=0, field=sex_field, value=Coding(system=code_system.SNOMED_CT, code="248153007")),
+        ),
+    )
+    building_block = PhenopacketBuildingBlock(
+        phenopackets.PhenotypicFeature,
+        type=sex_field,
+        description=pseudonym_field,
+        evidence=[PhenopacketBuildingBlock(phenopackets.Evidence, reference=PhenopacketBuildingBlock(
+            phenopackets.ExternalReference, id=pseudonym_field, description=date_field.id
+        ))],
+    )
+
+    assert building_block.compile()(instance) == building_block.map(instance)
+    assert building_block.compile()(instance).type.id == "SNOMED:248153007 ()"
+
+
+def test_map_skips_coding_with_unknown_system():
+    from phenopacket_mapper.data_standards import Coding
+
+    data_model = DataModel(
+        name="Coding test data model",
+        fields=(
+            DataField(name="pseudonym", specification=str),
+            DataField(name="taxonomy", specification=Coding),
+        ),
+    )
+    instance = DataModelInstance(id="row:0", data_model=data_model, validate_on_init=False, values=(
+        DataFieldValue(id=0, field=data_model.pseudonym, value="pat_0"),
+        DataFieldValue(id=0, field=data_model.taxonomy, value=Coding(system="UNKNOWN", code="123")),
+    ))
+    mapper = PhenopacketMapper(
+        data_model=data_model,
+        id=data_model.pseudonym,
+        subject=PhenopacketBuildingBlock(phenopackets.Individual, id=data_model.pseudonym,
+                                         taxonomy=data_model.taxonomy),
+    )
+
+    phenopacket, = mapper.map(DataSet(data_model=data_model, data=[instance]))
+    assert phenopacket.subject.id == "pat_0"
+    assert not phenopacket.subject.HasField("taxonomy")
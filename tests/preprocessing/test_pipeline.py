@@ -0,0 +1,104 @@
+import pytest
+
+from phenopacket_mapper.preprocessing import PreprocessingPipeline, Recode, Apply, RegexNormalize, ConvertUnit
+from phenopacket_mapper.utils.diagnostics import Diagnostics
+
+
+@pytest.mark.parametrize("stage, value, expected", [
+    (Recode({"m": "male"}), "m", ("male", True)),
+    (Recode({"m": "male"}), "x", ("x", False)),
+    (Recode({"m": "male"}), [1], ([1], False)),
+    (Apply(str.upper), "a", ("A", True)),
+    (Apply(str.upper), 1, (1, False)),
+    (Apply(lambda v, n: v * n, {"n": 2}), 3, (6, True)),
+    (RegexNormalize(r"\s+"), " a b ", ("ab", True)),
+    (RegexNormalize(r"^HP\s*", "HP:"), "HP 0000790", ("HP:0000790", True)),
+    (RegexNormalize(r"\s+"), "ab", ("ab", True)),
+    (RegexNormalize(r"\s+"), 1, (1, False)),
+    (ConvertUnit(0.001), 1500, (1.5, True)),
+    (ConvertUnit(0.001, unit="g"), "1500 g", (1.5, True)),
+    (ConvertUnit(1.8, 32), "100", (212.0, True)),
+    (ConvertUnit(0.001), "heavy", ("heavy", False)),
+    (ConvertUnit(0.001), True, (True, False)),
+])
+def test_stages(stage, value, expected):
+    assert stage(value) == expected
+
+
+@pytest.fixture
+def pipeline():
+    return (
+        PreprocessingPipeline()
+        .normalize("sex", r"\s+")
+        .convert_unit("weight", factor=0.001, unit="g")
+        .recode("sex", {"m": "male", "f": "female"})
+        .apply("sex", str.title)
+    )
+
+
+def test_stage_is_abstract():
+    from phenopacket_mapper.preprocessing import PreprocessingStage
+
+    with pytest.raises(TypeError):
+        PreprocessingStage()
+
+
+def test_pipeline_stages(pipeline):
+    assert pipeline.field_ids == ["sex", "weight"]
+    assert [type(stage) for stage in pipeline.get_stages("sex")] == [RegexNormalize, Recode, Apply]
+
+
+def test_pipeline_preprocess_values(pipeline):
+    diagnostics = Diagnostics()
+    values = ["m ", None, "f", "x", "m ", "x"]
+
+    preprocessed = pipeline.preprocess_values(values, "sex", diagnostics=diagnostics)
+
+    assert preprocessed == ["Male", None, "Female", "X", "Male", "X"]
+    assert diagnostics.counts == {("not_in_mapping", "sex"): 2}
+    assert diagnostics.examples[("not_in_mapping", "sex")] == ["x", "x"]
+
+
+def test_pipeline_preprocess_values_warns_once(pipeline):
+    with pytest.warns(UserWarning) as record:
+        pipeline.preprocess_values(["x"] * 10, "sex")
+    assert len(record) == 1
+
+
+def test_pipeline_memoizes_deterministic_stages():
+    calls = []
+
+    def record(value):
+        calls.append(value)
+        return value
+
+    PreprocessingPipeline().apply("a", record).preprocess_values([1, 1, 2, 1], "a")
+    assert calls == [1, 2]
+
+    calls.clear()
+    PreprocessingPipeline().apply("a", record, deterministic=False).preprocess_values([1, 1, 2, 1], "a")
+    assert calls == [1, 1, 2, 1]
+
+
+def test_pipeline_run(pipeline):
+    from phenopacket_mapper.data_standards import DataModel, DataField, DataModelInstance, DataFieldValue, DataSet
+
+    data_model = DataModel(name="test", fields=(
+        DataField(name="sex", specification=str),
+        DataField(name="weight", specification=float),
+    ))
+    rows = [("m", "72500 g"), ("f", None), ("?", "n/a")]
+    data_set = DataSet(data_model=data_model, data=[
+        DataModelInstance(id=i, data_model=data_model, values=tuple(
+            DataFieldValue(id=i, field=f, value=v) for f, v in zip(data_model.fields, row) if v is not None
+        ), validate_on_init=False)
+        for i, row in enumerate(rows)
+    ])
+    diagnostics = Diagnostics()
+
+    preprocessed = pipeline.run(data_set, diagnostics=diagnostics)
+
+    assert preprocessed.data_frame["sex"].tolist() == ["Male", "Female", "?"]
+    assert preprocessed.data_frame["weight"].tolist()[0] == 72.5
+    assert data_set.data_frame["sex"].tolist() == ["m", "f", "?"]
+    assert diagnostics.counts == {("not_in_mapping", "sex"): 1, ("not_a_number", "weight"): 1}
@@ -0,0 +1,37 @@
+import pytest
+
+from phenopacket_mapper.preprocessing import preprocess_column
+
+
+def test_preprocess_column_dict():
+    values = ["m", None, "f", "m", "x", "x"]
+
+    with pytest.warns(UserWarning, match=r"2 values \(1 distinct\) not found") as record:
+        preprocessed = preprocess_column(values, {"m": "male", "f": "female"})
+
+    assert preprocessed == ["male", None, "female", "male", "x", "x"]
+    assert len(record) == 1
+
+
+def test_preprocess_column_method():
+    assert preprocess_column(["a", None, "b"], str.upper) == ["A", None, "B"]
+    assert preprocess_column([1, None, 2], lambda v, offset: v + offset, offset=10) == [11, None, 12]
+
+
+def test_preprocess_column_vectorized():
+    calls = []
+
+    def double(values):
+        calls.append(values)
+        return [v * 2 for v in values]
+
+    assert preprocess_column([1, None, 2], double, vectorized=True) == [2, None, 4]
+    assert calls == [[1, 2]]
+
+    with pytest.raises(ValueError):
+        preprocess_column([1, 2], lambda values: values[:1], vectorized=True)
+
+
+def test_preprocess_column_workers():
+    values = [str(i) if i % 3 else None for i in range(3000)]
+    assert preprocess_column(values, str.upper, workers=2) == preprocess_column(values, str.upper)
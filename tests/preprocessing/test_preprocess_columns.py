@@ -0,0 +1,40 @@
+import pytest
+
+from phenopacket_mapper.preprocessing import preprocess_columns
+
+
+@pytest.fixture
+def columns():
+    return [[1990, 2001, None, 1985], [2020, 2021, 2022, None]]
+
+
+def test_preprocess_columns(columns):
+    assert preprocess_columns(columns, lambda birth, onset: onset - birth) == [30, 20, None, None]
+    assert preprocess_columns(columns, lambda birth, onset: birth is None, skip_missing=False) == \
+           [False, False, True, False]
+
+
+@pytest.mark.parametrize("batch_size", [None, 1, 2])
+def test_preprocess_columns_vectorized(columns, batch_size):
+    batches = []
+
+    def age(births, onsets, offset=0):
+        batches.append(len(births))
+        return [onset - birth + offset for birth, onset in zip(births, onsets)]
+
+    ages = preprocess_columns(columns, age, vectorized=True, batch_size=batch_size, offset=1)
+    assert ages == [31, 21, None, None]
+    assert batches == ([2] if batch_size is None else [batch_size] * (2 // batch_size))
+
+
+def test_preprocess_columns_vectorized_rows(columns):
+    ages = preprocess_columns(columns, lambda rows: [onset - birth for birth, onset in rows], vectorized=True,
+                              layout='rows')
+    assert ages == [30, 20, None, None]
+
+
+def test_preprocess_columns_invalid(columns):
+    with pytest.raises(ValueError):
+        preprocess_columns([[1, 2], [1]], lambda a, b: a + b)
+    with pytest.raises(ValueError):
+        preprocess_columns(columns, lambda births, onsets: births[:1], vectorized=True)
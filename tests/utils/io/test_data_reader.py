@@ -135,6 +135,68 @@ def test_reader_csv(inp, expected):
         assert data_reader.data[col].equals(expected[col])
 
 
+@pytest.mark.parametrize("chunk_size", [1, 2, 5, 10])
+def test_reader_csv_chunked(chunk_size):
+    inp = "a,b\n1,hello\n2,how\n3,are\n4,you\n5,today"
+    data_reader = DataReader(StringIO(inp), file_extension="csv", chunk_size=chunk_size)
+    assert data_reader.data is None
+
+    chunks = list(data_reader.iter_chunks())
+    assert all(len(chunk) <= chunk_size for chunk in chunks)
+    assert pd.concat(chunks)["b"].tolist() == ["hello", "how", "are", "you", "today"]
+
+    rows = list(data_reader.iterable)
+    assert [i for i, _ in rows] == [0, 1, 2, 3, 4]
+    assert [row["a"] for _, row in rows] == [1, 2, 3, 4, 5]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3])
+def test_reader_csv_chunked_fixed_dtype(chunk_size):
+    inp = "a,b\n34,x\n,y\n35,z"
+    eager = DataReader(StringIO(inp), file_extension="csv", dtype=str)
+    chunked = DataReader(StringIO(inp), file_extension="csv", chunk_size=chunk_size, dtype=str)
+
+    assert pd.concat(chunked.iter_chunks(), ignore_index=True).equals(eager.data)
+    assert eager.data["a"].tolist()[::2] == ["34", "35"]
+
+
+def test_reader_csv_chunked_file_iterations_are_independent(tmp_path):
+    path = tmp_path / "data.csv"
+    n = 100_000  # larger than the read buffer of pandas, so the file is not read at once
+    path.write_text("a\n" + "\n".join(str(i) for i in range(n)))
+    data_reader = DataReader(path, chunk_size=10_000)
+
+    outer = data_reader.iter_chunks()
+    first = next(outer)
+    inner = list(data_reader.iter_chunks())
+    assert pd.concat([first, *outer])["a"].tolist() == list(range(n))
+    assert pd.concat(inner)["a"].tolist() == list(range(n))
+
+
+def test_reader_csv_chunked_buffer_iterations():
+    class UnseekableStringIO(StringIO):
+        def seekable(self):
+            return False
+
+    data_reader = DataReader(StringIO("a\n1\n2\n3"), file_extension="csv", chunk_size=1)
+    outer = data_reader.iter_chunks()
+    next(outer)
+    with pytest.raises(RuntimeError):
+        next(data_reader.iter_chunks())
+    assert len(list(outer)) == 2
+    assert len(list(data_reader.iter_chunks())) == 3  # seekable buffers can be read again
+
+    data_reader = DataReader(UnseekableStringIO("a\n1\n2\n3"), file_extension="csv", chunk_size=1)
+    assert len(list(data_reader.iter_chunks())) == 3
+    with pytest.raises(RuntimeError):
+        next(data_reader.iter_chunks())
+
+
+def test_reader_chunked_unsupported_file_extension():
+    with pytest.raises(ValueError):
+        DataReader(StringIO('{"a": 1}'), file_extension="json", chunk_size=2)
+
+
 @pytest.mark.parametrize(
     "inp,expected",
     [
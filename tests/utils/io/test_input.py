@@ -178,3 +178,318 @@ def test_load_hierarchical_data_xml_genomic_interpretation_example_instance(buff
             ),
         )
     )
+
+
+@pytest.fixture
+def tabular_data_model():
+    return DataModel(
+        name="Tabular test data model",
+        fields=(
+            DataField(name="pseudonym", specification=str, required=True),
+            DataField(name="age", specification=int),
+            DataField(name="hospitalized", specification=bool),
+        ),
+    )
+
+
+@pytest.fixture
+def tabular_csv(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("id,years,in_hospital\npat_1,34,true\npat_2,,true\npat_3,34,\n")
+    return path
+
+
+@pytest.fixture
+def invalid_tabular_csv(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("id,years,in_hospital\npat_1,34,true\npat_2,old,true\n,34,true\n")
+    return path
+
+
+@pytest.fixture
+def tabular_column_names():
+    return {"pseudonym": "id", "age": "years", "hospitalized": "in_hospital"}
+
+
+def test_load_tabular_data_using_data_model(tabular_csv, tabular_data_model):
+    from phenopacket_mapper.utils.io import load_tabular_data_using_data_model
+
+    data_set = load_tabular_data_using_data_model(
+        file=tabular_csv,
+        data_model=tabular_data_model,
+        column_names={
+            "pseudonym_column": "id",
+            "age_column": "years",
+            "hospitalized_column": "in_hospital",
+        },
+    )
+
+    assert data_set.height == 3
+    instances = list(data_set)
+    assert [i.id for i in instances] == ["row:0", "row:1", "row:2"]
+    assert instances[0].pseudonym.value == "pat_1"
+    assert instances[0].age.value == 34
+    assert instances[0].hospitalized.value is True
+    assert [v.field.id for v in instances[1].values] == ["pseudonym", "hospitalized"]
+    assert [v.field.id for v in instances[2].values] == ["pseudonym", "age"]
+    assert instances[2].age == DataFieldValue(id=2, field=tabular_data_model.age, value=34)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3])
+def test_load_tabular_data_using_data_model_chunked(tabular_csv, tabular_data_model, tabular_column_names, chunk_size):
+    from phenopacket_mapper.utils.io import load_tabular_data_using_data_model
+
+    eager = load_tabular_data_using_data_model(
+        file=tabular_csv, data_model=tabular_data_model, column_names=dict(tabular_column_names),
+    )
+    chunked = load_tabular_data_using_data_model(
+        file=tabular_csv, data_model=tabular_data_model, column_names=dict(tabular_column_names), chunk_size=chunk_size,
+    )
+    assert list(chunked) == list(eager)
+    assert [i.pseudonym.value for i in chunked] == ["pat_1", "pat_2", "pat_3"]
+    assert [type(i.age.value) for i in chunked if hasattr(i, "age")] == [int, int]
+    assert [v.id for v in list(chunked)[2].values] == [2, 2]
+
+
+@pytest.mark.parametrize("chunk_size", [None, 2])
+def test_load_tabular_data_using_data_model_lazy(tabular_csv, tabular_data_model, tabular_column_names, chunk_size):
+    from phenopacket_mapper.data_standards import LazyDataModelInstances
+    from phenopacket_mapper.utils.io import load_tabular_data_using_data_model
+
+    lazy = load_tabular_data_using_data_model(
+        file=tabular_csv, data_model=tabular_data_model, column_names=dict(tabular_column_names), chunk_size=chunk_size,
+        lazy=True,
+    )
+    eager = load_tabular_data_using_data_model(
+        file=tabular_csv, data_model=tabular_data_model, column_names=dict(tabular_column_names),
+    )
+
+    assert lazy.is_lazy and not eager.is_lazy
+    assert isinstance(lazy.data, LazyDataModelInstances)
+    assert lazy.height == eager.height == 3
+    assert list(lazy) == list(eager)
+    assert list(lazy) == list(eager)  # can be iterated repeatedly
+
+
+def test_load_tabular_data_using_data_model_lazy_concurrent_iterations(tmp_path, tabular_data_model,
+                                                                      tabular_column_names):
+    from phenopacket_mapper.utils.io import load_tabular_data_using_data_model
+
+    path = tmp_path / "data.csv"
+    n = 3000
+    note = "x" * 200  # makes the file larger than the read buffer of pandas, so it is not read at once
+    path.write_text("id,years,in_hospital,note\n" + "".join(f"pat_{i},{i % 100},true,{note}\n" for i in range(n)))
+    data_set = load_tabular_data_using_data_model(
+        file=path, data_model=tabular_data_model, column_names=tabular_column_names, chunk_size=500, lazy=True,
+        validate='off',
+    )
+
+    ids = []
+    for i, instance in enumerate(data_set):
+        if i == 1000:
+            assert data_set.height == n
+            assert sum(1 for _ in data_set) == n
+        ids.append(instance.pseudonym.value)
+    assert ids == [f"pat_{i}" for i in range(n)]
+
+
+def test_load_tabular_data_using_data_model_schema_directed(tmp_path):
+    from phenopacket_mapper.data_standards import Date
+    from phenopacket_mapper.utils.io import load_tabular_data_using_data_model
+
+    data_model = DataModel(
+        name="Schema directed test data model",
+        fields=(
+            DataField(name="pseudonym", specification=str),
+            DataField(name="year_of_birth", specification=int),
+        ),
+    )
+    path = tmp_path / "data.csv"
+    path.write_text("id,yob\n2024,1990\n")
+    column_names = {"pseudonym": "id", "year_of_birth": "yob"}
+
+    generic = list(load_tabular_data_using_data_model(path, data_model, dict(column_names)))[0]
+    assert generic.pseudonym.value == Date(year=2024)
+    assert generic.year_of_birth.value == Date(year=1990)
+
+    directed = list(load_tabular_data_using_data_model(path, data_model, dict(column_names), schema_directed=True))[0]
+    assert directed.pseudonym.value == "2024"
+    assert directed.year_of_birth.value == 1990
+
+
+def test_load_tabular_data_using_data_model_schema_directed_dates(tmp_path):
+    from phenopacket_mapper.data_standards import Date
+    from phenopacket_mapper.utils.io import load_tabular_data_using_data_model
+
+    data_model = DataModel(
+        name="Schema directed date test data model",
+        fields=(
+            DataField(name="pseudonym", specification=str),
+            DataField(name="date_of_birth", specification=Date),
+        ),
+    )
+    path = tmp_path / "data.csv"
+    path.write_text("id,dob\na,24/12/1990\nb,\nc,01/02/2000\nd,1985\n")
+    column_names = {"pseudonym": "id", "date_of_birth": "dob"}
+
+    instances = list(load_tabular_data_using_data_model(path, data_model, column_names, schema_directed=True))
+    assert instances[0].date_of_birth.value == Date(year=1990, month=12, day=24)
+    assert not hasattr(instances[1], "date_of_birth")
+    assert instances[2].date_of_birth.value == Date(year=2000, month=2, day=1)
+    assert instances[3].date_of_birth.value == Date(year=1985)
+
+
+def test_get_column_parser_dates_default_first():
+    import pandas as pd
+    from phenopacket_mapper.data_standards import Date
+    from phenopacket_mapper.utils.io.input import _get_column_parser
+
+    data_field = DataField(name="date_of_birth", specification=Date)
+    parse = _get_column_parser(data_field, (), 'lenient', schema_directed=True, default_first="month")
+    assert parse(pd.Series(["01/02/2000", None])) == [Date(year=2000, month=1, day=2), None]
+
+
+@pytest.mark.parametrize("validate, n_warnings", [("eager", 3), ("deferred", 1), ("off", 0)])
+def test_load_tabular_data_using_data_model_validate(
+        invalid_tabular_csv, tabular_data_model, tabular_column_names, validate, n_warnings
+):
+    import warnings
+    from phenopacket_mapper.utils.io import load_tabular_data_using_data_model
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        data_set = load_tabular_data_using_data_model(
+            invalid_tabular_csv, tabular_data_model, tabular_column_names, validate=validate
+        )
+    assert len([w for w in caught if issubclass(w.category, UserWarning)]) == n_warnings
+    assert data_set.height == 3
+    assert sorted(data_set.validate().invalid_row_ids) == ["row:1", "row:2"]
+
+
+def test_load_tabular_data_using_data_model_validate_deferred_strict(tmp_path, tabular_data_model,
+                                                                    tabular_column_names):
+    from phenopacket_mapper.utils.io import load_tabular_data_using_data_model
+
+    path = tmp_path / "data.csv"
+    path.write_text("id,years,in_hospital\npat_1,old,true\n")
+
+    with pytest.raises(ValueError):
+        load_tabular_data_using_data_model(path, tabular_data_model, tabular_column_names, compliance='strict',
+                                           validate='deferred')
+    with pytest.raises(ValueError):
+        load_tabular_data_using_data_model(path, tabular_data_model, tabular_column_names, validate='later')
+
+
+@pytest.mark.parametrize("validate", ["eager", "deferred"])
+def test_load_tabular_data_using_data_model_diagnostics(
+        invalid_tabular_csv, tabular_data_model, tabular_column_names, validate
+):
+    import warnings
+    from phenopacket_mapper.utils import Diagnostics
+    from phenopacket_mapper.utils.io import load_tabular_data_using_data_model
+
+    diagnostics = Diagnostics()
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        load_tabular_data_using_data_model(invalid_tabular_csv, tabular_data_model, tabular_column_names,
+                                           validate=validate, diagnostics=diagnostics)
+    assert not [w for w in caught if issubclass(w.category, UserWarning)]
+    assert diagnostics.counts[("not_in_value_set", "age")] == 1
+    assert diagnostics.counts[("missing_required_field", "pseudonym")] == 1
+
+
+@pytest.mark.parametrize("chunk_size", [None, 2])
+def test_load_tabular_data_using_data_model_columnar(tabular_csv, tabular_data_model, tabular_column_names, chunk_size):
+    from phenopacket_mapper.utils.io import load_tabular_data_using_data_model
+
+    columnar = load_tabular_data_using_data_model(
+        file=tabular_csv, data_model=tabular_data_model, column_names=dict(tabular_column_names), chunk_size=chunk_size,
+        storage='columnar',
+    )
+    rows = load_tabular_data_using_data_model(
+        file=tabular_csv, data_model=tabular_data_model, column_names=dict(tabular_column_names),
+    )
+
+    assert columnar.is_columnar
+    assert columnar.height == rows.height == 3
+    assert [row.to_instance() for row in columnar] == list(rows)
+    assert columnar.data_frame.equals(rows.data_frame)
+
+    with pytest.raises(ValueError):
+        load_tabular_data_using_data_model(
+            file=tabular_csv, data_model=tabular_data_model, column_names=dict(tabular_column_names), lazy=True,
+            storage='columnar',
+        )
+
+
+@pytest.fixture
+def xml_directory(tmp_path):
+    for i in range(7):
+        subject_key = 100 + i if i != 3 else "unknown"
+        (tmp_path / f"patient_{i}.xml").write_text(
+            '<?xml version="1.0" encoding="UTF-8" ?>'
+            f'<ODM><ClinicalData><SubjectData SubjectKey="{subject_key}"><ANumber>{i}</ANumber></SubjectData>'
+            '</ClinicalData></ODM>'
+        )
+    return tmp_path
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_load_hierarchical_dataset_parallel(xml_directory, genomic_interpretation, lazy):
+    from phenopacket_mapper.utils.diagnostics import Diagnostics
+    from phenopacket_mapper.utils.io import load_hierarchical_dataset
+
+    mapping = {
+        genomic_interpretation.subject_or_biosample_id: "ODM.ClinicalData.SubjectData.SubjectKey",
+        genomic_interpretation.example.a_number: "ODM.ClinicalData.SubjectData.ANumber",
+    }
+    sequential_diagnostics, parallel_diagnostics = Diagnostics(), Diagnostics()
+
+    sequential = load_hierarchical_dataset(
+        file=xml_directory, data_model=genomic_interpretation, mapping=mapping, diagnostics=sequential_diagnostics,
+    )
+    parallel = load_hierarchical_dataset(
+        file=xml_directory, data_model=genomic_interpretation, mapping=mapping, diagnostics=parallel_diagnostics,
+        lazy=lazy, workers=2, batch_size=2, max_in_flight=2,
+    )
+
+    instances = list(parallel)  # a lazy dataset is loaded again on every iteration
+    assert parallel.is_lazy == lazy
+    assert parallel.height == sequential.height == 7
+    assert instances == list(sequential)
+    assert all(instance.data_model is genomic_interpretation for instance in instances)
+    assert parallel_diagnostics.counts == sequential_diagnostics.counts
+    assert parallel_diagnostics.total > 0
+
+
+def test_load_hierarchical_dataset_parallel_requires_files(buffer, genomic_interpretation):
+    from phenopacket_mapper.utils.io import load_hierarchical_dataset
+
+    with pytest.raises(ValueError):
+        load_hierarchical_dataset(
+            file=buffer, file_extension="xml", data_model=genomic_interpretation, workers=2,
+            mapping={genomic_interpretation.subject_or_biosample_id: "ODM.ClinicalData.SubjectData.SubjectKey"},
+        )
+
+
+def test_load_hierarchical_dataset_parallel_warnings(xml_directory, genomic_interpretation):
+    import warnings
+    from phenopacket_mapper.utils.io import load_hierarchical_dataset
+
+    mapping = {
+        genomic_interpretation.subject_or_biosample_id: "ODM.ClinicalData.SubjectData.SubjectKey",
+        genomic_interpretation.example.a_number: "ODM.ClinicalData.SubjectData.ANumber",
+    }
+
+    messages = dict()
+    for workers in (None, 2):
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            load_hierarchical_dataset(file=xml_directory, data_model=genomic_interpretation, mapping=mapping,
+                                      workers=workers, batch_size=2)
+        messages[workers] = [str(w.message) for w in caught if issubclass(w.category, UserWarning)]
+
+    assert any("unknown" in message and "subject_or_biosample_id" in message for message in messages[None])
+    assert len(messages[2]) == 1
+    assert "1 x not_in_value_set in subject_or_biosample_id, e.g. ['unknown']" in messages[2][0]
+    assert "1 x invalid_instance" in messages[2][0]
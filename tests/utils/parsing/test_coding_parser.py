@@ -0,0 +1,40 @@
+import pytest
+
+from phenopacket_mapper.data_standards import code_system, Coding
+from phenopacket_mapper.utils.parsing import CodingParser, get_coding_parser, get_codesystem_by_namespace_prefx
+
+
+@pytest.fixture()
+def resources():
+    return [
+        code_system.SNOMED_CT,
+        code_system.ORDO,
+        code_system.ICD10_GM,
+        code_system.HPO,
+    ]
+
+
+@pytest.mark.parametrize("namespace_prefix", ["SNOMED", "sct", "ORPHA", "icd10-gm", "HP", "HPO", "Unknown"])
+def test_get_code_system_same_as_linear_search(resources, namespace_prefix):
+    expected = get_codesystem_by_namespace_prefx(namespace_prefix, resources)
+    assert CodingParser(resources).get_code_system(namespace_prefix) is expected
+
+
+def test_parse(resources):
+    coding_parser = CodingParser(resources)
+    assert coding_parser.parse("HPO: 0000790") == Coding(code="0000790", system=code_system.HPO)
+    with pytest.raises(ValueError):
+        coding_parser.parse("0000790")
+    with pytest.raises(ValueError):
+        coding_parser.parse("OMIM:113900", compliance='strict')
+
+
+def test_get_coding_parser_reuses_parser(resources):
+    coding_parser = get_coding_parser(resources)
+    assert get_coding_parser(resources) is coding_parser
+    assert get_coding_parser(coding_parser) is coding_parser
+
+    resources.append(code_system.OMIM)
+    updated = get_coding_parser(resources)
+    assert updated is not coding_parser
+    assert updated.get_code_system("OMIM") is code_system.OMIM
@@ -0,0 +1,54 @@
+from typing import Any
+
+import pytest
+
+from phenopacket_mapper.data_standards import code_system, Coding, Date, ValueSet
+from phenopacket_mapper.utils.parsing import get_value_parser, parse_value
+
+
+@pytest.fixture
+def resources():
+    return (
+        code_system.SNOMED_CT,
+        code_system.HPO,
+    )
+
+
+@pytest.mark.parametrize("specification, value_str, expected", [
+    (ValueSet(elements=(int,)), "2024", 2024),
+    (ValueSet(elements=(int,)), " 17 ", 17),
+    (ValueSet(elements=(float,)), "3", 3.0),
+    (ValueSet(elements=(str,)), "2024", "2024"),
+    (ValueSet(elements=(str,)), "HP:0000790", "HP:0000790"),
+    (ValueSet(elements=(Date,)), "2024", Date(year=2024)),
+    (ValueSet(elements=(Date,)), "19.06.2024", Date(day=19, month=6, year=2024)),
+    (ValueSet(elements=(code_system.HPO,)), "HP:0000790", Coding(system=code_system.HPO, code="0000790")),
+    (ValueSet(elements=(True, False, "unknown")), "true", True),
+    (ValueSet(elements=(True, False, "unknown")), "unknown", "unknown"),
+    # values outside the value set fall back on parse_value
+    (ValueSet(elements=(int,)), "1.5", 1.5),
+    (ValueSet(elements=(code_system.HPO,)), "2024-01-01", Date(year=2024, month=1, day=1)),
+])
+def test_get_value_parser(resources, specification, value_str, expected):
+    assert get_value_parser(specification, resources)(value_str) == expected
+
+
+@pytest.mark.parametrize("specification", [
+    ValueSet(elements=(Any,)),
+    ValueSet(elements=()),
+    ValueSet(elements=(int, list)),
+])
+@pytest.mark.parametrize("value_str", ["2024", "SNOMED:404684003", "1.5", "hello", "f"])
+def test_get_value_parser_generic(resources, specification, value_str):
+    assert get_value_parser(specification, resources)(value_str) == parse_value(value_str, resources)
+
+
+@pytest.mark.parametrize("specification", [ValueSet(elements=(Date,)), ValueSet(elements=(Date, str))])
+def test_get_value_parser_diagnostics_ambiguous_date(resources, specification, capsys):
+    from phenopacket_mapper.utils.diagnostics import Diagnostics
+
+    diagnostics = Diagnostics()
+    parser = get_value_parser(specification, resources, diagnostics=diagnostics)
+    assert parser("2024.01.02") == "2024.01.02"
+    assert capsys.readouterr().out == ""
+    assert diagnostics.counts == {("ambiguous_date", None): 1}
@@ -1,7 +1,8 @@
+import pandas as pd
 import pytest
 
 from phenopacket_mapper.data_standards import Date
-from phenopacket_mapper.utils.parsing import parse_date
+from phenopacket_mapper.utils.parsing import parse_date, DateFormatCache
 
 
 @pytest.mark.parametrize("date_str, expected", [
@@ -48,3 +49,54 @@ def test_parse_date_(date_str, expected):
 ])
 def test_parse_date_irregularities(date_str, expected):
     assert parse_date(date_str) == expected
+
+
+@pytest.mark.parametrize("date_strs", [
+    ["2024-01-01", "1999-02-27", "2024-9-12", None, "2024-09-12 12:33:44"],
+    ["27/05/1990", "01/02/2024", "1/2/2024"],
+    ["19.06.2024", "2.2002", "2024"],
+    ["2024-08", "2024/09", "11.2024", "12-2024", "01/2024"],
+])
+def test_parse_dates_same_as_parse_date(date_strs):
+    from phenopacket_mapper.utils.parsing import parse_dates
+
+    expected = [parse_date(d) if d is not None else None for d in date_strs]
+    assert parse_dates(pd.Series(date_strs)).tolist() == expected
+
+
+@pytest.mark.parametrize("date_strs, default_first, expected", [
+    (["01/02/2024", "03/31/1934"], "day", [Date(day=2, month=1, year=2024), Date(day=31, month=3, year=1934)]),
+    (["01/02/2024", "03/04/1934"], "day", [Date(day=1, month=2, year=2024), Date(day=3, month=4, year=1934)]),
+    (["01/02/2024", "03/04/1934"], "month", [Date(day=2, month=1, year=2024), Date(day=4, month=3, year=1934)]),
+])
+def test_parse_dates_column_format(date_strs, default_first, expected):
+    from phenopacket_mapper.utils.parsing import parse_dates
+
+    assert parse_dates(pd.Series(date_strs), default_first=default_first).tolist() == expected
+
+
+def test_parse_date_format_cache_same_as_parse_date():
+    date_strs = ["2024-01-01", "1999/02/27", "03/31/1934", "04-13-2013", "27/05/1990", "19.06.2024", "2024-08",
+                 "11.2024", "01/2024", "2024", "2024-09-12 12:33:44", "2024-9-12 12:33:44", "27/5/1990", "1/2024"]
+    cache = DateFormatCache()
+    for date_str in date_strs + date_strs:
+        assert parse_date(date_str, format_cache=cache) == parse_date(date_str)
+    assert cache.hits + cache.misses == 2 * len(date_strs)
+
+
+def test_parse_date_format_cache_statistics(capsys):
+    cache = DateFormatCache()
+    dates = [parse_date(f"{day:02d}/06/2024", format_cache=cache) for day in range(13, 29)]
+    assert dates == [Date(day=day, month=6, year=2024) for day in range(13, 29)]
+    assert cache.format == "%d/%m/%Y"
+    assert (cache.hits, cache.misses) == (15, 1)
+    assert cache.hit_rate == 15 / 16
+
+    parse_date("2024.01.02", format_cache=cache)
+    parse_date("2024.03.04", format_cache=cache)
+    assert cache.ambiguous == 2
+    assert cache.ambiguous_examples == ["2024-01-02", "2024-03-04"]
+    assert capsys.readouterr().out == ""
+
+    cache.reset()
+    assert (cache.format, cache.hits, cache.misses, cache.ambiguous) == (None, 0, 0, 0)
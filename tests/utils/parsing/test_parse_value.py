@@ -18,3 +18,31 @@ def resources():
 ])
 def test_parse_value(value, expected, resources):
     assert parse_value(value, resources) == expected
+
+
+def test_parse_value_cache(resources):
+    from phenopacket_mapper.utils.parsing import parse_value_cache_info, clear_parse_value_cache
+
+    clear_parse_value_cache()
+    first = parse_value("SNOMED:404684003", resources)
+    assert parse_value_cache_info().misses == 1
+    assert parse_value("SNOMED:404684003", resources) is first
+    assert parse_value_cache_info().hits == 1
+
+    # different resources are cached separately
+    assert parse_value("SNOMED:404684003", list(resources)) == first
+    assert parse_value_cache_info().misses == 2
+
+    assert parse_value("SNOMED:404684003", resources, use_cache=False) == first
+    assert parse_value_cache_info().hits == 1
+
+
+@pytest.mark.parametrize("use_cache", [True, False])
+def test_parse_value_diagnostics_ambiguous_date(resources, use_cache, capsys):
+    from phenopacket_mapper.utils.diagnostics import Diagnostics
+
+    diagnostics = Diagnostics()
+    for _ in range(2):  # the second call is answered from the cache
+        parse_value("2024.01.02", resources, use_cache=use_cache, diagnostics=diagnostics)
+    assert capsys.readouterr().out == ""
+    assert diagnostics.counts == {("ambiguous_date", None): 2}
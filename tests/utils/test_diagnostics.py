@@ -0,0 +1,43 @@
+from phenopacket_mapper.utils import Diagnostics
+from phenopacket_mapper.utils.parsing import parse_date, parse_single_data_type
+
+
+def test_diagnostics_aggregates():
+    diagnostics = Diagnostics(max_examples=2)
+    for value in ["a", "b", "c"]:
+        diagnostics.scoped("field_1").report("unparsable_value", value)
+    diagnostics.report("unknown_data_type", "dat")
+
+    assert diagnostics.total == 4
+    assert diagnostics.counts == {("unparsable_value", "field_1"): 3, ("unknown_data_type", None): 1}
+    assert diagnostics.examples[("unparsable_value", "field_1")] == ["a", "b"]
+
+    diagnostics.clear()
+    assert diagnostics.total == 0
+
+
+def test_diagnostics_disabled():
+    diagnostics = Diagnostics(enabled=False)
+    diagnostics.scoped("field_1").report("unparsable_value", "a")
+    assert diagnostics.total == 0
+
+
+def test_parsers_report_instead_of_printing(capsys):
+    diagnostics = Diagnostics()
+    parse_date("2024.01.02", diagnostics=diagnostics)
+    parse_single_data_type("dat", resources=[], diagnostics=diagnostics)
+    assert capsys.readouterr().out == ""
+    assert diagnostics.counts == {("ambiguous_date", None): 1, ("unknown_data_type", None): 1}
+
+
+def test_merge():
+    diagnostics, other = Diagnostics(max_examples=2), Diagnostics()
+    diagnostics.report('unparsable_value', 'a', 'field')
+    for example in 'bcd':
+        other.report('unparsable_value', example, 'field')
+    other.report('unknown_code_system', 'XY')
+
+    diagnostics.merge(other)
+
+    assert diagnostics.counts == {('unparsable_value', 'field'): 4, ('unknown_code_system', None): 1}
+    assert diagnostics.examples[('unparsable_value', 'field')] == ['a', 'b']